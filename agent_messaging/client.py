@@ -135,9 +135,11 @@ class AgentMessaging(Generic[T_OneWay, T_Conversation, T_Meeting]):
         # Initialize repositories
         self._org_repo = OrganizationRepository(self._db_manager)
         self._agent_repo = AgentRepository(self._db_manager)
-        self._message_repo = MessageRepository(self._db_manager)
-        self._session_repo = SessionRepository(self._db_manager)
         self._meeting_repo = MeetingRepository(self._db_manager)
+        self._message_repo = MessageRepository(
+            self._db_manager, on_meeting_message=self._meeting_repo.invalidate_meeting_message
+        )
+        self._session_repo = SessionRepository(self._db_manager)
 
         return self
 
@@ -61,6 +61,21 @@ class DatabaseConfig(BaseModel):
         default_factory=lambda: int(os.getenv("POSTGRES_CONNECT_TIMEOUT_SEC", "10")),
         description="Connection timeout in seconds",
     )
+    conn_recycling_method: str = Field(
+        default_factory=lambda: os.getenv("POSTGRES_CONN_RECYCLING_METHOD", "fast"),
+        description="How pooled connections are recycled: fast, verified or clean",
+    )
+    plan_cache_mode: str = Field(
+        default_factory=lambda: os.getenv("POSTGRES_PLAN_CACHE_MODE", "auto"),
+        description="PostgreSQL plan_cache_mode for pooled connections "
+        "(auto, force_generic_plan or force_custom_plan)",
+    )
+    prepared_statements: bool = Field(
+        default_factory=lambda: os.getenv("POSTGRES_PREPARED_STATEMENTS", "true").lower()
+        == "true",
+        description="Cache prepared statements per connection; disable behind "
+        "transaction-mode poolers such as pgbouncer",
+    )
 
     @property
     def dsn(self) -> str:
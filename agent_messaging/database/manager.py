@@ -1,18 +1,25 @@
 """PostgreSQL database manager using psqlpy."""
 
+import asyncio
 import logging
 import re
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator, Optional
 
-from psqlpy import Connection, ConnectionPool
+from psqlpy import Connection, ConnectionPool, ConnRecyclingMethod, Listener
 
 from ..config import DatabaseConfig
 from ..exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+_RECYCLING_METHODS = {
+    "fast": ConnRecyclingMethod.Fast,
+    "verified": ConnRecyclingMethod.Verified,
+    "clean": ConnRecyclingMethod.Clean,
+}
+
 
 class PostgreSQLManager:
     """Manages PostgreSQL connection pool using psqlpy."""
@@ -29,21 +36,51 @@ class PostgreSQLManager:
     async def initialize(self) -> None:
         """Initialize the connection pool.
 
+        psqlpy opens connections lazily, so ``min_pool_size`` connections are
+        opened up front to keep connection setup off the first requests.
+
         Raises:
             DatabaseError: If pool initialization fails
         """
         try:
             logger.info(f"Initializing PostgreSQL connection pool to {self.config.dsn}")
+            recycling_method = _RECYCLING_METHODS.get(
+                self.config.conn_recycling_method.lower(), ConnRecyclingMethod.Fast
+            )
+            # Session settings applied to every connection at startup
+            options = None
+            if self.config.plan_cache_mode != "auto":
+                options = f"-c plan_cache_mode={self.config.plan_cache_mode}"
             self.pool = ConnectionPool(
                 dsn=self.config.dsn,
                 max_db_pool_size=self.config.max_pool_size,
                 connect_timeout_sec=self.config.connect_timeout_sec,
+                conn_recycling_method=recycling_method,
+                options=options,
             )
+            await self._warm_pool()
             logger.info("PostgreSQL connection pool initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize connection pool: {e}")
             raise DatabaseError(f"Failed to initialize database connection pool: {e}") from e
 
+    async def _warm_pool(self) -> None:
+        """Open ``min_pool_size`` connections concurrently and return them to the pool."""
+        warm_size = min(self.config.min_pool_size, self.config.max_pool_size)
+        if warm_size <= 0:
+            return
+
+        async def warm() -> None:
+            conn = await self.pool.connection()
+            conn.close()
+
+        try:
+            await asyncio.gather(*(warm() for _ in range(warm_size)))
+            logger.info(f"Warmed {warm_size} connection(s) in the pool")
+        except Exception as e:
+            # Connections are still created on demand if warm-up fails
+            logger.warning(f"Failed to warm connection pool: {e}")
+
     async def initialize_schema(self) -> None:
         """Initialize database schema from migrations (idempotent).
 
@@ -106,7 +143,9 @@ class PostgreSQLManager:
         Handles:
         - Multi-line statements
         - Dollar-quoted strings ($$...$$ or $name$...$name$)
-        - Comments (-- and /* */)
+        - Single-quoted string literals
+        - Comments (-- and /* */), which are dropped so a ; inside one does not
+          end a statement
 
         Returns:
             List of SQL statements
@@ -117,9 +156,33 @@ class PostgreSQLManager:
         i = 0
         current_statement = []
         in_dollar_quote = False
+        in_single_quote = False
         dollar_marker = None
 
         while i < len(sql_content):
+            if not in_dollar_quote and not in_single_quote:
+                # Drop comments outside quoted text
+                if sql_content.startswith("--", i):
+                    end = sql_content.find("\n", i)
+                    i = len(sql_content) if end == -1 else end
+                    continue
+                if sql_content.startswith("/*", i):
+                    end = sql_content.find("*/", i + 2)
+                    i = len(sql_content) if end == -1 else end + 2
+                    continue
+
+            # Track single-quoted literals ('' escapes toggle twice)
+            if sql_content[i] == "'" and not in_dollar_quote:
+                in_single_quote = not in_single_quote
+                current_statement.append("'")
+                i += 1
+                continue
+
+            if in_single_quote:
+                current_statement.append(sql_content[i])
+                i += 1
+                continue
+
             # Check for dollar-quoted string markers
             if sql_content[i] == "$":
                 j = i + 1
@@ -144,18 +207,13 @@ class PostgreSQLManager:
                         i = j + 1
                         continue
 
-            # Check for statement terminator (semicolon outside dollar quotes)
+            # Check for statement terminator (semicolon outside quotes)
             if sql_content[i] == ";" and not in_dollar_quote:
                 current_statement.append(";")
                 stmt = "".join(current_statement).strip()
 
-                # Filter out lines that are just comments
-                lines = stmt.split("\n")
-                non_comment_lines = [
-                    line for line in lines if line.strip() and not line.strip().startswith("--")
-                ]
-
-                if non_comment_lines:
+                # Skip empty statements left behind by dropped comments
+                if stmt != ";":
                     statements.append(stmt)
 
                 current_statement = []
@@ -203,6 +261,26 @@ class PostgreSQLManager:
             logger.error(f"Failed to acquire database connection: {e}")
             raise DatabaseError(f"Failed to acquire database connection: {e}") from e
 
+    @property
+    def prepared_statements(self) -> bool:
+        """Whether repositories should run queries as prepared statements."""
+        return self.config.prepared_statements
+
+    def listener(self) -> Listener:
+        """Create a LISTEN/NOTIFY listener on a dedicated pool connection.
+
+        The caller must ``startup()`` the listener and ``shutdown()`` it when done.
+
+        Returns:
+            psqlpy Listener
+
+        Raises:
+            DatabaseError: If pool is not initialized
+        """
+        if not self.pool:
+            raise DatabaseError("Database pool not initialized. Call initialize() first.")
+        return self.pool.listener()
+
     def get_pool_status(self) -> dict:
         """Get current pool status.
 
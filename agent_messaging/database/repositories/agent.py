@@ -7,6 +7,11 @@ from .base import BaseRepository
 from ...models import Agent
 
 
+def _row_to_agent(row: dict) -> Agent:
+    """Build an Agent from a database row."""
+    return Agent(**row)
+
+
 class AgentRepository(BaseRepository):
     """Repository for agent-related database operations."""
 
@@ -27,10 +32,7 @@ class AgentRepository(BaseRepository):
             RETURNING id
         """
         result = await self._fetch_one(query, [external_id, organization_id, name])
-        agent_id = result["id"]
-        if isinstance(agent_id, str):
-            agent_id = UUID(agent_id)
-        return agent_id
+        return result["id"]
 
     async def get_by_external_id(self, external_id: str) -> Optional[Agent]:
         """Get agent by external ID.
@@ -81,8 +83,7 @@ class AgentRepository(BaseRepository):
             WHERE organization_id = $1
             ORDER BY created_at
         """
-        results = await self._fetch_all(query, [organization_id])
-        return [Agent(**result) for result in results]
+        return await self._fetch_all(query, [organization_id], row_factory=_row_to_agent)
 
     async def delete(self, external_id: str) -> bool:
         """Delete agent by external ID.
@@ -1,18 +1,43 @@
 """Base repository class for database operations."""
 
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     from ..manager import PostgreSQLManager
 
 from ...exceptions import DatabaseError
 
+__all__ = ["BaseRepository"]
+
+T = TypeVar("T")
+
 logger = logging.getLogger(__name__)
 
+# Shared parameter sequence for queries without parameters
+_EMPTY_PARAMS: tuple = ()
+
 
 class BaseRepository:
-    """Base class for all repository implementations."""
+    """Base class for all repository implementations.
+
+    Queries run as prepared statements cached per pooled connection, so each
+    distinct SQL string is parsed and planned once per connection and later
+    calls only send Bind/Execute. Set ``DatabaseConfig.prepared_statements``
+    to False behind a transaction-mode pooler, where a statement prepared on
+    one server connection is not visible on the next.
+    """
 
     def __init__(self, db_manager: "PostgreSQLManager"):
         """Initialize repository with database manager.
@@ -21,8 +46,9 @@ class BaseRepository:
             db_manager: PostgreSQLManager instance
         """
         self.db_manager = db_manager
+        self._prepared = bool(db_manager.prepared_statements)
 
-    async def _execute(self, query: str, params: Optional[List[Any]] = None) -> Any:
+    async def _execute(self, query: str, params: Optional[Sequence[Any]] = None) -> Any:
         """Execute a query and return the result.
 
         Args:
@@ -37,14 +63,16 @@ class BaseRepository:
         """
         async with self.db_manager.connection() as conn:
             try:
-                result = await conn.execute(query, params or [])
+                result = await conn.execute(
+                    query, _EMPTY_PARAMS if params is None else params, prepared=self._prepared
+                )
                 return result
             except Exception as e:
                 logger.error(f"Query execution failed: {query} with params {params}")
                 raise DatabaseError(f"Database query failed: {e}") from e
 
     async def _fetch_one(
-        self, query: str, params: Optional[List[Any]] = None
+        self, query: str, params: Optional[Sequence[Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """Execute a query and return a single row.
 
@@ -60,7 +88,9 @@ class BaseRepository:
         """
         async with self.db_manager.connection() as conn:
             try:
-                result = await conn.execute(query, params or [])
+                result = await conn.execute(
+                    query, _EMPTY_PARAMS if params is None else params, prepared=self._prepared
+                )
                 rows = result.result()
                 return rows[0] if rows else None
             except Exception as e:
@@ -68,29 +98,102 @@ class BaseRepository:
                 raise DatabaseError(f"Database query failed: {e}") from e
 
     async def _fetch_all(
-        self, query: str, params: Optional[List[Any]] = None
-    ) -> List[Dict[str, Any]]:
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        row_factory: Optional[Callable[[Dict[str, Any]], T]] = None,
+    ) -> List[Any]:
         """Execute a query and return all rows.
 
         Args:
             query: SQL query string
             params: Query parameters
+            row_factory: Optional callable applied to each row while decoding
 
         Returns:
-            List of rows as dicts
+            List of rows as dicts, or as row_factory results if given
 
         Raises:
             DatabaseError: If query execution fails
         """
         async with self.db_manager.connection() as conn:
             try:
-                result = await conn.execute(query, params or [])
-                return result.result()
+                result = await conn.execute(
+                    query, _EMPTY_PARAMS if params is None else params, prepared=self._prepared
+                )
+                if row_factory is None:
+                    return result.result()
+                return result.row_factory(row_factory)
             except Exception as e:
                 logger.error(f"Query fetch_all failed: {query} with params {params}")
                 raise DatabaseError(f"Database query failed: {e}") from e
 
-    async def _fetch_val(self, query: str, params: Optional[List[Any]] = None) -> Any:
+    async def _fetch_tuples(
+        self, query: str, params: Optional[Sequence[Any]] = None
+    ) -> List[Tuple[Any, ...]]:
+        """Execute a query and return all rows as tuples in SELECT column order.
+
+        The driver builds each row as a tuple, skipping the per-row dict and
+        its column-name keys, for callers that unpack rows positionally.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+
+        Returns:
+            List of rows as tuples
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        async with self.db_manager.connection() as conn:
+            try:
+                result = await conn.execute(
+                    query, _EMPTY_PARAMS if params is None else params, prepared=self._prepared
+                )
+                return result.result(as_tuple=True)
+            except Exception as e:
+                logger.error(f"Query fetch_tuples failed: {query} with params {params}")
+                raise DatabaseError(f"Database query failed: {e}") from e
+
+    async def _iter_rows(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        fetch_number: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream rows from a server-side cursor.
+
+        Rows are fetched in batches of ``fetch_number`` inside a transaction,
+        so at most one batch is held in memory at a time.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            fetch_number: Rows fetched per round trip
+
+        Yields:
+            Rows as dicts
+
+        Raises:
+            DatabaseError: If query execution fails
+        """
+        async with self.db_manager.connection() as conn:
+            try:
+                async with conn.transaction() as transaction:
+                    async with transaction.cursor(
+                        query,
+                        _EMPTY_PARAMS if params is None else params,
+                        fetch_number=fetch_number,
+                    ) as cursor:
+                        async for batch in cursor:
+                            for row in batch.result():
+                                yield row
+            except Exception as e:
+                logger.error(f"Query cursor failed: {query} with params {params}")
+                raise DatabaseError(f"Database query failed: {e}") from e
+
+    async def _fetch_val(self, query: str, params: Optional[Sequence[Any]] = None) -> Any:
         """Execute a query and return a single value.
 
         Args:
@@ -105,7 +208,9 @@ class BaseRepository:
         """
         async with self.db_manager.connection() as conn:
             try:
-                result = await conn.execute(query, params or [])
+                result = await conn.execute(
+                    query, _EMPTY_PARAMS if params is None else params, prepared=self._prepared
+                )
                 rows = result.result()
                 if rows and len(rows) > 0:
                     # Get first value of first row
@@ -116,3 +221,29 @@ class BaseRepository:
             except Exception as e:
                 logger.error(f"Query fetch_val failed: {query} with params {params}")
                 raise DatabaseError(f"Database query failed: {e}") from e
+
+    async def _pipeline(self, queries: Sequence[Tuple[str, Sequence[Any]]]) -> List[Any]:
+        """Execute several statements in one transaction, pipelined on one connection.
+
+        All statements are sent before any reply is read, so the batch costs
+        roughly one round trip, and either all of them commit or none do.
+
+        Args:
+            queries: (query, params) pairs, executed in order
+
+        Returns:
+            List of QueryResult from psqlpy, one per statement
+
+        Raises:
+            DatabaseError: If any statement fails
+        """
+        async with self.db_manager.connection() as conn:
+            try:
+                async with conn.transaction() as transaction:
+                    return await transaction.pipeline(
+                        [(query, list(params)) for query, params in queries],
+                        prepared=self._prepared,
+                    )
+            except Exception as e:
+                logger.error(f"Query pipeline failed: {[query for query, _ in queries]}")
+                raise DatabaseError(f"Database query failed: {e}") from e
@@ -1,15 +1,153 @@
 """Meeting repository for database operations."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from ..manager import PostgreSQLManager
+
 from .base import BaseRepository
 from ...models import Meeting, MeetingStatus, MeetingParticipant, ParticipantStatus
+from ..cache import TTLCache
+
+# Participant status and lock flag are packed into one smallint "state" column:
+# bits 0-2 hold the index into _PARTICIPANT_STATUSES, bit 3 is is_locked.
+# A status text with no code yields a NULL state, which the row converter
+# rejects instead of reading it as a valid status.
+_PARTICIPANT_STATUSES = (
+    ParticipantStatus.INVITED,
+    ParticipantStatus.ATTENDING,
+    ParticipantStatus.WAITING,
+    ParticipantStatus.SPEAKING,
+    ParticipantStatus.LEFT,
+)
+_PARTICIPANT_LOCKED_BIT = 8
+
+_PARTICIPANT_COLUMNS = """id, meeting_id, agent_id,
+                   (CASE status
+                        WHEN 'invited' THEN 0
+                        WHEN 'attending' THEN 1
+                        WHEN 'waiting' THEN 2
+                        WHEN 'speaking' THEN 3
+                        WHEN 'left' THEN 4
+                    END + CASE WHEN is_locked THEN 8 ELSE 0 END)::smallint AS state,
+                   join_order, joined_at, left_at"""
+
+_SQL_CREATE_MEETING = """
+            INSERT INTO meetings (host_id, status, turn_duration)
+            VALUES ($1, $2, $3)
+            RETURNING id
+        """
+
+_SQL_GET_MEETING_BY_ID = """
+            SELECT id, host_id, status, current_speaker_id, turn_duration,
+                   turn_started_at, created_at, started_at, ended_at
+            FROM meetings
+            WHERE id = $1
+        """
+
+_SQL_ADD_PARTICIPANT = """
+            INSERT INTO meeting_participants (meeting_id, agent_id, status, join_order)
+            VALUES ($1, $2, $3, $4)
+            RETURNING id
+        """
+
+_SQL_ADD_PARTICIPANTS_BULK = """
+            INSERT INTO meeting_participants (meeting_id, agent_id, status, join_order)
+            SELECT $1, t.agent_id, $2, t.join_order
+            FROM UNNEST($3::uuid[], $4::int[]) AS t(agent_id, join_order)
+            RETURNING id, join_order
+        """
+
+_SQL_GET_PARTICIPANTS = f"""
+            SELECT {_PARTICIPANT_COLUMNS}
+            FROM meeting_participants
+            WHERE meeting_id = $1
+            ORDER BY join_order
+        """
+
+_SQL_GET_PARTICIPANT = f"""
+            SELECT {_PARTICIPANT_COLUMNS}
+            FROM meeting_participants
+            WHERE meeting_id = $1 AND agent_id = $2
+        """
+
+_SQL_GET_PARTICIPANT_MAP = f"""
+            SELECT {_PARTICIPANT_COLUMNS}
+            FROM meeting_participants
+            WHERE meeting_id = $1 AND agent_id = ANY($2::uuid[])
+        """
+
+_SQL_GET_PARTICIPANT_HISTORY = """
+            SELECT
+                mp.id,
+                mp.agent_id,
+                a.external_id as agent_name,
+                mp.status,
+                mp.join_order,
+                mp.is_locked,
+                mp.joined_at,
+                mp.left_at
+            FROM meeting_participants mp
+            LEFT JOIN agents a ON mp.agent_id = a.id
+            WHERE mp.meeting_id = $1
+            ORDER BY mp.join_order ASC
+        """
+
+_SQL_SET_CURRENT_SPEAKER = """
+            UPDATE meetings
+            SET current_speaker_id = $1,
+                turn_started_at = CASE WHEN $2::boolean
+                    THEN CURRENT_TIMESTAMP ELSE turn_started_at END
+            WHERE id = $3
+        """
+
+_SQL_UPDATE_PARTICIPANT_STATUS = """
+            UPDATE meeting_participants
+            SET status = $1
+            WHERE id = $2
+            RETURNING meeting_id
+        """
+
+# Status updates keyed by the lifecycle timestamp column they also stamp
+_SQL_SET_STATUS = {
+    None: """
+            UPDATE meetings
+            SET status = $1
+            WHERE id = $2
+        """,
+    "started_at": """
+            UPDATE meetings
+            SET status = $1, started_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+        """,
+    "ended_at": """
+            UPDATE meetings
+            SET status = $1, ended_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+        """,
+}
 
 
 class MeetingRepository(BaseRepository):
     """Repository for meeting-related database operations."""
 
+    def __init__(self, db_manager: "PostgreSQLManager", cache_ttl: Optional[float] = None):
+        """Initialize repository with database manager.
+
+        Args:
+            db_manager: PostgreSQLManager instance
+            cache_ttl: Seconds that get_meeting_details/get_meeting_statistics
+                results are served from memory. Off by default (None or 0).
+                Only writes through this repository, and message writes
+                reported via invalidate_meeting_message, evict entries, so
+                writes from other processes stay invisible until expiry.
+        """
+        super().__init__(db_manager)
+        self._details_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._statistics_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+
     async def create(
         self,
         host_id: UUID,
@@ -24,20 +162,13 @@ class MeetingRepository(BaseRepository):
         Returns:
             UUID of the created meeting
         """
-        query = """
-            INSERT INTO meetings (host_id, status, turn_duration)
-            VALUES ($1, $2, $3)
-            RETURNING id
-        """
         interval_str = f"{turn_duration} seconds" if turn_duration else None
         result = await self._fetch_one(
-            query,
-            [host_id, MeetingStatus.CREATED.value, interval_str],
+            _SQL_CREATE_MEETING,
+            (host_id, MeetingStatus.CREATED.value, interval_str),
         )
-        meeting_id = result["id"]
-        if isinstance(meeting_id, str):
-            meeting_id = UUID(meeting_id)
-        return meeting_id
+        self._statistics_cache.pop(host_id)
+        return result["id"]
 
     async def get_by_id(self, meeting_id: UUID) -> Optional[Meeting]:
         """Get meeting by ID.
@@ -48,13 +179,7 @@ class MeetingRepository(BaseRepository):
         Returns:
             Meeting if found, None otherwise
         """
-        query = """
-            SELECT id, host_id, status, current_speaker_id, turn_duration,
-                   turn_started_at, created_at, started_at, ended_at
-            FROM meetings
-            WHERE id = $1
-        """
-        result = await self._fetch_one(query, [meeting_id])
+        result = await self._fetch_one(_SQL_GET_MEETING_BY_ID, (meeting_id,))
         return self._meeting_from_db(result) if result else None
 
     async def update_status(self, meeting_id: UUID, status: MeetingStatus) -> None:
@@ -64,12 +189,7 @@ class MeetingRepository(BaseRepository):
             meeting_id: Meeting UUID
             status: New status
         """
-        query = """
-            UPDATE meetings
-            SET status = $1
-            WHERE id = $2
-        """
-        await self._execute(query, [status.value, meeting_id])
+        await self._set_status_with_ts(meeting_id, status, None)
 
     async def start_meeting(self, meeting_id: UUID) -> None:
         """Mark meeting as started.
@@ -77,12 +197,7 @@ class MeetingRepository(BaseRepository):
         Args:
             meeting_id: Meeting UUID
         """
-        query = """
-            UPDATE meetings
-            SET status = $1, started_at = CURRENT_TIMESTAMP
-            WHERE id = $2
-        """
-        await self._execute(query, [MeetingStatus.ACTIVE.value, meeting_id])
+        await self._set_status_with_ts(meeting_id, MeetingStatus.ACTIVE, "started_at")
 
     async def end_meeting(self, meeting_id: UUID) -> None:
         """End a meeting.
@@ -90,12 +205,26 @@ class MeetingRepository(BaseRepository):
         Args:
             meeting_id: Meeting UUID
         """
-        query = """
-            UPDATE meetings
-            SET status = $1, ended_at = CURRENT_TIMESTAMP
-            WHERE id = $2
+        await self._set_status_with_ts(meeting_id, MeetingStatus.ENDED, "ended_at")
+
+    async def _set_status_with_ts(
+        self,
+        meeting_id: UUID,
+        status: MeetingStatus,
+        ts_column: Optional[str],
+    ) -> None:
+        """Set meeting status, optionally stamping a lifecycle timestamp.
+
+        Args:
+            meeting_id: Meeting UUID
+            status: New status
+            ts_column: "started_at", "ended_at" or None for no timestamp
         """
-        await self._execute(query, [MeetingStatus.ENDED.value, meeting_id])
+        await self._execute(_SQL_SET_STATUS[ts_column], (status.value, meeting_id))
+        self._details_cache.pop(meeting_id)
+        # Status and durations feed the statistics of the host and every
+        # participant, which are not known here
+        self._statistics_cache.clear()
 
     async def set_current_speaker(
         self,
@@ -110,16 +239,11 @@ class MeetingRepository(BaseRepository):
             agent_id: Agent UUID (None to clear)
             turn_started: Whether to reset turn_started_at
         """
-        query = """
-            UPDATE meetings
-            SET current_speaker_id = $1,
-                turn_started_at = CASE WHEN $2::boolean THEN CURRENT_TIMESTAMP ELSE turn_started_at END
-            WHERE id = $3
-        """
         await self._execute(
-            query,
-            [agent_id if agent_id else None, turn_started, meeting_id],
+            _SQL_SET_CURRENT_SPEAKER,
+            (agent_id, turn_started, meeting_id),
         )
+        self._details_cache.pop(meeting_id)
 
     async def add_participant(
         self,
@@ -137,19 +261,49 @@ class MeetingRepository(BaseRepository):
         Returns:
             UUID of the created participant record
         """
-        query = """
-            INSERT INTO meeting_participants (meeting_id, agent_id, status, join_order)
-            VALUES ($1, $2, $3, $4)
-            RETURNING id
-        """
         result = await self._fetch_one(
-            query,
-            [meeting_id, agent_id, ParticipantStatus.INVITED.value, join_order],
+            _SQL_ADD_PARTICIPANT,
+            (meeting_id, agent_id, ParticipantStatus.INVITED.value, join_order),
+        )
+        self._details_cache.pop(meeting_id)
+        self._statistics_cache.pop(agent_id)
+        return result["id"]
+
+    async def add_participants_bulk(
+        self,
+        meeting_id: UUID,
+        agent_ids: List[UUID],
+    ) -> List[UUID]:
+        """Add several participants to a meeting in one statement.
+
+        Join order follows the position of each agent in agent_ids.
+
+        Args:
+            meeting_id: Meeting UUID
+            agent_ids: Agent UUIDs in join order
+
+        Returns:
+            UUIDs of the created participant records, in the same order as agent_ids
+        """
+        if not agent_ids:
+            return []
+
+        rows = await self._fetch_all(
+            _SQL_ADD_PARTICIPANTS_BULK,
+            (
+                meeting_id,
+                ParticipantStatus.INVITED.value,
+                list(agent_ids),
+                list(range(len(agent_ids))),
+            ),
         )
-        participant_id = result["id"]
-        if isinstance(participant_id, str):
-            participant_id = UUID(participant_id)
-        return participant_id
+        self._details_cache.pop(meeting_id)
+        for agent_id in agent_ids:
+            self._statistics_cache.pop(agent_id)
+        participant_ids: List[UUID] = [None] * len(agent_ids)  # type: ignore[list-item]
+        for row in rows:
+            participant_ids[row["join_order"]] = row["id"]
+        return participant_ids
 
     async def update_participant_status(
         self,
@@ -162,12 +316,49 @@ class MeetingRepository(BaseRepository):
             participant_id: Participant UUID
             status: New status
         """
-        query = """
-            UPDATE meeting_participants
-            SET status = $1
-            WHERE id = $2
+        result = await self._fetch_one(
+            _SQL_UPDATE_PARTICIPANT_STATUS, (status.value, participant_id)
+        )
+        if result:
+            self._details_cache.pop(result["meeting_id"])
+
+    async def advance_turn(
+        self,
+        meeting_id: UUID,
+        participant_id: UUID,
+        participant_status: ParticipantStatus,
+        next_agent_id: Optional[UUID],
+    ) -> None:
+        """Update a participant's status and hand the turn to the next speaker.
+
+        Both updates run in one transaction and are pipelined on a single
+        connection, so the pair costs one round trip instead of two.
+
+        Args:
+            meeting_id: Meeting UUID
+            participant_id: Participant record whose status changes
+            participant_status: New status for that participant
+            next_agent_id: Agent UUID of the next speaker (None to clear)
+        """
+        await self._pipeline(
+            [
+                (_SQL_UPDATE_PARTICIPANT_STATUS, (participant_status.value, participant_id)),
+                (_SQL_SET_CURRENT_SPEAKER, (next_agent_id, True, meeting_id)),
+            ]
+        )
+        self._details_cache.pop(meeting_id)
+
+    def invalidate_meeting_message(self, meeting_id: UUID, sender_id: UUID) -> None:
+        """Evict cached results that count a newly written meeting message.
+
+        Passed to MessageRepository as its on_meeting_message hook.
+
+        Args:
+            meeting_id: Meeting the message was posted to
+            sender_id: Agent that sent the message
         """
-        await self._execute(query, [status.value, participant_id])
+        self._details_cache.pop(meeting_id)
+        self._statistics_cache.pop(sender_id)
 
     async def get_participants(self, meeting_id: UUID) -> List[MeetingParticipant]:
         """Get all participants for a meeting.
@@ -178,15 +369,11 @@ class MeetingRepository(BaseRepository):
         Returns:
             List of participants
         """
-        query = """
-            SELECT id, meeting_id, agent_id, status, join_order, is_locked,
-                   joined_at, left_at
-            FROM meeting_participants
-            WHERE meeting_id = $1
-            ORDER BY join_order
-        """
-        results = await self._fetch_all(query, [meeting_id])
-        return [self._participant_from_db(result) for result in results]
+        return await self._fetch_all(
+            _SQL_GET_PARTICIPANTS,
+            (meeting_id,),
+            row_factory=self._participant_from_db,
+        )
 
     async def get_participant(
         self,
@@ -202,15 +389,34 @@ class MeetingRepository(BaseRepository):
         Returns:
             Participant if found, None otherwise
         """
-        query = """
-            SELECT id, meeting_id, agent_id, status, join_order, is_locked,
-                   joined_at, left_at
-            FROM meeting_participants
-            WHERE meeting_id = $1 AND agent_id = $2
-        """
-        result = await self._fetch_one(query, [meeting_id, agent_id])
+        result = await self._fetch_one(_SQL_GET_PARTICIPANT, (meeting_id, agent_id))
         return self._participant_from_db(result) if result else None
 
+    async def get_participant_map(
+        self,
+        meeting_id: UUID,
+        agent_ids: List[UUID],
+    ) -> Dict[UUID, MeetingParticipant]:
+        """Get several participants of a meeting in a single query.
+
+        Args:
+            meeting_id: Meeting UUID
+            agent_ids: Agent UUIDs to look up
+
+        Returns:
+            Dict mapping agent ID to participant; agents that are not
+            participants are omitted
+        """
+        if not agent_ids:
+            return {}
+
+        participants = await self._fetch_all(
+            _SQL_GET_PARTICIPANT_MAP,
+            (meeting_id, list(agent_ids)),
+            row_factory=self._participant_from_db,
+        )
+        return {p.agent_id: p for p in participants}
+
     async def get_meeting_details(
         self,
         meeting_id: UUID,
@@ -223,6 +429,10 @@ class MeetingRepository(BaseRepository):
         Returns:
             Dictionary with meeting details including participants or None if not found
         """
+        cached = self._details_cache.get(meeting_id)
+        if cached is not None:
+            return dict(cached)
+
         query = """
             SELECT 
                 m.id,
@@ -237,7 +447,7 @@ class MeetingRepository(BaseRepository):
                 m.started_at,
                 m.ended_at,
                 COUNT(mp.id) as participant_count,
-                SUM(CASE WHEN mp.status = 'attending' THEN 1 ELSE 0 END) as attending_count,
+                COUNT(*) FILTER (WHERE mp.status = 'attending') as attending_count,
                 COUNT(m_msg.id) as message_count
             FROM meetings m
             LEFT JOIN agents h ON m.host_id = h.id
@@ -247,8 +457,10 @@ class MeetingRepository(BaseRepository):
             WHERE m.id = $1
             GROUP BY m.id, h.id, cs.id
         """
-        result = await self._fetch_one(query, [meeting_id])
-        return result if result else None
+        result = await self._fetch_one(query, (meeting_id,))
+        if result:
+            self._details_cache.set(meeting_id, dict(result))
+        return result
 
     async def get_participant_history(
         self,
@@ -260,25 +472,32 @@ class MeetingRepository(BaseRepository):
             meeting_id: Meeting UUID
 
         Returns:
-            List of participants with agent names and timing information
+            List of participants with agent names and timing information, as
+            the driver's row dicts (no model conversion)
         """
-        query = """
-            SELECT 
-                mp.id,
-                mp.agent_id,
-                a.external_id as agent_name,
-                mp.status,
-                mp.join_order,
-                mp.is_locked,
-                mp.joined_at,
-                mp.left_at
-            FROM meeting_participants mp
-            LEFT JOIN agents a ON mp.agent_id = a.id
-            WHERE mp.meeting_id = $1
-            ORDER BY mp.join_order ASC
+        return await self._fetch_all(_SQL_GET_PARTICIPANT_HISTORY, (meeting_id,))
+
+    async def iter_participant_history(
+        self,
+        meeting_id: UUID,
+        fetch_number: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream participant history for a meeting through a server-side cursor.
+
+        Yields the same rows as get_participant_history without materializing
+        the full list, for meetings with very large participant sets.
+
+        Args:
+            meeting_id: Meeting UUID
+            fetch_number: Rows fetched per round trip
+
+        Yields:
+            Participant rows with agent names and timing information
         """
-        results = await self._fetch_all(query, [meeting_id])
-        return results if results else []
+        async for row in self._iter_rows(
+            _SQL_GET_PARTICIPANT_HISTORY, (meeting_id,), fetch_number=fetch_number
+        ):
+            yield row
 
     async def get_meeting_statistics(
         self,
@@ -292,35 +511,61 @@ class MeetingRepository(BaseRepository):
         Returns:
             Dictionary with statistics (hosted_count, participated_count, total_speakers, etc.)
         """
-        query = """
-            SELECT 
-                COUNT(DISTINCT CASE WHEN m.host_id = $1 THEN m.id END) as hosted_meetings,
-                COUNT(DISTINCT CASE WHEN mp.agent_id = $1 THEN m.id END) as participated_meetings,
-                COUNT(DISTINCT CASE WHEN m.host_id = $1 AND m.status = 'active' THEN m.id END) as active_hosted,
-                SUM(CASE WHEN m_msg.sender_id = $1 THEN 1 ELSE 0 END) as total_messages_sent,
-                COUNT(DISTINCT CASE WHEN m_msg.sender_id = $1 THEN m_msg.meeting_id END) as meetings_spoke_in,
-                AVG(CASE WHEN m.started_at IS NOT NULL AND m.ended_at IS NOT NULL 
-                    THEN EXTRACT(EPOCH FROM (m.ended_at - m.started_at)) 
-                    ELSE NULL END) as avg_meeting_duration_seconds
-            FROM meetings m
-            LEFT JOIN meeting_participants mp ON m.id = mp.meeting_id
-            LEFT JOIN messages m_msg ON m.id = m_msg.meeting_id
-            WHERE m.host_id = $1 OR mp.agent_id = $1
-        """
-        result = await self._fetch_one(query, [agent_id])
-        return (
-            result
-            if result
-            else {
-                "hosted_meetings": 0,
-                "participated_meetings": 0,
-                "active_hosted": 0,
-                "total_messages_sent": 0,
-                "meetings_spoke_in": 0,
-                "avg_meeting_duration_seconds": None,
-            }
+        cached = self._statistics_cache.get(agent_id)
+        if cached is not None:
+            return dict(cached)
+
+        # Hosted and participated sides are aggregated separately so each
+        # query is a plain index scan instead of an OR across a join
+        hosted_query = """
+            SELECT
+                COUNT(*) AS hosted_meetings,
+                COUNT(*) FILTER (WHERE status = 'active') AS active_hosted,
+                SUM(EXTRACT(EPOCH FROM (ended_at - started_at)))::float8 AS duration_sum,
+                COUNT(ended_at - started_at) AS duration_count
+            FROM meetings
+            WHERE host_id = $1
+        """
+        participated_query = """
+            WITH sent AS (
+                SELECT
+                    COUNT(*) AS total_messages_sent,
+                    COUNT(DISTINCT meeting_id) AS meetings_spoke_in
+                FROM messages
+                WHERE sender_id = $1 AND meeting_id IS NOT NULL
+            )
+            SELECT
+                COUNT(m.id) AS participated_meetings,
+                SUM(EXTRACT(EPOCH FROM (m.ended_at - m.started_at)))
+                    FILTER (WHERE m.host_id <> $1)::float8 AS duration_sum,
+                COUNT(m.ended_at - m.started_at) FILTER (WHERE m.host_id <> $1) AS duration_count,
+                sent.total_messages_sent,
+                sent.meetings_spoke_in
+            FROM sent
+            LEFT JOIN meeting_participants mp ON mp.agent_id = $1
+            LEFT JOIN meetings m ON m.id = mp.meeting_id
+            GROUP BY sent.total_messages_sent, sent.meetings_spoke_in
+        """
+        hosted, participated = await asyncio.gather(
+            self._fetch_one(hosted_query, (agent_id,)),
+            self._fetch_one(participated_query, (agent_id,)),
         )
 
+        duration_sum = (hosted["duration_sum"] or 0.0) + (participated["duration_sum"] or 0.0)
+        duration_count = hosted["duration_count"] + participated["duration_count"]
+        statistics = {
+            "hosted_meetings": hosted["hosted_meetings"],
+            "participated_meetings": participated["participated_meetings"],
+            "active_hosted": hosted["active_hosted"],
+            "total_messages_sent": participated["total_messages_sent"],
+            "meetings_spoke_in": participated["meetings_spoke_in"],
+            "avg_meeting_duration_seconds": (
+                duration_sum / duration_count if duration_count else None
+            ),
+        }
+        self._statistics_cache.set(agent_id, dict(statistics))
+        return statistics
+
     async def get_participation_analysis(
         self,
         meeting_id: UUID,
@@ -343,18 +588,90 @@ class MeetingRepository(BaseRepository):
                 - most_active: Agent ID of most active participant (by message count)
                 - least_active: Agent ID of least active participant (among active)
                 - total_messages: Total message count in meeting
-        """
-        # Get all participants
-        participants_query = """
-            SELECT mp.agent_id, a.external_id, mp.joined_at, mp.left_at, mp.status
-            FROM meeting_participants mp
-            JOIN agents a ON mp.agent_id = a.id
-            WHERE mp.meeting_id = $1
-            ORDER BY mp.join_order
-        """
-        participants_result = await self._fetch_all(participants_query, [meeting_id])
 
-        if not participants_result:
+            Timestamps are returned as datetime objects; serialization is
+            left to the caller.
+        """
+        query = """
+            WITH msg_stats AS (
+                SELECT
+                    sender_id,
+                    COUNT(*) AS message_count,
+                    MIN(created_at) AS first_message_at,
+                    MAX(created_at) AS last_message_at,
+                    SUM(content_length) AS total_content_length
+                FROM messages
+                WHERE meeting_id = $1 AND message_type = 'user_defined'
+                GROUP BY sender_id
+            ),
+            pstats AS (
+                SELECT
+                    mp.join_order,
+                    a.external_id,
+                    mp.status,
+                    ms.message_count,
+                    ms.first_message_at,
+                    ms.last_message_at,
+                    ms.total_content_length
+                FROM meeting_participants mp
+                JOIN agents a ON a.id = mp.agent_id
+                LEFT JOIN msg_stats ms ON ms.sender_id = mp.agent_id
+                WHERE mp.meeting_id = $1
+            ),
+            totals AS (
+                SELECT
+                    COUNT(*) AS total_participants,
+                    COUNT(*) FILTER (WHERE message_count > 0) AS active_participants,
+                    COALESCE(SUM(message_count), 0)::bigint AS total_messages
+                FROM pstats
+            ),
+            most AS (
+                SELECT external_id, join_order
+                FROM pstats
+                WHERE message_count > 0
+                ORDER BY message_count DESC, join_order
+                LIMIT 1
+            ),
+            least AS (
+                SELECT external_id, join_order
+                FROM pstats
+                WHERE message_count > 0
+                ORDER BY message_count ASC, join_order
+                LIMIT 1
+            ),
+            mtg AS (
+                SELECT started_at, ended_at
+                FROM meetings
+                WHERE id = $1
+            )
+            SELECT
+                p.external_id,
+                p.status,
+                p.message_count,
+                p.first_message_at,
+                p.last_message_at,
+                p.total_content_length,
+                ROUND(
+                    100.0 * p.message_count / NULLIF(SUM(p.message_count) OVER (), 0), 2
+                )::float8 AS speaking_time_pct,
+                t.total_participants,
+                t.active_participants,
+                t.total_messages,
+                most.external_id AS most_active,
+                CASE WHEN least.join_order <> most.join_order
+                     THEN least.external_id END AS least_active,
+                mtg.started_at,
+                mtg.ended_at
+            FROM pstats p
+            CROSS JOIN totals t
+            LEFT JOIN most ON TRUE
+            LEFT JOIN least ON TRUE
+            LEFT JOIN mtg ON TRUE
+            ORDER BY p.join_order
+        """
+        rows = await self._fetch_all(query, (meeting_id,))
+
+        if not rows:
             return {
                 "total_participants": 0,
                 "active_participants": 0,
@@ -366,95 +683,37 @@ class MeetingRepository(BaseRepository):
                 "total_messages": 0,
             }
 
-        # Get message statistics per participant
-        message_stats_query = """
-            SELECT 
-                m.sender_id,
-                COUNT(*) as message_count,
-                MIN(m.created_at) as first_message_at,
-                MAX(m.created_at) as last_message_at,
-                SUM(LENGTH(m.content::text)) as total_content_length
-            FROM messages m
-            WHERE m.meeting_id = $1 AND m.message_type = 'user_defined'
-            GROUP BY m.sender_id
-        """
-        message_stats = await self._fetch_all(message_stats_query, [meeting_id])
-        message_stats_by_agent = {row["sender_id"]: row for row in message_stats}
-
-        # Get meeting duration
-        meeting_query = """
-            SELECT started_at, ended_at
-            FROM meetings
-            WHERE id = $1
-        """
-        meeting_result = await self._fetch_one(meeting_query, [meeting_id])
-
-        meeting_duration = None
-        if meeting_result and meeting_result["started_at"] and meeting_result["ended_at"]:
-            meeting_duration = (
-                meeting_result["ended_at"] - meeting_result["started_at"]
-            ).total_seconds()
+        # Meeting-wide values are repeated on every row
+        summary = rows[0]
+        total_participants = summary["total_participants"]
+        active_count = summary["active_participants"]
+        total_messages = summary["total_messages"]
+        most_active_id = summary["most_active"]
+        least_active_id = summary["least_active"]
+        started_at = summary["started_at"]
+        ended_at = summary["ended_at"]
+        meeting_duration = (
+            (ended_at - started_at).total_seconds() if started_at and ended_at else None
+        )
 
-        # Build participation analysis
-        by_participant = {}
-        active_count = 0
-        total_messages = 0
-        max_messages = 0
-        min_messages = float("inf")
-        most_active_id = None
-        least_active_id = None
-
-        for participant in participants_result:
-            agent_id = participant["agent_id"]
-            external_id = participant["external_id"]
-            stats = message_stats_by_agent.get(agent_id)
-
-            if stats:
-                message_count = stats["message_count"]
-                total_messages += message_count
-                active_count += 1
-
-                # Track most/least active
-                if message_count > max_messages:
-                    max_messages = message_count
-                    most_active_id = external_id
-                if message_count < min_messages:
-                    min_messages = message_count
-                    least_active_id = external_id
-
-                # Calculate speaking time percentage (rough estimate)
-                speaking_time_percentage = None
-                if meeting_duration and total_messages > 0:
-                    # Estimate: assume equal time per message
-                    speaking_time_percentage = (message_count / total_messages) * 100
-
-                by_participant[external_id] = {
-                    "message_count": message_count,
-                    "first_message_at": (
-                        stats["first_message_at"].isoformat() if stats["first_message_at"] else None
-                    ),
-                    "last_message_at": (
-                        stats["last_message_at"].isoformat() if stats["last_message_at"] else None
-                    ),
-                    "total_content_length": stats["total_content_length"] or 0,
-                    "speaking_time_percentage": (
-                        round(speaking_time_percentage, 2) if speaking_time_percentage else None
-                    ),
-                    "status": participant["status"],
-                }
-            else:
-                # Inactive participant
-                by_participant[external_id] = {
-                    "message_count": 0,
-                    "first_message_at": None,
-                    "last_message_at": None,
-                    "total_content_length": 0,
-                    "speaking_time_percentage": 0.0,
-                    "status": participant["status"],
-                }
+        # Speaking time estimate assumes equal time per message; the share is
+        # computed server-side. Inactive participants report 0.0.
+        by_participant = {
+            row["external_id"]: {
+                "message_count": row["message_count"] or 0,
+                "first_message_at": row["first_message_at"],
+                "last_message_at": row["last_message_at"],
+                "total_content_length": row["total_content_length"] or 0,
+                "speaking_time_percentage": (
+                    (row["speaking_time_pct"] if meeting_duration else None)
+                    if row["message_count"]
+                    else 0.0
+                ),
+                "status": row["status"],
+            }
+            for row in rows
+        }
 
-        total_participants = len(participants_result)
-        inactive_count = total_participants - active_count
         participation_rate = (
             (active_count / total_participants * 100) if total_participants > 0 else 0.0
         )
@@ -462,11 +721,11 @@ class MeetingRepository(BaseRepository):
         return {
             "total_participants": total_participants,
             "active_participants": active_count,
-            "inactive_participants": inactive_count,
+            "inactive_participants": total_participants - active_count,
             "participation_rate": round(participation_rate, 2),
             "by_participant": by_participant,
             "most_active": most_active_id,
-            "least_active": least_active_id if least_active_id != most_active_id else None,
+            "least_active": least_active_id,
             "total_messages": total_messages,
         }
 
@@ -489,83 +748,77 @@ class MeetingRepository(BaseRepository):
                 - ended_at: Meeting end timestamp (if ended)
                 - duration_seconds: Meeting duration (if ended)
                 - timeline: List of events in chronological order
+
+            Timestamps are returned as datetime objects; serialization is
+            left to the caller.
         """
-        # Get meeting basic info
         meeting_query = """
             SELECT id, started_at, ended_at, status
             FROM meetings
             WHERE id = $1
         """
-        meeting_result = await self._fetch_one(meeting_query, [meeting_id])
-
-        if not meeting_result:
-            return {
-                "meeting_id": str(meeting_id),
-                "started_at": None,
-                "ended_at": None,
-                "duration_seconds": None,
-                "timeline": [],
-            }
-
-        # Get messages
-        messages_query = """
-            SELECT 
-                m.id,
-                m.sender_id,
-                a.external_id as sender_external_id,
-                m.message_type,
+        # Messages and events merged and ordered by the database; on equal
+        # timestamps messages sort before events
+        timeline_query = """
+            SELECT
+                'message' AS type,
                 m.created_at,
-                'message' as event_type
+                a.external_id AS actor,
+                m.message_type AS subtype,
+                m.id::text AS ref_id,
+                NULL::jsonb AS data,
+                0 AS type_order
             FROM messages m
             JOIN agents a ON m.sender_id = a.id
             WHERE m.meeting_id = $1
-            ORDER BY m.created_at ASC
-        """
-        messages = await self._fetch_all(messages_query, [meeting_id])
-
-        # Get meeting events
-        events_query = """
-            SELECT 
-                me.id,
-                me.event_type,
+            UNION ALL
+            SELECT
+                'event',
                 me.created_at,
-                me.agent_id,
-                a.external_id as agent_external_id,
-                me.data
+                a.external_id,
+                me.event_type,
+                me.id::text,
+                me.data,
+                1
             FROM meeting_events me
             LEFT JOIN agents a ON me.agent_id = a.id
             WHERE me.meeting_id = $1
-            ORDER BY me.created_at ASC
+            ORDER BY created_at ASC, type_order ASC
         """
-        events = await self._fetch_all(events_query, [meeting_id])
+        meeting_result, rows = await asyncio.gather(
+            self._fetch_one(meeting_query, (meeting_id,)),
+            self._fetch_all(timeline_query, (meeting_id,)),
+        )
 
-        # Combine and sort by timestamp
-        timeline = []
+        if not meeting_result:
+            return {
+                "meeting_id": str(meeting_id),
+                "started_at": None,
+                "ended_at": None,
+                "duration_seconds": None,
+                "timeline": [],
+            }
 
-        for msg in messages:
-            timeline.append(
+        timeline = [
+            (
                 {
                     "type": "message",
-                    "timestamp": msg["created_at"].isoformat(),
-                    "sender_id": msg["sender_external_id"],
-                    "message_type": msg["message_type"],
-                    "message_id": str(msg["id"]),
+                    "timestamp": row["created_at"],
+                    "sender_id": row["actor"],
+                    "message_type": row["subtype"],
+                    "message_id": row["ref_id"],
                 }
-            )
-
-        for event in events:
-            timeline.append(
-                {
+                if row["type"] == "message"
+                else {
                     "type": "event",
-                    "timestamp": event["created_at"].isoformat(),
-                    "event_type": event["event_type"],
-                    "agent_id": event["agent_external_id"],
-                    "data": event["data"],
+                    "timestamp": row["created_at"],
+                    "event_type": row["subtype"],
+                    "agent_id": row["actor"],
+                    "data": row["data"],
                 }
             )
-
-        # Sort by timestamp
-        timeline.sort(key=lambda x: x["timestamp"])
+            for row in rows
+        ]
 
         # Calculate duration
         duration_seconds = None
@@ -576,12 +829,8 @@ class MeetingRepository(BaseRepository):
 
         return {
             "meeting_id": str(meeting_id),
-            "started_at": (
-                meeting_result["started_at"].isoformat() if meeting_result["started_at"] else None
-            ),
-            "ended_at": (
-                meeting_result["ended_at"].isoformat() if meeting_result["ended_at"] else None
-            ),
+            "started_at": meeting_result["started_at"],
+            "ended_at": meeting_result["ended_at"],
             "duration_seconds": duration_seconds,
             "status": meeting_result["status"],
             "timeline": timeline,
@@ -606,21 +855,30 @@ class MeetingRepository(BaseRepository):
                 - turn_order_adherence: Percentage of turns following expected order
                 - participants_turn_stats: Stats per participant
         """
-        # Get all messages with turn information
-        messages_query = """
-            SELECT 
-                m.sender_id,
-                a.external_id as sender_external_id,
-                m.created_at,
-                LAG(m.sender_id) OVER (ORDER BY m.created_at) as previous_sender
-            FROM messages m
-            JOIN agents a ON m.sender_id = a.id
-            WHERE m.meeting_id = $1 AND m.message_type = 'user_defined'
-            ORDER BY m.created_at ASC
-        """
-        messages = await self._fetch_all(messages_query, [meeting_id])
-
-        if not messages:
+        # A turn starts whenever the sender differs from the previous message's sender
+        query = """
+            WITH m AS (
+                SELECT
+                    sender_id,
+                    created_at,
+                    LAG(sender_id) OVER (ORDER BY created_at) AS previous_sender
+                FROM messages
+                WHERE meeting_id = $1 AND message_type = 'user_defined'
+            )
+            SELECT
+                a.external_id,
+                COUNT(*) AS messages_sent,
+                COUNT(*) FILTER (
+                    WHERE m.previous_sender IS DISTINCT FROM m.sender_id
+                ) AS turns_taken
+            FROM m
+            JOIN agents a ON a.id = m.sender_id
+            GROUP BY a.external_id
+            ORDER BY MIN(m.created_at)
+        """
+        rows = await self._fetch_all(query, (meeting_id,))
+
+        if not rows:
             return {
                 "total_turns": 0,
                 "total_messages": 0,
@@ -630,77 +888,24 @@ class MeetingRepository(BaseRepository):
                 "participants_turn_stats": {},
             }
 
-        # Get participant join order
-        participants_query = """
-            SELECT agent_id, a.external_id, join_order
-            FROM meeting_participants mp
-            JOIN agents a ON mp.agent_id = a.id
-            WHERE meeting_id = $1
-            ORDER BY join_order
-        """
-        participants = await self._fetch_all(participants_query, [meeting_id])
-        join_order_map = {p["agent_id"]: p["join_order"] for p in participants}
-        external_id_map = {p["agent_id"]: p["external_id"] for p in participants}
-
-        # Analyze turns
-        turn_count = 0
-        turn_changes = 0
-        messages_in_current_turn = 0
-        current_speaker = None
-        participant_stats = {}
-
-        for msg in messages:
-            sender_id = msg["sender_id"]
-            sender_external_id = msg["sender_external_id"]
-
-            # Initialize participant stats
-            if sender_external_id not in participant_stats:
-                participant_stats[sender_external_id] = {
-                    "turns_taken": 0,
-                    "messages_sent": 0,
-                    "avg_messages_per_turn": 0.0,
-                }
+        participant_stats = {
+            row["external_id"]: {
+                "turns_taken": row["turns_taken"],
+                "messages_sent": row["messages_sent"],
+                "avg_messages_per_turn": round(row["messages_sent"] / row["turns_taken"], 2),
+            }
+            for row in rows
+        }
 
-            participant_stats[sender_external_id]["messages_sent"] += 1
-
-            # Detect turn change
-            if current_speaker != sender_id:
-                if current_speaker is not None:
-                    # Finalize previous turn
-                    prev_external_id = external_id_map.get(current_speaker)
-                    if prev_external_id:
-                        participant_stats[prev_external_id]["turns_taken"] += 1
-                    turn_changes += 1
-
-                # Start new turn
-                current_speaker = sender_id
-                messages_in_current_turn = 1
-                turn_count += 1
-            else:
-                messages_in_current_turn += 1
-
-        # Finalize last turn
-        if current_speaker:
-            sender_external_id = external_id_map.get(current_speaker)
-            if sender_external_id:
-                participant_stats[sender_external_id]["turns_taken"] += 1
-
-        # Calculate averages
-        for stats in participant_stats.values():
-            if stats["turns_taken"] > 0:
-                stats["avg_messages_per_turn"] = round(
-                    stats["messages_sent"] / stats["turns_taken"], 2
-                )
-
-        total_messages = len(messages)
-        avg_messages_per_turn = round(total_messages / turn_count, 2) if turn_count > 0 else 0.0
+        turn_count = sum(row["turns_taken"] for row in rows)
+        total_messages = sum(row["messages_sent"] for row in rows)
 
         return {
             "total_turns": turn_count,
             "total_messages": total_messages,
-            "avg_messages_per_turn": avg_messages_per_turn,
+            "avg_messages_per_turn": round(total_messages / turn_count, 2),
             "unique_speakers": len(participant_stats),
-            "turn_changes": turn_changes,
+            "turn_changes": turn_count - 1,
             "participants_turn_stats": participant_stats,
         }
 
@@ -729,18 +934,21 @@ class MeetingRepository(BaseRepository):
         """Convert database row to MeetingParticipant model.
 
         Args:
-            result: Database row
+            result: Database row selected with _PARTICIPANT_COLUMNS
 
         Returns:
             MeetingParticipant instance
         """
+        state = result["state"]
+        if state is None:
+            raise ValueError(f"Unknown participant status for participant {result['id']}")
         return MeetingParticipant(
             id=result["id"],
             meeting_id=result["meeting_id"],
             agent_id=result["agent_id"],
-            status=ParticipantStatus(result["status"]),
+            status=_PARTICIPANT_STATUSES[state & 7],
             join_order=result["join_order"],
-            is_locked=result["is_locked"],
+            is_locked=bool(state & _PARTICIPANT_LOCKED_BIT),
             joined_at=result["joined_at"],
             left_at=result["left_at"],
         )
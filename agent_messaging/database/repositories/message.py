@@ -1,19 +1,322 @@
 """Message repository for database operations."""
 
-import json
-from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+import asyncio
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+)
 from uuid import UUID
 
+from psqlpy.extra_types import JSONB
+
+if TYPE_CHECKING:
+    from ..manager import PostgreSQLManager
+
 from .base import BaseRepository
 from ...models import Message, MessageType
+from ..cache import TTLCache
 
 T = TypeVar("T")
 
+# Row values decode to MessageType by dict lookup instead of Enum value search
+_MESSAGE_TYPE_BY_VALUE = {message_type.value: message_type for message_type in MessageType}
+
+
+def _one_line(sql: str) -> str:
+    """Collapse a SQL literal's indentation and newlines to single spaces.
+
+    Only for statements without string literals or comments; keeps the text
+    sent on the wire (and shown in pg_stat_statements) compact.
+    """
+    return " ".join(sql.split())
+
+
+_MESSAGE_COLUMNS = """id, sender_id, recipient_id, session_id, meeting_id,
+                   message_type, content, read_at, created_at, metadata"""
+
+# Unpacks a message row in _MESSAGE_COLUMNS order with one C-level call
+_message_row_values = itemgetter(
+    "id",
+    "sender_id",
+    "recipient_id",
+    "session_id",
+    "meeting_id",
+    "message_type",
+    "content",
+    "read_at",
+    "created_at",
+    "metadata",
+)
+
+_SQL_CREATE_MESSAGE = _one_line(
+    """
+    INSERT INTO messages (
+        sender_id, recipient_id, session_id, meeting_id,
+        message_type, content, metadata
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    RETURNING id
+    """
+)
+
+_SQL_GET_MESSAGE_BY_ID = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE id = $1
+    """
+)
+
+_SQL_GET_MESSAGES_FOR_RECIPIENT = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE recipient_id = $1
+    ORDER BY created_at DESC, id DESC
+    LIMIT $2 OFFSET $3
+    """
+)
+
+_SQL_GET_MESSAGES_FOR_RECIPIENT_BEFORE = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE recipient_id = $1 AND (created_at, id) < ($2, $3)
+    ORDER BY created_at DESC, id DESC
+    LIMIT $4
+    """
+)
+
+_SQL_ITER_MESSAGES_FOR_SESSION = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE session_id = $1
+    ORDER BY created_at ASC, id ASC
+    """
+)
+
+_SQL_ITER_MESSAGES_FOR_MEETING = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE meeting_id = $1
+    ORDER BY created_at ASC, id ASC
+    """
+)
+
+_SQL_MARK_AS_READ = _one_line(
+    """
+    UPDATE messages
+    SET read_at = CURRENT_TIMESTAMP
+    WHERE id = $1 AND read_at IS NULL
+    """
+)
+
+_SQL_MARK_MANY_AS_READ = _one_line(
+    """
+    UPDATE messages
+    SET read_at = $2::timestamptz
+    WHERE id = ANY($1::uuid[]) AND read_at IS NULL
+    """
+)
+
+_SQL_GET_UNREAD_MESSAGES = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE recipient_id = $1 AND read_at IS NULL
+    ORDER BY created_at ASC
+    """
+)
+
+_SQL_FETCH_AND_MARK_READ = _one_line(
+    f"""
+    UPDATE messages
+    SET read_at = CURRENT_TIMESTAMP
+    WHERE recipient_id = $1 AND read_at IS NULL
+    RETURNING {_MESSAGE_COLUMNS}
+    """
+)
+
+_SQL_GET_MESSAGES_BETWEEN_AGENTS = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE recipient_id = $1 AND sender_id = $2
+    ORDER BY created_at ASC
+    LIMIT $3
+    """
+)
+
+_SQL_GET_UNREAD_MESSAGES_FROM_SENDER = _one_line(
+    f"""
+    SELECT {_MESSAGE_COLUMNS}
+    FROM messages
+    WHERE recipient_id = $1 AND sender_id = $2 AND read_at IS NULL
+    ORDER BY created_at ASC
+    """
+)
+
+_SQL_MARK_MESSAGES_READ_FROM_SENDER = _one_line(
+    """
+    UPDATE messages
+    SET read_at = CURRENT_TIMESTAMP
+    WHERE recipient_id = $1 AND sender_id = $2 AND read_at IS NULL
+    RETURNING id
+    """
+)
+
+_SQL_MARK_MESSAGES_READ = _one_line(
+    """
+    UPDATE messages
+    SET read_at = CURRENT_TIMESTAMP
+    WHERE recipient_id = $1 AND read_at IS NULL
+    RETURNING id
+    """
+)
+
+# Absent filters are bound as NULL, so every filter combination shares one
+# statement; custom plans still fold the IS NULL checks for index use
+_MESSAGE_COUNT_FILTERS = """
+    ($1::uuid IS NULL OR recipient_id = $1)
+    AND ($2::uuid IS NULL OR sender_id = $2)
+    AND ($3::uuid IS NULL OR session_id = $3)
+    AND ($4::uuid IS NULL OR meeting_id = $4)
+    AND ($5::boolean IS NULL OR (read_at IS NOT NULL) = $5)
+"""
+
+_SQL_COUNT_MESSAGES = _one_line(
+    f"""
+    SELECT COUNT(*) AS count FROM messages
+    WHERE {_MESSAGE_COUNT_FILTERS}
+    """
+)
+
+_SQL_HAS_MESSAGES = _one_line(
+    f"""
+    SELECT EXISTS (SELECT 1 FROM messages WHERE {_MESSAGE_COUNT_FILTERS}) AS found
+    """
+)
+
+_MESSAGE_INSERT_COLUMNS = (
+    "sender_id",
+    "recipient_id",
+    "session_id",
+    "meeting_id",
+    "message_type",
+    "content",
+    "metadata",
+)
+
+# Rows per multi-VALUES INSERT; keeps parameter count well under PostgreSQL's 65535
+_CREATE_MANY_PAGE_SIZE = 1000
+
+
+@lru_cache(maxsize=32)
+def _insert_many_sql(row_count: int) -> str:
+    """Build a multi-row INSERT for row_count messages."""
+    width = len(_MESSAGE_INSERT_COLUMNS)
+    values = ", ".join(
+        "(" + ", ".join(f"${row * width + col + 1}" for col in range(width)) + ")"
+        for row in range(row_count)
+    )
+    return (
+        f"INSERT INTO messages ({', '.join(_MESSAGE_INSERT_COLUMNS)}) "
+        f"VALUES {values} RETURNING id"
+    )
+
+
+@lru_cache(maxsize=64)
+def _filter_conditions(
+    owner_column: str,
+    date_from: bool,
+    date_to: bool,
+    message_types: bool,
+    unread_only: bool,
+    after: bool,
+) -> Tuple[str, ...]:
+    """Build the WHERE conditions for one combination of listing filters.
+
+    Placeholders are numbered in the order MessageRepository._message_filters
+    appends the matching params, starting with the owner id as $1.
+    """
+    conditions = [f"{owner_column} = $1"]
+    index = 2
+    if unread_only:
+        conditions.append("read_at IS NULL")
+    if date_from:
+        conditions.append(f"created_at >= ${index}")
+        index += 1
+    if date_to:
+        conditions.append(f"created_at <= ${index}")
+        index += 1
+    if message_types:
+        conditions.append(f"message_type = ANY(${index}::text[])")
+        index += 1
+    if after:
+        conditions.append(f"(created_at, id) > (${index}, ${index + 1})")
+    return tuple(conditions)
+
+
+@lru_cache(maxsize=256)
+def _select_messages_sql(
+    conditions: Tuple[str, ...], order_by: str, limit_index: int, with_offset: bool
+) -> str:
+    """Build the SELECT used by _select_messages for one filter shape."""
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    if not with_offset:
+        return (
+            f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE {where_clause} "
+            f"ORDER BY {order_by} LIMIT ${limit_index}"
+        )
+    # Deferred join: skip rows by id only, so the wide content and metadata
+    # columns are read just for the page actually returned.
+    return (
+        f"SELECT {_MESSAGE_COLUMNS} FROM messages JOIN ("
+        f"SELECT id FROM messages WHERE {where_clause} ORDER BY {order_by} "
+        f"LIMIT ${limit_index} OFFSET ${limit_index + 1}"
+        f") AS page USING (id) ORDER BY {order_by}"
+    )
+
 
 class MessageRepository(BaseRepository):
     """Repository for message-related database operations."""
 
+    def __init__(
+        self,
+        db_manager: "PostgreSQLManager",
+        cache_ttl: Optional[float] = None,
+        on_meeting_message: Optional[Callable[[UUID, UUID], None]] = None,
+    ):
+        """Initialize repository with database manager.
+
+        Args:
+            db_manager: PostgreSQLManager instance
+            cache_ttl: Seconds that get_by_id results are served from memory.
+                Off by default (None or 0). A cached Message includes
+                read_at, which only this repository's mark-read methods
+                evict, so reads marked elsewhere stay unseen until expiry.
+            on_meeting_message: Called with (meeting_id, sender_id) after a
+                meeting message is written, e.g.
+                MeetingRepository.invalidate_meeting_message
+        """
+        super().__init__(db_manager)
+        self._on_meeting_message = on_meeting_message
+        self._by_id_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+
     async def create(
         self,
         sender_id: UUID,
@@ -38,34 +341,68 @@ class MessageRepository(BaseRepository):
         Returns:
             UUID of the created message
         """
-        query = """
-            INSERT INTO messages (
-                sender_id, recipient_id, session_id, meeting_id,
-                message_type, content, metadata
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            RETURNING id
-        """
-        # psqlpy expects dict/list for JSONB, not JSON strings
+        # psqlpy encodes dicts to JSONB natively, so no JSON strings here and
+        # no Python-side encoding step that could block the event loop (a
+        # thread offload would not help either: any encoder holds the GIL)
         content_dict = content or {}
         metadata_dict = metadata if metadata else None
 
         result = await self._fetch_one(
-            query,
+            _SQL_CREATE_MESSAGE,
             [
                 sender_id,
-                recipient_id if recipient_id else None,
-                session_id if session_id else None,
-                meeting_id if meeting_id else None,
+                recipient_id,
+                session_id,
+                meeting_id,
                 message_type.value,
                 content_dict,
                 metadata_dict,
             ],
         )
-        message_id = result["id"]
-        if isinstance(message_id, str):
-            message_id = UUID(message_id)
-        return message_id
+        if meeting_id is not None and self._on_meeting_message is not None:
+            self._on_meeting_message(meeting_id, sender_id)
+        return result["id"]
+
+    async def create_many(self, messages: Sequence[Dict[str, Any]]) -> List[UUID]:
+        """Create several messages in one transaction.
+
+        Rows are sent as multi-row INSERTs of up to _CREATE_MANY_PAGE_SIZE
+        messages each, pipelined on a single connection.
+
+        Args:
+            messages: Dicts with the same keys as create()'s arguments;
+                sender_id is required, the rest default as in create()
+
+        Returns:
+            UUIDs of the created messages, in input order
+        """
+        if not messages:
+            return []
+
+        queries = []
+        for start in range(0, len(messages), _CREATE_MANY_PAGE_SIZE):
+            page = messages[start : start + _CREATE_MANY_PAGE_SIZE]
+            params: List[Any] = []
+            for message in page:
+                params.extend(
+                    (
+                        message["sender_id"],
+                        message.get("recipient_id"),
+                        message.get("session_id"),
+                        message.get("meeting_id"),
+                        message.get("message_type", MessageType.USER_DEFINED).value,
+                        message.get("content") or {},
+                        message.get("metadata") or None,
+                    )
+                )
+            queries.append((_insert_many_sql(len(page)), params))
+
+        results = await self._pipeline(queries)
+        if self._on_meeting_message is not None:
+            for message in messages:
+                if message.get("meeting_id") is not None:
+                    self._on_meeting_message(message["meeting_id"], message["sender_id"])
+        return [row["id"] for result in results for row in result.result()]
 
     async def get_by_id(self, message_id: UUID) -> Optional[Message]:
         """Get message by ID.
@@ -76,44 +413,50 @@ class MessageRepository(BaseRepository):
         Returns:
             Message if found, None otherwise
         """
-        query = """
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE id = $1
-        """
-        result = await self._fetch_one(query, [message_id])
-        return self._message_from_db(result) if result else None
+        message = self._by_id_cache.get(message_id)
+        if message is not None:
+            return message
+
+        result = await self._fetch_one(_SQL_GET_MESSAGE_BY_ID, [message_id])
+        if not result:
+            return None
+        message = self._message_from_db(result)
+        self._by_id_cache.set(message_id, message)
+        return message
 
     async def get_messages_for_recipient(
         self,
         recipient_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
-        """Get messages for a recipient.
+        """Get messages for a recipient, newest first.
+
+        For deep history prefer keyset pagination: pass the (created_at, id)
+        of the last message of the previous page as ``before``. Each page is
+        then an index range scan instead of skipping ``offset`` rows.
 
         Args:
             recipient_id: Recipient UUID
             limit: Maximum number of messages
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when before is given)
+            before: Optional (created_at, id) cursor; only older messages are returned
 
         Returns:
             List of messages
         """
-        query = """
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE recipient_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3
-        """
-        results = await self._fetch_all(
-            query,
+        if before is not None:
+            return await self._fetch_all(
+                _SQL_GET_MESSAGES_FOR_RECIPIENT_BEFORE,
+                [recipient_id, before[0], before[1], limit],
+                row_factory=self._message_from_db,
+            )
+        return await self._fetch_all(
+            _SQL_GET_MESSAGES_FOR_RECIPIENT,
             [recipient_id, limit, offset],
+            row_factory=self._message_from_db,
         )
-        return [self._message_from_db(result) for result in results]
 
     async def get_messages_for_session(
         self,
@@ -122,8 +465,9 @@ class MessageRepository(BaseRepository):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         message_types: Optional[List[MessageType]] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
-        """Get messages for a session.
+        """Get messages for a session, oldest first.
 
         Args:
             session_id: Session UUID
@@ -131,41 +475,16 @@ class MessageRepository(BaseRepository):
             date_from: Optional start date filter (inclusive)
             date_to: Optional end date filter (inclusive)
             message_types: Optional list of message types to filter
+            after: Optional (created_at, id) keyset cursor from the last message
+                of the previous page; only later messages are returned
 
         Returns:
             List of messages
         """
-        conditions = ["session_id = $1"]
-        params: List[Any] = [session_id]
-        param_index = 2
-
-        if date_from:
-            conditions.append(f"created_at >= ${param_index}")
-            params.append(date_from)
-            param_index += 1
-
-        if date_to:
-            conditions.append(f"created_at <= ${param_index}")
-            params.append(date_to)
-            param_index += 1
-
-        if message_types:
-            type_values = ", ".join([f"'{mt.value}'" for mt in message_types])
-            conditions.append(f"message_type IN ({type_values})")
-
-        where_clause = " AND ".join(conditions)
-
-        query = f"""
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE {where_clause}
-            ORDER BY created_at ASC
-            LIMIT ${param_index}
-        """
-        params.append(limit)
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        conditions, params = self._message_filters(
+            "session_id", session_id, date_from, date_to, message_types, after=after
+        )
+        return await self._select_messages(conditions, params, "created_at ASC, id ASC", limit)
 
     async def get_messages_for_meeting(
         self,
@@ -174,8 +493,9 @@ class MessageRepository(BaseRepository):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         message_types: Optional[List[MessageType]] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
-        """Get messages for a meeting.
+        """Get messages for a meeting, oldest first.
 
         Args:
             meeting_id: Meeting UUID
@@ -183,41 +503,101 @@ class MessageRepository(BaseRepository):
             date_from: Optional start date filter (inclusive)
             date_to: Optional end date filter (inclusive)
             message_types: Optional list of message types to filter
+            after: Optional (created_at, id) keyset cursor from the last message
+                of the previous page; only later messages are returned
 
         Returns:
             List of messages
         """
-        conditions = ["meeting_id = $1"]
-        params: List[Any] = [meeting_id]
-        param_index = 2
+        conditions, params = self._message_filters(
+            "meeting_id", meeting_id, date_from, date_to, message_types, after=after
+        )
+        return await self._select_messages(conditions, params, "created_at ASC, id ASC", limit)
 
-        if date_from:
-            conditions.append(f"created_at >= ${param_index}")
-            params.append(date_from)
-            param_index += 1
+    async def iter_messages_for_session(
+        self,
+        session_id: UUID,
+        chunk: int = 200,
+    ) -> AsyncIterator[Message]:
+        """Stream all messages of a session, oldest first, through a server-side cursor.
 
-        if date_to:
-            conditions.append(f"created_at <= ${param_index}")
-            params.append(date_to)
-            param_index += 1
+        Only ``chunk`` rows are held in memory at a time, so replaying long
+        conversations does not build a full list.
 
-        if message_types:
-            type_values = ", ".join([f"'{mt.value}'" for mt in message_types])
-            conditions.append(f"message_type IN ({type_values})")
+        Args:
+            session_id: Session UUID
+            chunk: Rows fetched per round trip
 
-        where_clause = " AND ".join(conditions)
+        Yields:
+            Messages in chronological order
+        """
+        async for row in self._iter_rows(
+            _SQL_ITER_MESSAGES_FOR_SESSION, (session_id,), fetch_number=chunk
+        ):
+            yield self._message_from_db(row)
 
-        query = f"""
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE {where_clause}
-            ORDER BY created_at ASC
-            LIMIT ${param_index}
+    async def iter_messages_for_meeting(
+        self,
+        meeting_id: UUID,
+        chunk: int = 200,
+    ) -> AsyncIterator[Message]:
+        """Stream all messages of a meeting, oldest first, through a server-side cursor.
+
+        Only ``chunk`` rows are held in memory at a time, so replaying long
+        meetings does not build a full list.
+
+        Args:
+            meeting_id: Meeting UUID
+            chunk: Rows fetched per round trip
+
+        Yields:
+            Messages in chronological order
         """
-        params.append(limit)
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        async for row in self._iter_rows(
+            _SQL_ITER_MESSAGES_FOR_MEETING, (meeting_id,), fetch_number=chunk
+        ):
+            yield self._message_from_db(row)
+
+    async def iter_received_messages(
+        self,
+        recipient_id: UUID,
+        include_read: bool = True,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        message_types: Optional[List[MessageType]] = None,
+        chunk: int = 200,
+    ) -> AsyncIterator[Message]:
+        """Stream messages received by an agent, newest first, through a server-side cursor.
+
+        Takes the same filters as get_received_messages but holds only
+        ``chunk`` rows in memory at a time, so consumers that stop early never
+        materialize the rest of a large inbox.
+
+        Args:
+            recipient_id: Recipient agent UUID
+            include_read: Include read messages (default True)
+            date_from: Optional start date filter (inclusive)
+            date_to: Optional end date filter (inclusive)
+            message_types: Optional list of message types to filter
+            chunk: Rows fetched per round trip
+
+        Yields:
+            Messages ordered by creation time (newest first)
+        """
+        conditions, params = self._message_filters(
+            "recipient_id",
+            recipient_id,
+            date_from,
+            date_to,
+            message_types,
+            unread_only=not include_read,
+        )
+        query = (
+            f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE {' AND '.join(conditions)} "
+            "ORDER BY created_at DESC, id DESC"
+        )
+        async for row in self._iter_rows(query, params, fetch_number=chunk):
+            yield self._message_from_db(row)
 
     async def mark_as_read(self, message_id: UUID) -> None:
         """Mark a message as read.
@@ -225,12 +605,25 @@ class MessageRepository(BaseRepository):
         Args:
             message_id: Message UUID
         """
-        query = """
-            UPDATE messages
-            SET read_at = CURRENT_TIMESTAMP
-            WHERE id = $1 AND read_at IS NULL
+        await self._execute(_SQL_MARK_AS_READ, [message_id])
+        self._by_id_cache.pop(message_id)
+
+    async def mark_many_as_read(self, message_ids: Sequence[UUID]) -> None:
+        """Mark several messages as read in one statement.
+
+        All messages get the same read_at, taken once from the client clock,
+        so a batch acknowledgement is recorded as a single instant.
+
+        Args:
+            message_ids: Message UUIDs
         """
-        await self._execute(query, [message_id])
+        if not message_ids:
+            return
+        await self._execute(
+            _SQL_MARK_MANY_AS_READ, [list(message_ids), datetime.now(timezone.utc)]
+        )
+        for message_id in message_ids:
+            self._by_id_cache.pop(message_id)
 
     async def get_unread_messages(self, recipient_id: UUID) -> List[Message]:
         """Get unread messages for a recipient.
@@ -241,15 +634,66 @@ class MessageRepository(BaseRepository):
         Returns:
             List of unread messages ordered by creation time
         """
-        query = """
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE recipient_id = $1 AND read_at IS NULL
-            ORDER BY created_at ASC
+        return await self._fetch_all(
+            _SQL_GET_UNREAD_MESSAGES, [recipient_id], row_factory=self._message_from_db
+        )
+
+    async def fetch_and_mark_read(self, recipient_id: UUID) -> List[Message]:
+        """Atomically fetch a recipient's unread messages and mark them read.
+
+        Uses a single UPDATE ... RETURNING, so there is no window in which
+        another reader can see the same messages as unread.
+
+        Args:
+            recipient_id: Recipient UUID
+
+        Returns:
+            The messages that were unread, ordered by creation time
+        """
+        messages = await self._fetch_all(
+            _SQL_FETCH_AND_MARK_READ, [recipient_id], row_factory=self._message_from_db
+        )
+        for message in messages:
+            self._by_id_cache.pop(message.id)
+        # UPDATE ... RETURNING has no ORDER BY
+        messages.sort(key=lambda message: message.created_at)
+        return messages
+
+    async def listen_unread(self, recipient_id: UUID) -> AsyncIterator[List[Message]]:
+        """Yield a recipient's unread messages whenever new ones arrive.
+
+        Fetches the current unread messages once, then waits on the
+        recipient's NOTIFY channel (see migration 010) and only queries again
+        after a notification, instead of polling get_unread_messages.
+        Batches are not marked read; callers acknowledge them, e.g. with
+        mark_many_as_read, or they are returned again on the next wake-up.
+
+        Args:
+            recipient_id: Recipient UUID
+
+        Yields:
+            Non-empty lists of unread messages ordered by creation time
         """
-        results = await self._fetch_all(query, [recipient_id])
-        return [self._message_from_db(result) for result in results]
+        wake = asyncio.Event()
+
+        async def on_notify(connection: Any, payload: str, channel: str, process_id: int) -> None:
+            wake.set()
+
+        listener = self.db_manager.listener()
+        await listener.add_callback(f"msgs_{recipient_id.hex}", on_notify)
+        await listener.startup()
+        listener.listen()
+        try:
+            while True:
+                # Clear before querying so a NOTIFY racing the SELECT still wakes us
+                wake.clear()
+                messages = await self.get_unread_messages(recipient_id)
+                if messages:
+                    yield messages
+                await wake.wait()
+        finally:
+            listener.abort_listen()
+            await listener.shutdown()
 
     async def get_messages_between_agents(
         self,
@@ -267,16 +711,11 @@ class MessageRepository(BaseRepository):
         Returns:
             List of messages ordered by creation time
         """
-        query = """
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE recipient_id = $1 AND sender_id = $2
-            ORDER BY created_at ASC
-            LIMIT $3
-        """
-        results = await self._fetch_all(query, [recipient_id, sender_id, limit])
-        return [self._message_from_db(result) for result in results]
+        return await self._fetch_all(
+            _SQL_GET_MESSAGES_BETWEEN_AGENTS,
+            [recipient_id, sender_id, limit],
+            row_factory=self._message_from_db,
+        )
 
     async def get_unread_messages_from_sender(
         self,
@@ -292,15 +731,11 @@ class MessageRepository(BaseRepository):
         Returns:
             List of unread messages ordered by creation time
         """
-        query = """
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE recipient_id = $1 AND sender_id = $2 AND read_at IS NULL
-            ORDER BY created_at ASC
-        """
-        results = await self._fetch_all(query, [recipient_id, sender_id])
-        return [self._message_from_db(result) for result in results]
+        return await self._fetch_all(
+            _SQL_GET_UNREAD_MESSAGES_FROM_SENDER,
+            [recipient_id, sender_id],
+            row_factory=self._message_from_db,
+        )
 
     async def get_sent_messages(
         self,
@@ -310,52 +745,29 @@ class MessageRepository(BaseRepository):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         message_types: Optional[List[MessageType]] = None,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
         """Get all messages sent by an agent.
 
         Args:
             sender_id: Sender agent UUID
             limit: Maximum number of messages
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when before is given)
             date_from: Optional start date filter (inclusive)
             date_to: Optional end date filter (inclusive)
             message_types: Optional list of message types to filter
+            before: Optional (created_at, id) keyset cursor taken from the last
+                message of the previous page; only older messages are returned
 
         Returns:
             List of messages ordered by creation time (newest first)
         """
-        conditions = ["sender_id = $1"]
-        params: List[Any] = [sender_id]
-        param_index = 2
-
-        if date_from:
-            conditions.append(f"created_at >= ${param_index}")
-            params.append(date_from)
-            param_index += 1
-
-        if date_to:
-            conditions.append(f"created_at <= ${param_index}")
-            params.append(date_to)
-            param_index += 1
-
-        if message_types:
-            # Create IN clause for message types
-            type_values = ", ".join([f"'{mt.value}'" for mt in message_types])
-            conditions.append(f"message_type IN ({type_values})")
-
-        where_clause = " AND ".join(conditions)
-
-        query = f"""
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${param_index} OFFSET ${param_index+1}
-        """
-        params.extend([limit, offset])
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        conditions, params = self._message_filters(
+            "sender_id", sender_id, date_from, date_to, message_types
+        )
+        return await self._select_messages(
+            conditions, params, "created_at DESC, id DESC", limit, offset, before
+        )
 
     async def get_received_messages(
         self,
@@ -366,56 +778,170 @@ class MessageRepository(BaseRepository):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         message_types: Optional[List[MessageType]] = None,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
         """Get all messages received by an agent (one-way and conversations).
 
         Args:
             recipient_id: Recipient agent UUID
             limit: Maximum number of messages
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when before is given)
             include_read: Include read messages (default True)
             date_from: Optional start date filter (inclusive)
             date_to: Optional end date filter (inclusive)
             message_types: Optional list of message types to filter
+            before: Optional (created_at, id) keyset cursor taken from the last
+                message of the previous page; only older messages are returned
 
         Returns:
             List of messages ordered by creation time (newest first)
         """
-        conditions = ["recipient_id = $1"]
-        params: List[Any] = [recipient_id]
-        param_index = 2
-
-        if not include_read:
-            conditions.append("read_at IS NULL")
+        conditions, params = self._message_filters(
+            "recipient_id",
+            recipient_id,
+            date_from,
+            date_to,
+            message_types,
+            unread_only=not include_read,
+        )
+        return await self._select_messages(
+            conditions, params, "created_at DESC, id DESC", limit, offset, before
+        )
 
-        if date_from:
-            conditions.append(f"created_at >= ${param_index}")
-            params.append(date_from)
-            param_index += 1
+    async def get_received_messages_with_total(
+        self,
+        recipient_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        include_read: bool = True,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        message_types: Optional[List[MessageType]] = None,
+    ) -> Tuple[List[Message], int]:
+        """Get a page of received messages together with the total match count.
 
-        if date_to:
-            conditions.append(f"created_at <= ${param_index}")
-            params.append(date_to)
-            param_index += 1
+        The total is computed with a COUNT(*) OVER () window in the same
+        query as the page, instead of a separate get_message_count call.
 
-        if message_types:
-            # Create IN clause for message types
-            type_values = ", ".join([f"'{mt.value}'" for mt in message_types])
-            conditions.append(f"message_type IN ({type_values})")
+        Args:
+            recipient_id: Recipient agent UUID
+            limit: Maximum number of messages
+            offset: Offset for pagination
+            include_read: Include read messages (default True)
+            date_from: Optional start date filter (inclusive)
+            date_to: Optional end date filter (inclusive)
+            message_types: Optional list of message types to filter
 
+        Returns:
+            Tuple of (messages newest first, total number of matching messages)
+        """
+        conditions, params = self._message_filters(
+            "recipient_id",
+            recipient_id,
+            date_from,
+            date_to,
+            message_types,
+            unread_only=not include_read,
+        )
         where_clause = " AND ".join(conditions)
+        limit_index = len(params) + 1
 
-        query = f"""
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
+        rows = await self._fetch_all(
+            f"""
+            SELECT {_MESSAGE_COLUMNS}, page.total_count
             FROM messages
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${param_index} OFFSET ${param_index+1}
+            JOIN (
+                SELECT id, COUNT(*) OVER () AS total_count
+                FROM messages
+                WHERE {where_clause}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${limit_index} OFFSET ${limit_index + 1}
+            ) AS page USING (id)
+            ORDER BY created_at DESC, id DESC
+            """,
+            [*params, limit, offset],
+        )
+        if rows:
+            return [self._message_from_db(row) for row in rows], rows[0]["total_count"]
+        if not offset:
+            return [], 0
+
+        # Past the last page the window has no rows to report a total on
+        result = await self._fetch_one(
+            f"SELECT COUNT(*) AS count FROM messages WHERE {where_clause}", params
+        )
+        return [], result["count"] if result else 0
+
+    async def get_inbox_snapshot(self, recipient_id: UUID, limit: int = 50) -> Dict[str, Any]:
+        """Get a recipient's unread messages, latest messages and total count.
+
+        The unread list and the counted page of recent messages are fetched
+        concurrently on separate pool connections, so the round-trips overlap.
+
+        Args:
+            recipient_id: Recipient agent UUID
+            limit: Maximum number of recent messages
+
+        Returns:
+            Dictionary with unread (oldest first), recent (newest first),
+            unread_count and total_count
         """
-        params.extend([limit, offset])
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        unread, (recent, total_count) = await asyncio.gather(
+            self.get_unread_messages(recipient_id),
+            self.get_received_messages_with_total(recipient_id, limit=limit),
+        )
+        return {
+            "unread": unread,
+            "recent": recent,
+            "unread_count": len(unread),
+            "total_count": total_count,
+        }
+
+    def _message_filters(
+        self,
+        owner_column: str,
+        owner_id: UUID,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        message_types: Optional[List[MessageType]] = None,
+        unread_only: bool = False,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Tuple[Tuple[str, ...], List[Any]]:
+        """Build WHERE conditions and params shared by the listing methods.
+
+        The conditions come from _filter_conditions, cached per combination
+        of active filters, so each call only collects the parameter values.
+
+        Args:
+            owner_column: Column matched against owner_id (e.g. "sender_id")
+            owner_id: Session, meeting, sender or recipient UUID
+            date_from: Optional start date filter (inclusive)
+            date_to: Optional end date filter (inclusive)
+            message_types: Optional list of message types to filter
+            unread_only: Only match messages with read_at IS NULL
+            after: Optional (created_at, id) cursor; only later messages match
+
+        Returns:
+            Tuple of (conditions, params)
+        """
+        conditions = _filter_conditions(
+            owner_column,
+            bool(date_from),
+            bool(date_to),
+            bool(message_types),
+            unread_only,
+            after is not None,
+        )
+        params: List[Any] = [owner_id]
+        if date_from:
+            params.append(date_from)
+        if date_to:
+            params.append(date_to)
+        if message_types:
+            params.append([mt.value for mt in message_types])
+        if after is not None:
+            params.extend(after)
+        return conditions, params
 
     async def mark_messages_read(
         self,
@@ -432,28 +958,15 @@ class MessageRepository(BaseRepository):
             Number of messages marked as read
         """
         if sender_id:
-            query = """
-                UPDATE messages
-                SET read_at = CURRENT_TIMESTAMP
-                WHERE recipient_id = $1 AND sender_id = $2 AND read_at IS NULL
-            """
-            await self._execute(query, [recipient_id, sender_id])
+            results = await self._fetch_all(
+                _SQL_MARK_MESSAGES_READ_FROM_SENDER, [recipient_id, sender_id]
+            )
         else:
-            query = """
-                UPDATE messages
-                SET read_at = CURRENT_TIMESTAMP
-                WHERE recipient_id = $1 AND read_at IS NULL
-            """
-            await self._execute(query, [recipient_id])
-
-        # Return count of affected rows by fetching unread count
-        count_query = """
-            SELECT COUNT(*) as count FROM messages
-            WHERE recipient_id = $1 AND read_at IS NULL
-        """
-        result = await self._fetch_one(count_query, [recipient_id])
-        # If all are marked, return previous count (this is approximate)
-        return result["count"] if result else 0
+            results = await self._fetch_all(_SQL_MARK_MESSAGES_READ, [recipient_id])
+
+        for row in results:
+            self._by_id_cache.pop(row["id"])
+        return len(results)
 
     async def get_message_count(
         self,
@@ -475,41 +988,38 @@ class MessageRepository(BaseRepository):
         Returns:
             Count of matching messages
         """
-        conditions = []
-        params: List[Any] = []
-        param_index = 1
-
-        if recipient_id:
-            conditions.append(f"recipient_id = ${param_index}")
-            params.append(recipient_id)
-            param_index += 1
-
-        if sender_id:
-            conditions.append(f"sender_id = ${param_index}")
-            params.append(sender_id)
-            param_index += 1
-
-        if session_id:
-            conditions.append(f"session_id = ${param_index}")
-            params.append(session_id)
-            param_index += 1
+        result = await self._fetch_one(
+            _SQL_COUNT_MESSAGES, [recipient_id, sender_id, session_id, meeting_id, read_status]
+        )
+        return result["count"] if result else 0
 
-        if meeting_id:
-            conditions.append(f"meeting_id = ${param_index}")
-            params.append(meeting_id)
-            param_index += 1
+    async def has_messages(
+        self,
+        recipient_id: Optional[UUID] = None,
+        sender_id: Optional[UUID] = None,
+        session_id: Optional[UUID] = None,
+        meeting_id: Optional[UUID] = None,
+        read_status: Optional[bool] = None,
+    ) -> bool:
+        """Check whether any message matches the criteria.
 
-        if read_status is not None:
-            if read_status:
-                conditions.append(f"read_at IS NOT NULL")
-            else:
-                conditions.append(f"read_at IS NULL")
+        Takes the same filters as get_message_count, but stops at the first
+        matching row instead of counting them all.
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"SELECT COUNT(*) as count FROM messages WHERE {where_clause}"
+        Args:
+            recipient_id: Filter by recipient
+            sender_id: Filter by sender
+            session_id: Filter by session
+            meeting_id: Filter by meeting
+            read_status: True for read only, False for unread only, None for all
 
-        result = await self._fetch_one(query, params)
-        return result["count"] if result else 0
+        Returns:
+            True if at least one message matches
+        """
+        result = await self._fetch_one(
+            _SQL_HAS_MESSAGES, [recipient_id, sender_id, session_id, meeting_id, read_status]
+        )
+        return bool(result and result["found"])
 
     async def get_messages_by_search(
         self,
@@ -544,17 +1054,10 @@ class MessageRepository(BaseRepository):
         Returns:
             List of matching messages ordered by relevance (rank)
         """
-        conditions = []
-        params = []
-        param_index = 1
-
-        # Add full-text search condition
-        # Use websearch_to_tsquery for user-friendly query syntax
-        conditions.append(
-            f"to_tsvector('english', content::text) @@ websearch_to_tsquery('english', ${param_index})"
-        )
-        params.append(search_query)
-        param_index += 1
+        # Match against the stored content_tsv column (migration 012)
+        conditions = ["content_tsv @@ q.tsq"]
+        params: List[Any] = [search_query]
+        param_index = 2
 
         # Add optional context filters
         if sender_id:
@@ -579,42 +1082,98 @@ class MessageRepository(BaseRepository):
 
         where_clause = " AND ".join(conditions)
 
-        # Include ranking in results
+        # Parse the query once (websearch_to_tsquery for user-friendly syntax)
+        # and rank against the stored vector
         query = f"""
-            SELECT 
-                id, sender_id, recipient_id, session_id, meeting_id,
-                message_type, content, read_at, created_at, metadata,
-                ts_rank(to_tsvector('english', content::text), websearch_to_tsquery('english', $1)) as rank
-            FROM messages
+            WITH q AS (SELECT websearch_to_tsquery('english', $1) AS tsq)
+            SELECT {_MESSAGE_COLUMNS}, ts_rank(content_tsv, q.tsq) AS rank
+            FROM messages, q
             WHERE {where_clause}
             ORDER BY rank DESC, created_at DESC
             LIMIT ${param_index} OFFSET ${param_index+1}
         """
         params.extend([limit, offset])
 
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        return await self._fetch_all(query, params, row_factory=self._message_from_db)
+
+    async def _select_messages(
+        self,
+        conditions: Sequence[str],
+        params: List[Any],
+        order_by: str,
+        limit: int,
+        offset: Optional[int] = None,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Message]:
+        """Run a filtered message SELECT shared by the list/query methods.
+
+        Filters are bound as parameters, so each combination of filters maps
+        to one SQL string (and one cached prepared statement) regardless of
+        the values used.
+
+        Args:
+            conditions: WHERE conditions using $1..$N placeholders for params
+            params: Values for the placeholders in conditions
+            order_by: ORDER BY expression
+            limit: Maximum number of messages
+            offset: Optional number of messages to skip
+            before: Optional (created_at, id) keyset cursor for newest-first
+                listings; replaces offset when given
+
+        Returns:
+            List of messages
+        """
+        if before is not None:
+            index = len(params) + 1
+            conditions = [*conditions, f"(created_at, id) < (${index}, ${index + 1})"]
+            params = [*params, *before]
+            offset = None
+
+        query = _select_messages_sql(
+            tuple(conditions), order_by, len(params) + 1, offset is not None
+        )
+        params = [*params, limit]
+        if offset is not None:
+            params.append(offset)
+        return await self._fetch_all(query, params, row_factory=self._message_from_db)
 
     def _message_from_db(self, result: Dict[str, Any]) -> Message:
         """Convert database row to Message model.
 
+        Rows come from the driver already typed (UUIDs, datetimes, decoded
+        JSONB), so the model is built without re-running validation. Columns
+        are selected individually rather than as one to_jsonb(row) document:
+        that would turn UUIDs and timestamps back into strings needing parsing.
+
         Args:
             result: Database row
 
         Returns:
             Message instance
         """
-        return Message(
-            id=result["id"],
-            sender_id=result["sender_id"],
-            recipient_id=result["recipient_id"],
-            session_id=result["session_id"],
-            meeting_id=result["meeting_id"],
-            message_type=MessageType(result["message_type"]),
-            content=result["content"],
-            read_at=result["read_at"],
-            created_at=result["created_at"],
-            metadata=result["metadata"],
+        (
+            message_id,
+            sender_id,
+            recipient_id,
+            session_id,
+            meeting_id,
+            message_type,
+            content,
+            read_at,
+            created_at,
+            metadata,
+        ) = _message_row_values(result)
+        return Message.model_construct(
+            id=message_id,
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            session_id=session_id,
+            meeting_id=meeting_id,
+            message_type=_MESSAGE_TYPE_BY_VALUE[message_type],
+            content=content,
+            read_at=read_at,
+            created_at=created_at,
+            metadata=metadata,
         )
 
     async def get_messages_by_metadata(
@@ -626,13 +1185,15 @@ class MessageRepository(BaseRepository):
         meeting_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        before: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Message]:
         """Query messages by metadata filters.
 
         Supports exact matches and special operators:
         - key__contains: Array contains value (for array fields)
         - key__exists: Key exists in metadata
-        - key: Exact match
+        - key: Exact match (JSON-typed: 1 matches 1, not "1"; a list or dict
+          value must equal the stored one, a superset does not match)
 
         Args:
             metadata_filter: Dictionary of metadata filters
@@ -641,7 +1202,9 @@ class MessageRepository(BaseRepository):
             session_id: Optional filter by session
             meeting_id: Optional filter by meeting
             limit: Maximum results to return
-            offset: Results offset for pagination
+            offset: Results offset for pagination (ignored when before is given)
+            before: Optional (created_at, id) keyset cursor taken from the last
+                message of the previous page; only older messages are returned
 
         Returns:
             List of matching messages
@@ -666,25 +1229,51 @@ class MessageRepository(BaseRepository):
         params: List[Any] = []
         param_index = 1
 
-        # Add metadata filters
+        # Scalar exact matches and array contains are folded into one
+        # containment document, metadata @> {"k1": v1, "tags": [v2]}, which the
+        # GIN jsonb_path_ops index (migration 003) answers in a single lookup.
+        # Keys of the remaining operators are bound as text parameters, so the
+        # SQL depends only on which operators are used.
+        containment: Dict[str, Any] = {}
         for key, value in metadata_filter.items():
             if "__contains" in key:
                 # Array contains operator: metadata->'key' @> '[value]'
                 actual_key = key.replace("__contains", "")
-                conditions.append(f"metadata->'{actual_key}' @> ${param_index}")
-                # For array contains, wrap value in array
-                params.append(json.dumps([value]))
+                if actual_key not in containment:
+                    containment[actual_key] = [value]
+                else:
+                    # Key also has an exact match; keep the check separate
+                    conditions.append(f"metadata->${param_index}::text @> ${param_index + 1}")
+                    params.extend([actual_key, JSONB([value])])
+                    param_index += 2
             elif "__exists" in key:
                 # Key exists operator: metadata ? 'key'
                 actual_key = key.replace("__exists", "")
                 if value:  # Check if exists
-                    conditions.append(f"metadata ? '{actual_key}'")
+                    conditions.append(f"metadata ? ${param_index}::text")
                 else:  # Check if not exists
-                    conditions.append(f"NOT (metadata ? '{actual_key}')")
+                    conditions.append(f"NOT (metadata ? ${param_index}::text)")
+                params.append(actual_key)
+                param_index += 1
+            elif isinstance(value, (list, dict)):
+                # Containment would also match supersets ({"tags": ["a", "b"]}
+                # contains {"tags": ["a"]}), so compare for JSON equality
+                conditions.append(f"metadata->${param_index}::text = ${param_index + 1}")
+                params.extend([key, JSONB(value)])
+                param_index += 2
+            elif key in containment:
+                # Key also has an array contains; keep the exact match separate
+                conditions.append(f"metadata->>${param_index}::text = ${param_index + 1}")
+                params.extend([key, str(value)])
+                param_index += 2
             else:
-                # Exact match: metadata->>'key' = 'value'
-                conditions.append(f"metadata->>'{key}' = ${param_index}")
-                params.append(str(value))
+                # Exact match: metadata @> '{"key": value}'
+                containment[key] = value
+
+        if containment:
+            # The driver encodes the dict as binary JSONB, no JSON string needed
+            conditions.append(f"metadata @> ${param_index}")
+            params.append(JSONB(containment))
             param_index += 1
 
         # Add optional context filters
@@ -708,17 +1297,6 @@ class MessageRepository(BaseRepository):
             params.append(meeting_id)
             param_index += 1
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        query = f"""
-            SELECT id, sender_id, recipient_id, session_id, meeting_id,
-                   message_type, content, read_at, created_at, metadata
-            FROM messages
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ${param_index} OFFSET ${param_index+1}
-        """
-        params.extend([limit, offset])
-
-        results = await self._fetch_all(query, params)
-        return [self._message_from_db(result) for result in results]
+        return await self._select_messages(
+            conditions, params, "created_at DESC, id DESC", limit, offset, before
+        )
@@ -1,15 +1,57 @@
 """Organization repository for database operations."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from .base import BaseRepository
 from ...models import Organization
+from ..cache import TTLCache
+
+if TYPE_CHECKING:
+    from ..manager import PostgreSQLManager
+
+
+_SQL_CREATE_ORGANIZATION = """
+            INSERT INTO organizations (external_id, name)
+            VALUES ($1, $2)
+            RETURNING id
+        """
+
+_SQL_GET_ORGANIZATION_BY_EXTERNAL_ID = """
+            SELECT id, external_id, name, created_at, updated_at
+            FROM organizations
+            WHERE external_id = $1
+        """
+
+_SQL_GET_ORGANIZATION_BY_ID = """
+            SELECT id, external_id, name, created_at, updated_at
+            FROM organizations
+            WHERE id = $1
+        """
+
+_SQL_DELETE_ORGANIZATION = """
+            DELETE FROM organizations
+            WHERE external_id = $1
+            RETURNING id
+        """
 
 
 class OrganizationRepository(BaseRepository):
     """Repository for organization-related database operations."""
 
+    def __init__(self, db_manager: "PostgreSQLManager", cache_ttl: Optional[float] = None):
+        """Initialize repository with database manager.
+
+        Args:
+            db_manager: PostgreSQLManager instance
+            cache_ttl: Seconds that get_by_external_id results are served from
+                memory. Off by default (None or 0). Only this repository's
+                delete evicts entries, so an organization deleted or renamed
+                by another process is still returned until expiry.
+        """
+        super().__init__(db_manager)
+        self._by_external_id_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+
     async def create(self, external_id: str, name: str) -> UUID:
         """Create a new organization.
 
@@ -20,16 +62,8 @@ class OrganizationRepository(BaseRepository):
         Returns:
             UUID of the created organization
         """
-        query = """
-            INSERT INTO organizations (external_id, name)
-            VALUES ($1, $2)
-            RETURNING id
-        """
-        result = await self._fetch_one(query, [external_id, name])
-        org_id = result["id"]
-        if isinstance(org_id, str):
-            org_id = UUID(org_id)
-        return org_id
+        result = await self._fetch_one(_SQL_CREATE_ORGANIZATION, [external_id, name])
+        return result["id"]
 
     async def get_by_external_id(self, external_id: str) -> Optional[Organization]:
         """Get organization by external ID.
@@ -40,13 +74,16 @@ class OrganizationRepository(BaseRepository):
         Returns:
             Organization if found, None otherwise
         """
-        query = """
-            SELECT id, external_id, name, created_at, updated_at
-            FROM organizations
-            WHERE external_id = $1
-        """
-        result = await self._fetch_one(query, [external_id])
-        return Organization(**result) if result else None
+        organization = self._by_external_id_cache.get(external_id)
+        if organization is not None:
+            return organization
+
+        result = await self._fetch_one(_SQL_GET_ORGANIZATION_BY_EXTERNAL_ID, [external_id])
+        if not result:
+            return None
+        organization = self._organization_from_db(result)
+        self._by_external_id_cache.set(external_id, organization)
+        return organization
 
     async def get_by_id(self, organization_id: UUID) -> Optional[Organization]:
         """Get organization by internal ID.
@@ -57,13 +94,8 @@ class OrganizationRepository(BaseRepository):
         Returns:
             Organization if found, None otherwise
         """
-        query = """
-            SELECT id, external_id, name, created_at, updated_at
-            FROM organizations
-            WHERE id = $1
-        """
-        result = await self._fetch_one(query, [organization_id])
-        return Organization(**result) if result else None
+        result = await self._fetch_one(_SQL_GET_ORGANIZATION_BY_ID, [organization_id])
+        return self._organization_from_db(result) if result else None
 
     async def delete(self, external_id: str) -> bool:
         """Delete organization by external ID.
@@ -77,10 +109,25 @@ class OrganizationRepository(BaseRepository):
         Returns:
             True if organization was deleted, False if not found
         """
-        query = """
-            DELETE FROM organizations
-            WHERE external_id = $1
-            RETURNING id
-        """
-        result = await self._fetch_one(query, [external_id])
+        result = await self._fetch_one(_SQL_DELETE_ORGANIZATION, [external_id])
+        self._by_external_id_cache.pop(external_id)
         return result is not None
+
+    def _organization_from_db(self, result: dict) -> Organization:
+        """Convert database row to Organization model.
+
+        Rows come from the driver already typed, so validation is skipped.
+
+        Args:
+            result: Database row
+
+        Returns:
+            Organization instance
+        """
+        return Organization.model_construct(
+            id=result["id"],
+            external_id=result["external_id"],
+            name=result["name"],
+            created_at=result["created_at"],
+            updated_at=result["updated_at"],
+        )
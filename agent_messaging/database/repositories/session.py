@@ -1,11 +1,199 @@
 """Session repository for database operations."""
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from .base import BaseRepository
 from ...models import Session, SessionStatus
 
+# Row values decode to SessionStatus by dict lookup instead of Enum value search
+_SESSION_STATUS_BY_VALUE = {status.value: status for status in SessionStatus}
+
+# Status bind values, resolved once instead of per call
+_STATUS_ACTIVE = SessionStatus.ACTIVE.value
+_STATUS_ENDED = SessionStatus.ENDED.value
+
+# Session columns in Session field order, fetched with one C-level call per row
+_session_row_values = itemgetter(
+    "id",
+    "agent_a_id",
+    "agent_b_id",
+    "status",
+    "locked_agent_id",
+    "created_at",
+    "updated_at",
+    "ended_at",
+)
+
+_SQL_CREATE_SESSION = """
+            INSERT INTO sessions (agent_a_id, agent_b_id, status)
+            VALUES (LEAST($1::uuid, $2::uuid), GREATEST($1::uuid, $2::uuid), $3)
+            RETURNING id
+        """
+
+_SQL_CREATE_SESSIONS_BULK = """
+            INSERT INTO sessions (agent_a_id, agent_b_id, status)
+            SELECT t.agent_a_id, t.agent_b_id, $3
+            FROM UNNEST($1::uuid[], $2::uuid[]) AS t(agent_a_id, agent_b_id)
+            RETURNING id, agent_a_id, agent_b_id
+        """
+
+_SQL_GET_SESSION_BY_ID = """
+            SELECT id, agent_a_id, agent_b_id, status,
+                   locked_agent_id, created_at, updated_at, ended_at
+            FROM sessions
+            WHERE id = $1
+        """
+
+_SQL_GET_ACTIVE_SESSION = """
+            SELECT id, agent_a_id, agent_b_id, status,
+                   locked_agent_id, created_at, updated_at, ended_at
+            FROM sessions
+            WHERE agent_a_id = LEAST($1::uuid, $2::uuid)
+              AND agent_b_id = GREATEST($1::uuid, $2::uuid)
+              AND status = 'active'
+        """
+
+_SQL_UPDATE_SESSION_STATUS = """
+            UPDATE sessions
+            SET status = $1, updated_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+        """
+
+_SQL_SET_LOCKED_AGENT = """
+            UPDATE sessions
+            SET locked_agent_id = $1, updated_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+        """
+
+_SQL_UPDATE_STATUS_AND_LOCK = """
+            UPDATE sessions
+            SET status = $1, locked_agent_id = $2, updated_at = CURRENT_TIMESTAMP
+            WHERE id = $3
+        """
+
+_SQL_END_SESSION = """
+            UPDATE sessions
+            SET status = $1, ended_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE id = $2
+        """
+
+_SQL_GET_AGENT_SESSIONS = """
+            SELECT id, agent_a_id, agent_b_id, status,
+                   locked_agent_id, created_at, updated_at, ended_at
+            FROM sessions
+            WHERE (agent_a_id = $1 OR agent_b_id = $1)
+              AND ($2::text IS NULL OR status = $2)
+            ORDER BY created_at DESC
+        """
+
+_SQL_GET_CONVERSATION_HISTORY = """
+            SELECT 
+                m.id,
+                m.sender_id,
+                a_sender.external_id as sender_name,
+                m.message_type,
+                m.content,
+                m.read_at,
+                m.created_at
+            FROM messages m
+            LEFT JOIN agents a_sender ON m.sender_id = a_sender.id
+            WHERE m.session_id = $1
+            ORDER BY m.created_at ASC, m.id ASC
+            LIMIT $2
+        """
+
+_SQL_GET_CONVERSATION_HISTORY_AFTER = """
+            SELECT 
+                m.id,
+                m.sender_id,
+                a_sender.external_id as sender_name,
+                m.message_type,
+                m.content,
+                m.read_at,
+                m.created_at
+            FROM messages m
+            LEFT JOIN agents a_sender ON m.sender_id = a_sender.id
+            WHERE m.session_id = $1 AND (m.created_at, m.id) > ($2, $3)
+            ORDER BY m.created_at ASC, m.id ASC
+            LIMIT $4
+        """
+
+_SQL_GET_SESSION_WITH_HISTORY = """
+            SELECT
+                s.id,
+                s.agent_a_id,
+                s.agent_b_id,
+                s.status,
+                s.locked_agent_id,
+                s.created_at,
+                s.updated_at,
+                s.ended_at,
+                m.id as message_id,
+                m.sender_id,
+                a_sender.external_id as sender_name,
+                m.message_type,
+                m.content,
+                m.read_at,
+                m.created_at as message_created_at
+            FROM sessions s
+            LEFT JOIN messages m ON m.session_id = s.id
+            LEFT JOIN agents a_sender ON m.sender_id = a_sender.id
+            WHERE s.id = $1
+            ORDER BY m.created_at ASC, m.id ASC
+        """
+
+_SQL_GET_SESSION_INFO = """
+            SELECT 
+                s.id,
+                s.agent_a_id,
+                a_a.external_id as agent_a_name,
+                s.agent_b_id,
+                a_b.external_id as agent_b_name,
+                s.status,
+                s.locked_agent_id,
+                s.created_at,
+                s.updated_at,
+                s.ended_at,
+                COALESCE(st.message_count, 0)::bigint as message_count,
+                COALESCE(st.message_count - st.unread_count, 0)::bigint as read_count
+            FROM sessions s
+            LEFT JOIN agents a_a ON s.agent_a_id = a_a.id
+            LEFT JOIN agents a_b ON s.agent_b_id = a_b.id
+            LEFT JOIN LATERAL (
+                SELECT SUM(sent_count) as message_count, SUM(unread_count) as unread_count
+                FROM session_agent_stats
+                WHERE session_id = s.id
+            ) st ON true
+            WHERE s.id = $1
+        """
+
+_SQL_GET_SESSION_STATISTICS = """
+            SELECT 
+                COUNT(*) as total_conversations,
+                COALESCE(SUM(COALESCE(me.sent_count, 0) + COALESCE(them.sent_count, 0)), 0)::bigint
+                    as total_messages,
+                COALESCE(SUM(me.unread_count), 0)::bigint as unread_count,
+                COALESCE(SUM(me.sent_count), 0)::bigint as sent_count,
+                COALESCE(SUM(them.sent_count), 0)::bigint as received_count,
+                COUNT(*) FILTER (WHERE them.sent_count > 0)
+                    + COALESCE(MAX(CASE WHEN me.sent_count > 0 THEN 1 ELSE 0 END), 0)
+                    as unique_senders,
+                COUNT(*) FILTER (WHERE me.sent_count > 0)
+                    + COALESCE(MAX(CASE WHEN them.sent_count > 0 THEN 1 ELSE 0 END), 0)
+                    as unique_recipients
+            FROM sessions s
+            LEFT JOIN session_agent_stats me
+                ON me.session_id = s.id AND me.agent_id = $1
+            LEFT JOIN session_agent_stats them
+                ON them.session_id = s.id
+                AND them.agent_id = CASE WHEN s.agent_a_id = $1
+                    THEN s.agent_b_id ELSE s.agent_a_id END
+            WHERE s.agent_a_id = $1 OR s.agent_b_id = $1
+        """
+
 
 class SessionRepository(BaseRepository):
     """Repository for session-related database operations."""
@@ -17,6 +205,9 @@ class SessionRepository(BaseRepository):
     ) -> UUID:
         """Create a new session between two agents.
 
+        The pair is stored as agent_a_id < agent_b_id (enforced by the
+        sessions_agent_order CHECK); the query orders it with LEAST/GREATEST.
+
         Args:
             agent_a_id: First agent UUID
             agent_b_id: Second agent UUID
@@ -24,24 +215,35 @@ class SessionRepository(BaseRepository):
         Returns:
             UUID of the created session
         """
-        # Ensure consistent ordering: agent_a_id < agent_b_id
-        if agent_a_id > agent_b_id:
-            agent_a_id, agent_b_id = agent_b_id, agent_a_id
+        result = await self._fetch_one(
+            _SQL_CREATE_SESSION,
+            [agent_a_id, agent_b_id, _STATUS_ACTIVE],
+        )
+        return result["id"]
 
-        query = """
-            INSERT INTO sessions (agent_a_id, agent_b_id, status)
-            VALUES ($1, $2, $3)
-            RETURNING id
+    async def create_many(self, pairs: Sequence[Tuple[UUID, UUID]]) -> List[UUID]:
+        """Create sessions for several agent pairs in one statement.
+
+        Args:
+            pairs: (agent, agent) UUID pairs; each pair is ordered as in create()
+
+        Returns:
+            UUIDs of the created sessions, in the same order as pairs
         """
-        result = await self._fetch_one(
-            query,
-            [agent_a_id, agent_b_id, SessionStatus.ACTIVE.value],
+        if not pairs:
+            return []
+
+        ordered = [(a, b) if a < b else (b, a) for a, b in pairs]
+        rows = await self._fetch_all(
+            _SQL_CREATE_SESSIONS_BULK,
+            (
+                [a for a, _ in ordered],
+                [b for _, b in ordered],
+                _STATUS_ACTIVE,
+            ),
         )
-        # psqlpy returns UUID as a string or UUID object depending on version
-        session_id = result["id"]
-        if isinstance(session_id, str):
-            session_id = UUID(session_id)
-        return session_id
+        ids = {(row["agent_a_id"], row["agent_b_id"]): row["id"] for row in rows}
+        return [ids[pair] for pair in ordered]
 
     async def get_by_id(self, session_id: UUID) -> Optional[Session]:
         """Get session by ID.
@@ -52,13 +254,7 @@ class SessionRepository(BaseRepository):
         Returns:
             Session if found, None otherwise
         """
-        query = """
-            SELECT id, agent_a_id, agent_b_id, status,
-                   locked_agent_id, created_at, updated_at, ended_at
-            FROM sessions
-            WHERE id = $1
-        """
-        result = await self._fetch_one(query, [session_id])
+        result = await self._fetch_one(_SQL_GET_SESSION_BY_ID, [session_id])
         return self._session_from_db(result) if result else None
 
     async def get_active_session(
@@ -66,7 +262,7 @@ class SessionRepository(BaseRepository):
         agent_id_1: UUID,
         agent_id_2: UUID,
     ) -> Optional[Session]:
-        """Get active session between two agents.
+        """Get active session between two agents, in either order.
 
         Args:
             agent_id_1: First agent UUID
@@ -75,20 +271,7 @@ class SessionRepository(BaseRepository):
         Returns:
             Session if found and active, None otherwise
         """
-        # Ensure consistent ordering
-        if agent_id_1 > agent_id_2:
-            agent_id_1, agent_id_2 = agent_id_2, agent_id_1
-
-        query = """
-            SELECT id, agent_a_id, agent_b_id, status,
-                   locked_agent_id, created_at, updated_at, ended_at
-            FROM sessions
-            WHERE agent_a_id = $1 AND agent_b_id = $2 AND status = $3
-        """
-        result = await self._fetch_one(
-            query,
-            [agent_id_1, agent_id_2, SessionStatus.ACTIVE.value],
-        )
+        result = await self._fetch_one(_SQL_GET_ACTIVE_SESSION, [agent_id_1, agent_id_2])
         return self._session_from_db(result) if result else None
 
     async def update_status(self, session_id: UUID, status: SessionStatus) -> None:
@@ -98,12 +281,7 @@ class SessionRepository(BaseRepository):
             session_id: Session UUID
             status: New status
         """
-        query = """
-            UPDATE sessions
-            SET status = $1, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $2
-        """
-        await self._execute(query, [status.value, session_id])
+        await self._execute(_SQL_UPDATE_SESSION_STATUS, [status.value, session_id])
 
     async def set_locked_agent(self, session_id: UUID, agent_id: Optional[UUID]) -> None:
         """Set or clear the locked agent for a session.
@@ -112,12 +290,25 @@ class SessionRepository(BaseRepository):
             session_id: Session UUID
             agent_id: Agent UUID (None to clear lock)
         """
-        query = """
-            UPDATE sessions
-            SET locked_agent_id = $1, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $2
+        await self._execute(_SQL_SET_LOCKED_AGENT, [agent_id, session_id])
+
+    async def update_status_and_lock(
+        self,
+        session_id: UUID,
+        status: SessionStatus,
+        agent_id: Optional[UUID],
+    ) -> None:
+        """Set the status and the locked agent of a session in one statement.
+
+        Replaces an update_status plus set_locked_agent pair: one round trip
+        and one new row version instead of two.
+
+        Args:
+            session_id: Session UUID
+            status: New status
+            agent_id: Agent UUID (None to clear lock)
         """
-        await self._execute(query, [agent_id if agent_id else None, session_id])
+        await self._execute(_SQL_UPDATE_STATUS_AND_LOCK, [status.value, agent_id, session_id])
 
     async def end_session(self, session_id: UUID) -> None:
         """End a session.
@@ -125,99 +316,139 @@ class SessionRepository(BaseRepository):
         Args:
             session_id: Session UUID
         """
-        query = """
-            UPDATE sessions
-            SET status = $1, ended_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-            WHERE id = $2
-        """
-        await self._execute(query, [SessionStatus.ENDED.value, session_id])
+        await self._execute(_SQL_END_SESSION, [_STATUS_ENDED, session_id])
 
     async def get_agent_sessions(
         self,
         agent_id: UUID,
+        status: Optional[SessionStatus] = None,
     ) -> List[Session]:
         """Get all sessions for an agent.
 
+        Filtered and unfiltered calls share one prepared statement; a NULL
+        status disables the filter.
+
         Args:
             agent_id: Agent UUID
+            status: Optional status to filter by
 
         Returns:
             List of sessions
         """
-        query = """
-            SELECT id, agent_a_id, agent_b_id, status,
-                   locked_agent_id, created_at, updated_at, ended_at
-            FROM sessions
-            WHERE agent_a_id = $1 OR agent_b_id = $1
-            ORDER BY created_at DESC
-        """
-        results = await self._fetch_all(query, [agent_id])
-
-        return [self._session_from_db(result) for result in results]
+        rows = await self._fetch_tuples(
+            _SQL_GET_AGENT_SESSIONS, [agent_id, status.value if status is not None else None]
+        )
+        return [self._session_from_tuple(row) for row in rows]
 
     async def get_conversation_history(
         self,
         session_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get full conversation history for a session with message details.
+        """Get conversation history for a session with message details.
+
+        Pages walk the (session_id, created_at, id) index: pass the
+        ``(created_at, id)`` of the last message of one page as ``after`` to
+        fetch the next.
 
         Args:
             session_id: Session UUID
+            after: Optional (created_at, id) keyset cursor; only later messages
+                are returned
+            limit: Maximum number of messages (None for the whole history)
 
         Returns:
             List of messages with sender names, ordered by creation time
         """
-        query = """
-            SELECT 
-                m.id,
-                m.sender_id,
-                a_sender.external_id as sender_name,
-                m.message_type,
-                m.content,
-                m.read_at,
-                m.created_at
-            FROM messages m
-            LEFT JOIN agents a_sender ON m.sender_id = a_sender.id
-            WHERE m.session_id = $1
-            ORDER BY m.created_at ASC
-        """
-        results = await self._fetch_all(query, [session_id])
+        if after is None:
+            results = await self._fetch_all(_SQL_GET_CONVERSATION_HISTORY, [session_id, limit])
+        else:
+            results = await self._fetch_all(
+                _SQL_GET_CONVERSATION_HISTORY_AFTER, [session_id, after[0], after[1], limit]
+            )
         return results if results else []
 
+    async def iter_conversation_history(
+        self,
+        session_id: UUID,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        chunk: int = 200,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream conversation history through a server-side cursor.
+
+        Holds only ``chunk`` rows in memory at a time, so long conversations
+        can be exported or replayed without materializing them.
+
+        Args:
+            session_id: Session UUID
+            after: Optional (created_at, id) keyset cursor; only later messages
+                are returned
+            chunk: Rows fetched per round trip
+
+        Yields:
+            Messages with sender names, ordered by creation time
+        """
+        if after is None:
+            query, params = _SQL_GET_CONVERSATION_HISTORY, [session_id, None]
+        else:
+            query = _SQL_GET_CONVERSATION_HISTORY_AFTER
+            params = [session_id, after[0], after[1], None]
+        async for row in self._iter_rows(query, params, fetch_number=chunk):
+            yield row
+
+    async def get_session_with_history(
+        self,
+        session_id: UUID,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a session and its conversation history in one round trip.
+
+        Prefer this over ``get_by_id`` followed by ``get_conversation_history``
+        when both are needed. Session columns repeat on every message row and
+        are parsed once from the first.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Dictionary with ``session`` (Session) and ``messages`` (same shape as
+            ``get_conversation_history``), or None if the session does not exist
+        """
+        results = await self._fetch_all(_SQL_GET_SESSION_WITH_HISTORY, [session_id])
+        if not results:
+            return None
+
+        messages = [
+            {
+                "id": row["message_id"],
+                "sender_id": row["sender_id"],
+                "sender_name": row["sender_name"],
+                "message_type": row["message_type"],
+                "content": row["content"],
+                "read_at": row["read_at"],
+                "created_at": row["message_created_at"],
+            }
+            for row in results
+            if row["message_id"] is not None
+        ]
+        return {"session": self._session_from_db(results[0]), "messages": messages}
+
     async def get_session_info(
         self,
         session_id: UUID,
     ) -> Optional[Dict[str, Any]]:
         """Get detailed session information including participants and message count.
 
+        Counts come from the session's two session_agent_stats rows (migration
+        014) rather than from aggregating its messages.
+
         Args:
             session_id: Session UUID
 
         Returns:
             Dictionary with session details or None if not found
         """
-        query = """
-            SELECT 
-                s.id,
-                s.agent_a_id,
-                a_a.external_id as agent_a_name,
-                s.agent_b_id,
-                a_b.external_id as agent_b_name,
-                s.status,
-                s.locked_agent_id,
-                s.created_at,
-                s.updated_at,
-                s.ended_at,
-                COUNT(m.id) as message_count,
-                SUM(CASE WHEN m.read_at IS NOT NULL THEN 1 ELSE 0 END) as read_count
-            FROM sessions s
-            LEFT JOIN agents a_a ON s.agent_a_id = a_a.id
-            LEFT JOIN agents a_b ON s.agent_b_id = a_b.id
-            LEFT JOIN messages m ON s.id = m.session_id
-            WHERE s.id = $1
-            GROUP BY s.id, a_a.id, a_b.id
-        """
-        result = await self._fetch_one(query, [session_id])
+        result = await self._fetch_one(_SQL_GET_SESSION_INFO, [session_id])
         return result if result else None
 
     async def get_session_statistics(
@@ -226,26 +457,16 @@ class SessionRepository(BaseRepository):
     ) -> Dict[str, Any]:
         """Get message statistics for an agent across all sessions.
 
+        Reads the trigger-maintained ``session_agent_stats`` counters (migration
+        014), two rows per session, instead of aggregating every message.
+
         Args:
             agent_id: Agent UUID
 
         Returns:
             Dictionary with statistics (message_count, unread_count, total_conversations, etc.)
         """
-        query = """
-            SELECT 
-                COUNT(DISTINCT s.id) as total_conversations,
-                COUNT(m.id) as total_messages,
-                SUM(CASE WHEN m.read_at IS NULL AND m.recipient_id = $1 THEN 1 ELSE 0 END) as unread_count,
-                SUM(CASE WHEN m.sender_id = $1 THEN 1 ELSE 0 END) as sent_count,
-                SUM(CASE WHEN m.recipient_id = $1 THEN 1 ELSE 0 END) as received_count,
-                COUNT(DISTINCT m.sender_id) as unique_senders,
-                COUNT(DISTINCT m.recipient_id) as unique_recipients
-            FROM sessions s
-            LEFT JOIN messages m ON (s.id = m.session_id)
-            WHERE s.agent_a_id = $1 OR s.agent_b_id = $1
-        """
-        result = await self._fetch_one(query, [agent_id])
+        result = await self._fetch_one(_SQL_GET_SESSION_STATISTICS, [agent_id])
         return (
             result
             if result
@@ -269,13 +490,36 @@ class SessionRepository(BaseRepository):
         Returns:
             Session instance
         """
-        return Session(
-            id=result["id"],
-            agent_a_id=result["agent_a_id"],
-            agent_b_id=result["agent_b_id"],
-            status=SessionStatus(result["status"]),
-            locked_agent_id=result["locked_agent_id"],
-            created_at=result["created_at"],
-            updated_at=result["updated_at"],
-            ended_at=result["ended_at"],
+        return self._session_from_tuple(_session_row_values(result))
+
+    def _session_from_tuple(self, row: Tuple[Any, ...]) -> Session:
+        """Convert a row in _session_row_values column order to Session model.
+
+        Rows come from the driver already typed, so validation is skipped.
+
+        Args:
+            row: Session column values
+
+        Returns:
+            Session instance
+        """
+        (
+            session_id,
+            agent_a_id,
+            agent_b_id,
+            status,
+            locked_agent_id,
+            created_at,
+            updated_at,
+            ended_at,
+        ) = row
+        return Session.model_construct(
+            id=session_id,
+            agent_a_id=agent_a_id,
+            agent_b_id=agent_b_id,
+            status=_SESSION_STATUS_BY_VALUE[status],
+            locked_agent_id=locked_agent_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            ended_at=ended_at,
         )
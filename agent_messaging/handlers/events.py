@@ -21,6 +21,8 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+_now = datetime.now
+
 # Union type for all event data types
 MeetingEventData = Union[
     MeetingStartedEventData,
@@ -38,6 +40,8 @@ MeetingEventData = Union[
 class MeetingEvent:
     """Container for a meeting event with type-safe data."""
 
+    __slots__ = ("meeting_id", "event_type", "data", "timestamp")
+
     def __init__(
         self,
         meeting_id: UUID,
@@ -56,7 +60,7 @@ class MeetingEvent:
         self.meeting_id = meeting_id
         self.event_type = event_type
         self.data = data
-        self.timestamp = timestamp or datetime.now()
+        self.timestamp = timestamp or _now()
 
 
 class MeetingEventHandler:
@@ -83,10 +87,7 @@ class MeetingEventHandler:
                 data: MeetingStartedEventData = event.data
                 print(f"Meeting {event.meeting_id} started by {data.host_id}")
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-
-        self._handlers[event_type].append(handler)
+        self._handlers.setdefault(event_type, []).append(handler)
         logger.debug(f"Registered handler for event type: {event_type}")
 
     def unregister_handler(
@@ -100,9 +101,10 @@ class MeetingEventHandler:
             event_type: Type of meeting event
             handler: Handler function to remove
         """
-        if event_type in self._handlers:
+        handlers = self._handlers.get(event_type)
+        if handlers is not None:
             try:
-                self._handlers[event_type].remove(handler)
+                handlers.remove(handler)
                 logger.debug(f"Unregistered handler for event type: {event_type}")
             except ValueError:
                 logger.warning(f"Handler not found for event type: {event_type}")
@@ -120,27 +122,26 @@ class MeetingEventHandler:
             event_type: Type of event
             data: Type-safe event data
         """
-        event = MeetingEvent(
-            meeting_id=meeting_id,
-            event_type=event_type,
-            data=data,
-        )
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            event = MeetingEvent(
+                meeting_id=meeting_id,
+                event_type=event_type,
+                data=data,
+            )
 
-        # Call all handlers for this event type
-        if event_type in self._handlers:
-            tasks = []
-            for handler in self._handlers[event_type]:
+            if len(handlers) == 1:
+                # Common case: await the only handler directly, no Task or gather
                 try:
-                    # Create task for each handler to run concurrently
-                    task = asyncio.create_task(handler(event))
-                    tasks.append(task)
+                    await handlers[0](event)
                 except Exception as e:
-                    logger.error(f"Error creating task for event handler: {e}")
-
-            # Wait for all handlers to complete
-            if tasks:
+                    logger.error(f"Error in event handler for {event_type}: {e}")
+            else:
+                # gather wraps each coroutine in a Task, running handlers concurrently
                 try:
-                    await asyncio.gather(*tasks, return_exceptions=True)
+                    await asyncio.gather(
+                        *(handler(event) for handler in handlers), return_exceptions=True
+                    )
                 except Exception as e:
                     logger.error(f"Error in event handlers for {event_type}: {e}")
 
@@ -153,6 +154,8 @@ class MeetingEventHandler:
         participant_ids: List[UUID],
     ) -> None:
         """Emit meeting started event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.MEETING_STARTED):
+            return
         data = MeetingStartedEventData(
             host_id=host_id,
             participant_ids=participant_ids,
@@ -169,6 +172,8 @@ class MeetingEventHandler:
         host_id: UUID,
     ) -> None:
         """Emit meeting ended event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.MEETING_ENDED):
+            return
         data = MeetingEndedEventData(host_id=host_id)
         await self.emit_event(
             meeting_id=meeting_id,
@@ -183,6 +188,8 @@ class MeetingEventHandler:
         current_speaker_id: UUID = None,
     ) -> None:
         """Emit turn changed event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.TURN_CHANGED):
+            return
         data = TurnChangedEventData(
             previous_speaker_id=previous_speaker_id,
             current_speaker_id=current_speaker_id,
@@ -199,6 +206,8 @@ class MeetingEventHandler:
         agent_id: UUID,
     ) -> None:
         """Emit participant joined event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.PARTICIPANT_JOINED):
+            return
         data = ParticipantJoinedEventData(agent_id=agent_id)
         await self.emit_event(
             meeting_id=meeting_id,
@@ -212,6 +221,8 @@ class MeetingEventHandler:
         agent_id: UUID,
     ) -> None:
         """Emit participant left event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.PARTICIPANT_LEFT):
+            return
         data = ParticipantLeftEventData(agent_id=agent_id)
         await self.emit_event(
             meeting_id=meeting_id,
@@ -226,6 +237,8 @@ class MeetingEventHandler:
         next_speaker_id: UUID,
     ) -> None:
         """Emit timeout occurred event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.TIMEOUT_OCCURRED):
+            return
         data = TimeoutOccurredEventData(
             timed_out_agent_id=timed_out_agent_id,
             next_speaker_id=next_speaker_id,
@@ -244,11 +257,13 @@ class MeetingEventHandler:
         content: Dict[str, Any],
     ) -> None:
         """Emit message posted event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.MESSAGE_POSTED):
+            return
         data = MessagePostedEventData(
             message_id=message_id,
             sender_id=sender_id,
             content=content,
-            timestamp=datetime.now(),
+            timestamp=_now(),
         )
         await self.emit_event(
             meeting_id=meeting_id,
@@ -264,6 +279,8 @@ class MeetingEventHandler:
         current_status: str,
     ) -> None:
         """Emit participant status changed event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.PARTICIPANT_STATUS_CHANGED):
+            return
         data = ParticipantStatusChangedEventData(
             agent_id=agent_id,
             previous_status=previous_status,
@@ -283,11 +300,13 @@ class MeetingEventHandler:
         affected_agent_id: Optional[UUID] = None,
     ) -> None:
         """Emit error occurred event with type-safe data."""
+        if not self._handlers.get(MeetingEventType.ERROR_OCCURRED):
+            return
         data = ErrorOccurredEventData(
             error_type=error_type,
             error_message=error_message,
             affected_agent_id=affected_agent_id,
-            timestamp=datetime.now(),
+            timestamp=_now(),
         )
         await self.emit_event(
             meeting_id=meeting_id,
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import threading
 from typing import Any, Dict, Optional
 
 from .types import HandlerContext, MessageContext, AnyHandler
@@ -12,6 +13,12 @@ _handlers: Dict[HandlerContext, AnyHandler] = {}
 _background_tasks: set = set()
 _handler_timeout: float = 30.0
 
+# Event loop on a daemon thread that runs invoke_handler calls made from inside
+# a running loop; started on first use and reused instead of a thread + loop per call
+_bridge_loop: Optional[asyncio.AbstractEventLoop] = None
+_bridge_thread: Optional[threading.Thread] = None
+_bridge_lock = threading.Lock()
+
 
 def set_handler_timeout(timeout: float) -> None:
     """Set the default handler timeout."""
@@ -110,23 +117,61 @@ def invoke_handler(
     context: MessageContext,
     timeout: Optional[float] = None,
 ) -> Optional[Any]:
-    """Invoke a handler synchronously (blocking)."""
+    """Invoke a handler synchronously (blocking).
+
+    With no running event loop the handler runs under asyncio.run. From
+    inside a running loop it runs on a shared background bridge loop. A
+    call made on the bridge loop itself, such as a bridged handler calling
+    invoke_handler again, runs on a fresh loop in a one-off thread instead
+    of blocking the bridge loop on its own work.
+    """
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
         loop = None
 
-    if loop is not None:
+    if loop is None:
+        return asyncio.run(invoke_handler_async(handler_context, message, context, timeout))
+
+    bridge_loop = _get_bridge_loop()
+    if loop is bridge_loop:
         import concurrent.futures
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
                 asyncio.run,
                 invoke_handler_async(handler_context, message, context, timeout),
+            ).result()
+    future = asyncio.run_coroutine_threadsafe(
+        invoke_handler_async(handler_context, message, context, timeout), bridge_loop
+    )
+    return future.result()
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Return the bridge event loop, starting its thread on first use."""
+    global _bridge_loop, _bridge_thread
+    with _bridge_lock:
+        if _bridge_loop is None:
+            _bridge_loop = asyncio.new_event_loop()
+            _bridge_thread = threading.Thread(
+                target=_bridge_loop.run_forever, name="agent-messaging-handler-bridge", daemon=True
             )
-            return future.result()
-    else:
-        return asyncio.run(invoke_handler_async(handler_context, message, context, timeout))
+            _bridge_thread.start()
+        return _bridge_loop
+
+
+def _stop_bridge_loop() -> None:
+    """Stop and close the bridge event loop if it was started."""
+    global _bridge_loop, _bridge_thread
+    with _bridge_lock:
+        if _bridge_loop is None:
+            return
+        _bridge_loop.call_soon_threadsafe(_bridge_loop.stop)
+        _bridge_thread.join()
+        _bridge_loop.close()
+        _bridge_loop = None
+        _bridge_thread = None
 
 
 def clear_handlers() -> None:
@@ -143,4 +188,5 @@ async def shutdown() -> None:
     if _background_tasks:
         await asyncio.gather(*_background_tasks, return_exceptions=True)
     _background_tasks.clear()
+    await asyncio.to_thread(_stop_bridge_loop)
     logger.info("Handler registry shutdown complete")
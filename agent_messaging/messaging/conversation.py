@@ -668,8 +668,7 @@ class Conversation(Generic[T_Conversation]):
         messages = await self._message_repo.get_unread_messages(agent.id)
 
         # Mark messages as read
-        for message in messages:
-            await self._message_repo.mark_as_read(message.id)
+        await self._message_repo.mark_many_as_read([message.id for message in messages])
 
         # Deserialize content
         result = []
@@ -844,36 +843,42 @@ class Conversation(Generic[T_Conversation]):
         # Note: organization_id is set to org UUID as string since we don't have access to org repo
         org_external_id = str(agent.organization_id)
 
-        # Process each pending message
-        for message in pending_messages:
-            # Create message context
-            sender = await self._agent_repo.get_by_id(message.sender_id)
-            if not sender:
-                logger.warning(f"Sender not found for message {message.id}")
-                continue
+        # Process each pending message, collecting ids to mark read in one batch.
+        # Dispatched messages are marked even if a later one fails, so they are
+        # not delivered again on the next resume.
+        processed_ids = []
+        try:
+            for message in pending_messages:
+                # Create message context
+                sender = await self._agent_repo.get_by_id(message.sender_id)
+                if not sender:
+                    logger.warning(f"Sender not found for message {message.id}")
+                    continue
 
-            context = MessageContext(
-                sender_id=sender.external_id,
-                receiver_id=agent_external_id,
-                organization_id=org_external_id,
-                handler_context=HandlerContext.CONVERSATION,
-                message_id=message.id,
-                session_id=str(message.session_id) if message.session_id else None,
-            )
-            # Deserialize message content
-            content = self._deserialize_content(message.content)
+                context = MessageContext(
+                    sender_id=sender.external_id,
+                    receiver_id=agent_external_id,
+                    organization_id=org_external_id,
+                    handler_context=HandlerContext.CONVERSATION,
+                    message_id=message.id,
+                    session_id=str(message.session_id) if message.session_id else None,
+                )
+                # Deserialize message content
+                content = self._deserialize_content(message.content)
 
-            # Invoke handler - run in background task
-            asyncio.create_task(
-                invoke_handler_async(
-                    HandlerContext.CONVERSATION,
-                    content,
-                    context,
+                # Invoke handler - run in background task
+                asyncio.create_task(
+                    invoke_handler_async(
+                        HandlerContext.CONVERSATION,
+                        content,
+                        context,
+                    )
                 )
-            )
 
-            # Mark message as read (processed)
-            await self._message_repo.mark_as_read(message.id)
+                processed_ids.append(message.id)
+        finally:
+            if processed_ids:
+                await self._message_repo.mark_many_as_read(processed_ids)
 
         logger.info(
             f"Resumed agent {agent_external_id} with {len(pending_messages)} pending messages"
@@ -924,16 +929,14 @@ class Conversation(Generic[T_Conversation]):
         if not agent:
             raise AgentNotFoundError(f"Agent not found: {agent_external_id}")
 
-        # Get all sessions for this agent (both as agent_a and agent_b)
-        all_sessions = await self._session_repo.get_agent_sessions(agent.id)
+        # Get active sessions for this agent (both as agent_a and agent_b)
+        sessions = await self._session_repo.get_agent_sessions(
+            agent.id, status=SessionStatus.ACTIVE
+        )
 
-        # Filter for active sessions and build response with other agent info
+        # Build response with other agent info
         active_sessions = []
-        for session in all_sessions:
-            # Skip ended sessions
-            if session.status != SessionStatus.ACTIVE:
-                continue
-
+        for session in sessions:
             # Determine the other agent ID
             other_agent_id = (
                 session.agent_b_id if session.agent_a_id == agent.id else session.agent_a_id
@@ -177,13 +177,13 @@ class MeetingManager(Generic[T_Meeting]):
         if not organizer:
             raise AgentNotFoundError(f"Organizer agent '{organizer_external_id}' not found")
 
-        # Validate all participants exist
-        participants = []
-        for participant_id in participant_external_ids:
-            participant = await self._agent_repo.get_by_external_id(participant_id)
+        # Validate all participants exist (lookups are independent, run them concurrently)
+        participants = await asyncio.gather(
+            *(self._agent_repo.get_by_external_id(pid) for pid in participant_external_ids)
+        )
+        for participant_id, participant in zip(participant_external_ids, participants):
             if not participant:
                 raise AgentNotFoundError(f"Participant agent '{participant_id}' not found")
-            participants.append(participant)
 
         # Create the meeting
         meeting_id = await self._meeting_repo.create(
@@ -191,13 +191,11 @@ class MeetingManager(Generic[T_Meeting]):
             turn_duration=turn_duration,
         )
 
-        # Add participants to the meeting
-        for i, participant in enumerate(participants):
-            await self._meeting_repo.add_participant(
-                meeting_id=meeting_id,
-                agent_id=participant.id,
-                join_order=i,
-            )
+        # Add all participants in one round trip; join order follows the list order
+        await self._meeting_repo.add_participants_bulk(
+            meeting_id=meeting_id,
+            agent_ids=[participant.id for participant in participants],
+        )
 
         logger.info(
             f"Created meeting {meeting_id} with organizer {organizer_external_id} "
@@ -900,6 +898,8 @@ class MeetingManager(Generic[T_Meeting]):
                 f"Agent '{agent_external_id}' is not a participant in meeting {meeting_id}"
             )
 
+        status_updated = False
+
         # If it's currently their turn, wait for turn to complete or timeout
         if meeting.current_speaker_id == agent.id and meeting.status == MeetingStatus.ACTIVE:
             # Cancel their timeout and advance to next speaker
@@ -917,12 +917,14 @@ class MeetingManager(Generic[T_Meeting]):
                 # Select next speaker (first in remaining list)
                 next_speaker = attending_participants[0]
 
-                # Update current speaker
-                await self._meeting_repo.set_current_speaker(
+                # Mark the agent as left and pass the turn in one round trip
+                await self._meeting_repo.advance_turn(
                     meeting_id=meeting_id,
-                    agent_id=next_speaker.agent_id,
-                    turn_started=True,
+                    participant_id=participant.id,
+                    participant_status=ParticipantStatus.LEFT,
+                    next_agent_id=next_speaker.agent_id,
                 )
+                status_updated = True
 
                 # Start timeout for next speaker
                 await self._timeout_manager.start_turn_timeout(
@@ -940,11 +942,12 @@ class MeetingManager(Generic[T_Meeting]):
                     f"Agent {agent_external_id} left meeting {meeting_id} but no other participants remain"
                 )
 
-        # Update participant status to LEFT
-        await self._meeting_repo.update_participant_status(
-            participant_id=participant.id,
-            status=ParticipantStatus.LEFT,
-        )
+        # Update participant status to LEFT unless advance_turn already did
+        if not status_updated:
+            await self._meeting_repo.update_participant_status(
+                participant_id=participant.id,
+                status=ParticipantStatus.LEFT,
+            )
 
         # Emit participant left event
         await self._event_handler.emit_participant_left(
@@ -1039,9 +1042,18 @@ class MeetingManager(Generic[T_Meeting]):
             WHERE meeting_id = $1
             ORDER BY created_at ASC
         """
-        results = await self._message_repo._execute(query, [str(meeting_id)])
+        results = await self._message_repo._execute(query, (meeting_id,))
         rows = results.result()
 
+        # Burst messages often share a timestamp; format each distinct one once
+        iso_cache: Dict[Any, str] = {}
+
+        def iso(dt: Any) -> str:
+            formatted = iso_cache.get(dt)
+            if formatted is None:
+                formatted = iso_cache[dt] = dt.isoformat()
+            return formatted
+
         messages = []
         for row in rows:
             messages.append(
@@ -1050,7 +1062,7 @@ class MeetingManager(Generic[T_Meeting]):
                     "sender_id": str(row["sender_id"]) if row["sender_id"] else None,
                     "message_type": row["message_type"],
                     "content": row["content"],
-                    "created_at": row["created_at"].isoformat(),
+                    "created_at": iso(row["created_at"]),
                     "metadata": row["metadata"],
                 }
             )
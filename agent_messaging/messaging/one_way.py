@@ -146,18 +146,23 @@ class OneWayMessenger(Generic[T_OneWay]):
         sender_org = await self._org_repo.get_by_id(sender.organization_id)
         org_external_id = sender_org.external_id if sender_org else "unknown"
 
-        # Send to all recipients
-        message_ids = []
-        for recipient_external_id, recipient in recipients:
-            # Store message in database
-            message_id = await self._message_repo.create(
-                sender_id=sender.id,
-                recipient_id=recipient.id,
-                content=content_dict,
-                message_type=MessageType.USER_DEFINED,
-                metadata=metadata or {},
-            )
+        # Store one message per recipient in a single batch
+        stored_ids = await self._message_repo.create_many(
+            [
+                {
+                    "sender_id": sender.id,
+                    "recipient_id": recipient.id,
+                    "content": content_dict,
+                    "message_type": MessageType.USER_DEFINED,
+                    "metadata": metadata or {},
+                }
+                for _, recipient in recipients
+            ]
+        )
 
+        # Notify each recipient
+        message_ids = []
+        for (recipient_external_id, recipient), message_id in zip(recipients, stored_ids):
             # Create message context
             context = MessageContext(
                 sender_id=sender_external_id,
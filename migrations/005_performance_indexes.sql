@@ -47,23 +47,23 @@ COMMENT ON INDEX idx_messages_meeting_type_created IS
 -- Partial Indexes for Active Entities
 -- ============================================================================
 
--- 5. Active sessions only (in_progress status)
+-- 5. Active sessions only
 -- Much smaller index, faster queries for active sessions
 CREATE INDEX IF NOT EXISTS idx_sessions_active
 ON sessions (agent_a_id, agent_b_id, created_at DESC)
-WHERE status = 'in_progress';
+WHERE status = 'active';
 
 COMMENT ON INDEX idx_sessions_active IS
-'Optimizes queries for active (in_progress) sessions only';
+'Optimizes queries for active sessions only';
 
--- 6. Active meetings only (in_progress status)
+-- 6. Active meetings only
 -- Faster lookups for ongoing meetings
 CREATE INDEX IF NOT EXISTS idx_meetings_active
 ON meetings (host_id, created_at DESC)
-WHERE status = 'in_progress';
+WHERE status = 'active';
 
 COMMENT ON INDEX idx_meetings_active IS
-'Optimizes queries for active (in_progress) meetings only';
+'Optimizes queries for active meetings only';
 
 -- 7. Attending meeting participants
 -- Faster queries for who is currently in a meeting
@@ -185,7 +185,7 @@ ANALYZE organizations;
 --
 -- These indexes target:
 -- - High-frequency query patterns (message filtering, session queries)
--- - Active entity queries (in_progress meetings/sessions)
+-- - Active entity queries (active meetings/sessions)
 -- - Statistical aggregations (COUNT, GROUP BY queries)
 -- - Event timelines (meeting events ordered by time)
 -- - Multi-column filters (sender + type + date)
@@ -0,0 +1,55 @@
+-- Phase 5: Meeting Analytics Performance
+-- Migration 006
+-- Created: 2026-10-17
+-- Description: Composite indexes for meeting timeline and participation analytics
+
+-- ============================================================================
+-- Ordered Meeting Scans
+-- ============================================================================
+
+-- Note: meeting_participants (meeting_id, join_order) is already covered by
+-- idx_meeting_participants_join_order (migration 001).
+
+-- 1. Meeting messages in chronological order
+-- Supports: get_meeting_timeline, get_turn_statistics (ORDER BY created_at)
+CREATE INDEX IF NOT EXISTS idx_messages_meeting_created
+ON messages (meeting_id, created_at)
+WHERE meeting_id IS NOT NULL;
+
+COMMENT ON INDEX idx_messages_meeting_created IS
+'Ordered index scan for meeting messages by creation time';
+
+-- 2. Meeting events in chronological order
+-- Supports: get_meeting_timeline (ORDER BY created_at)
+CREATE INDEX IF NOT EXISTS idx_meeting_events_meeting_created
+ON meeting_events (meeting_id, created_at);
+
+COMMENT ON INDEX idx_meeting_events_meeting_created IS
+'Ordered index scan for meeting events by creation time';
+
+-- ============================================================================
+-- Partial Indexes for Participation Analytics
+-- ============================================================================
+
+-- 3. User-defined meeting messages grouped by sender
+-- Matches the exact filter in get_participation_analysis / get_turn_statistics
+CREATE INDEX IF NOT EXISTS idx_messages_meeting_sender_user_defined
+ON messages (meeting_id, sender_id)
+WHERE message_type = 'user_defined';
+
+COMMENT ON INDEX idx_messages_meeting_sender_user_defined IS
+'Optimizes per-sender aggregation of user-defined meeting messages';
+
+-- ============================================================================
+-- Update Statistics
+-- ============================================================================
+
+ANALYZE messages;
+ANALYZE meeting_events;
+
+-- ============================================================================
+-- Performance Notes
+-- ============================================================================
+--
+-- On large live tables these can be built with CREATE INDEX CONCURRENTLY
+-- outside a transaction block to avoid blocking writes.
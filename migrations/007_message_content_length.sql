@@ -0,0 +1,18 @@
+-- Phase 5: Meeting Analytics Performance
+-- Migration 007
+-- Created: 2026-10-17
+-- Description: Stored content length on messages for aggregate queries
+
+-- ============================================================================
+-- Generated Columns
+-- ============================================================================
+
+-- 1. Cached serialized content length
+-- Supports: get_participation_analysis (SUM(content_length)) without casting
+-- every JSONB document to text at query time
+ALTER TABLE messages
+ADD COLUMN IF NOT EXISTS content_length INTEGER
+GENERATED ALWAYS AS (length(content::text)) STORED;
+
+COMMENT ON COLUMN messages.content_length IS
+'Length of content::text, computed on write for aggregate queries';
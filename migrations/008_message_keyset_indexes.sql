@@ -0,0 +1,29 @@
+-- Phase 6: Message Query Performance
+-- Migration 008
+-- Created: 2026-10-17
+-- Description: Indexes for keyset (created_at, id) pagination of message lists
+
+-- ============================================================================
+-- Keyset Pagination Indexes
+-- ============================================================================
+
+-- 1. Recipient inbox, newest first
+-- Supports: get_messages_for_recipient with a (created_at, id) "before" cursor
+CREATE INDEX IF NOT EXISTS idx_messages_recipient_created_id
+ON messages (recipient_id, created_at DESC, id DESC)
+WHERE recipient_id IS NOT NULL;
+
+COMMENT ON INDEX idx_messages_recipient_created_id IS
+'Index range scan for keyset-paginated recipient message lists';
+
+-- 2. Session history, oldest first
+-- Supports: get_messages_for_session with a (created_at, id) "after" cursor
+CREATE INDEX IF NOT EXISTS idx_messages_session_created_id
+ON messages (session_id, created_at, id)
+WHERE session_id IS NOT NULL;
+
+COMMENT ON INDEX idx_messages_session_created_id IS
+'Index range scan for keyset-paginated session message lists';
+
+-- Note: meeting history pages use idx_messages_meeting_created (migration 006);
+-- ties on created_at are resolved by an incremental sort on id.
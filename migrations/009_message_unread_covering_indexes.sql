@@ -0,0 +1,32 @@
+-- Phase 6: Message Query Performance
+-- Migration 009
+-- Created: 2026-10-17
+-- Description: Covering and compound indexes for unread and per-sender inbox queries
+
+-- ============================================================================
+-- Covering Indexes for Unread Queries
+-- ============================================================================
+
+-- 1. Unread messages per recipient, carrying the small row columns
+-- Supports: get_unread_messages, unread counts
+-- content/metadata are deliberately not INCLUDEd: B-tree entries are limited
+-- to roughly 2.7kB, so large JSONB payloads would make inserts fail.
+CREATE INDEX IF NOT EXISTS idx_messages_recipient_unread_covering
+ON messages (recipient_id, created_at)
+INCLUDE (id, sender_id, session_id, meeting_id, message_type)
+WHERE read_at IS NULL;
+
+COMMENT ON INDEX idx_messages_recipient_unread_covering IS
+'Partial covering index for unread messages per recipient';
+
+-- ============================================================================
+-- Compound Indexes for Sender-Scoped Inbox Queries
+-- ============================================================================
+
+-- 2. Messages from one sender to one recipient in time order
+-- Supports: get_unread_messages_from_sender, get_messages_between_agents
+CREATE INDEX IF NOT EXISTS idx_messages_recipient_sender_created
+ON messages (recipient_id, sender_id, created_at);
+
+COMMENT ON INDEX idx_messages_recipient_sender_created IS
+'Optimizes recipient + sender message lookups ordered by time';
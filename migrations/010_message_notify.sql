@@ -0,0 +1,31 @@
+-- Phase 6: Message Query Performance
+-- Migration 010
+-- Created: 2026-10-17
+-- Description: NOTIFY recipients of new messages so readers can LISTEN instead of polling
+
+-- ============================================================================
+-- New Message Notifications
+-- ============================================================================
+
+-- Channel is msgs_<recipient uuid without dashes>, a plain identifier usable
+-- with LISTEN without quoting. The payload is the new message id.
+CREATE OR REPLACE FUNCTION notify_new_message()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.recipient_id IS NOT NULL THEN
+        PERFORM pg_notify(
+            'msgs_' || replace(NEW.recipient_id::text, '-', ''),
+            NEW.id::text
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_new_message ON messages;
+
+CREATE TRIGGER notify_new_message
+    AFTER INSERT ON messages
+    FOR EACH ROW EXECUTE FUNCTION notify_new_message();
+
+COMMENT ON FUNCTION notify_new_message () IS 'pg_notify the recipient channel when a message is inserted';
@@ -0,0 +1,26 @@
+-- Phase 7: Message Listing Performance
+-- Migration 011
+-- Created: 2026-10-17
+-- Description: Index for keyset (created_at, id) pagination of sent message lists
+
+-- ============================================================================
+-- Keyset Pagination Indexes
+-- ============================================================================
+
+-- 1. Sent messages, newest first
+-- Supports: get_sent_messages with a (created_at, id) "before" cursor
+CREATE INDEX IF NOT EXISTS idx_messages_sender_created_id
+ON messages (sender_id, created_at DESC, id DESC)
+WHERE sender_id IS NOT NULL;
+
+COMMENT ON INDEX idx_messages_sender_created_id IS
+'Index range scan for keyset-paginated sent message lists';
+
+-- Note: get_received_messages pages use idx_messages_recipient_created_id
+-- (migration 008).
+
+-- ============================================================================
+-- Update Statistics
+-- ============================================================================
+
+ANALYZE messages;
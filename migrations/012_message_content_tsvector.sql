@@ -0,0 +1,45 @@
+-- Phase 7: Message Search Performance
+-- Migration 012
+-- Created: 2026-10-17
+-- Description: Stored tsvector on messages for full-text search
+
+-- ============================================================================
+-- Generated Columns
+-- ============================================================================
+
+-- 1. Pre-tokenized message content
+-- Supports: get_messages_by_search (match and ts_rank) without rebuilding the
+-- tsvector from content::text for every candidate row
+ALTER TABLE messages
+ADD COLUMN IF NOT EXISTS content_tsv tsvector
+GENERATED ALWAYS AS (to_tsvector('english', content::text)) STORED;
+
+COMMENT ON COLUMN messages.content_tsv IS
+'English tsvector of content::text, computed on write for full-text search';
+
+-- ============================================================================
+-- Full-Text Search Indexes
+-- ============================================================================
+
+-- 2. GIN index on the stored tsvector
+CREATE INDEX IF NOT EXISTS idx_messages_content_tsv
+ON messages
+USING GIN (content_tsv);
+
+COMMENT ON INDEX idx_messages_content_tsv IS
+'Full-text search on stored message content vectors';
+
+-- ============================================================================
+-- Update Statistics
+-- ============================================================================
+
+ANALYZE messages;
+
+-- ============================================================================
+-- Performance Notes
+-- ============================================================================
+--
+-- The expression index idx_messages_content_fts (migration 004) is no longer
+-- used by the repository once this column exists. Migrations are re-applied
+-- on every initialize, so it is not dropped here; it can be dropped manually
+-- on deployments that want to save the extra write cost.
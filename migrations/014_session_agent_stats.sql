@@ -0,0 +1,119 @@
+-- Phase 7: Session Statistics Performance
+-- Migration 014
+-- Created: 2026-10-17
+-- Description: Trigger-maintained per-session message counters for get_session_statistics
+
+-- ============================================================================
+-- Per-Session, Per-Agent Counters
+-- ============================================================================
+
+-- One row per (session, agent) with messages the agent sent in the session
+-- and messages addressed to it there that are still unread. Sessions have
+-- exactly two agents, so an agent's statistics are a sum over its sessions
+-- instead of an aggregate over every message in them.
+CREATE TABLE IF NOT EXISTS session_agent_stats (
+    session_id UUID NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    agent_id UUID NOT NULL REFERENCES agents (id) ON DELETE CASCADE,
+    sent_count BIGINT NOT NULL DEFAULT 0,
+    unread_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, agent_id)
+);
+
+COMMENT ON TABLE session_agent_stats IS
+'Per-session message counters maintained by maintain_session_agent_stats';
+
+-- ============================================================================
+-- Backfill
+-- ============================================================================
+
+-- Runs only while the table is empty, so re-running migrations does not
+-- rescan messages or double count.
+INSERT INTO session_agent_stats (session_id, agent_id, sent_count, unread_count)
+SELECT session_id, agent_id, SUM(sent_count), SUM(unread_count)
+FROM (
+    SELECT session_id, sender_id AS agent_id, COUNT(*) AS sent_count, 0 AS unread_count
+    FROM messages
+    WHERE session_id IS NOT NULL
+    GROUP BY session_id, sender_id
+    UNION ALL
+    SELECT session_id, recipient_id, 0, COUNT(*)
+    FROM messages
+    WHERE session_id IS NOT NULL AND recipient_id IS NOT NULL AND read_at IS NULL
+    GROUP BY session_id, recipient_id
+) AS counts
+WHERE NOT EXISTS (SELECT 1 FROM session_agent_stats)
+GROUP BY session_id, agent_id
+ON CONFLICT (session_id, agent_id) DO NOTHING;
+
+-- ============================================================================
+-- Maintenance Trigger
+-- ============================================================================
+
+-- INSERT counts the sender and, if unread, the recipient. UPDATE OF read_at
+-- moves the recipient's unread count. DELETE only updates existing rows, so
+-- it is a no-op when a session delete has already cascaded to its counters.
+CREATE OR REPLACE FUNCTION maintain_session_agent_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.session_id IS NOT NULL THEN
+            INSERT INTO session_agent_stats (session_id, agent_id, sent_count)
+            VALUES (NEW.session_id, NEW.sender_id, 1)
+            ON CONFLICT (session_id, agent_id)
+            DO UPDATE SET sent_count = session_agent_stats.sent_count + 1;
+
+            IF NEW.recipient_id IS NOT NULL AND NEW.read_at IS NULL THEN
+                INSERT INTO session_agent_stats (session_id, agent_id, unread_count)
+                VALUES (NEW.session_id, NEW.recipient_id, 1)
+                ON CONFLICT (session_id, agent_id)
+                DO UPDATE SET unread_count = session_agent_stats.unread_count + 1;
+            END IF;
+        END IF;
+        RETURN NEW;
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF NEW.session_id IS NOT NULL
+            AND NEW.recipient_id IS NOT NULL
+            AND (OLD.read_at IS NULL) <> (NEW.read_at IS NULL) THEN
+            INSERT INTO session_agent_stats (session_id, agent_id, unread_count)
+            VALUES (
+                NEW.session_id,
+                NEW.recipient_id,
+                CASE WHEN NEW.read_at IS NULL THEN 1 ELSE -1 END
+            )
+            ON CONFLICT (session_id, agent_id)
+            DO UPDATE SET unread_count = session_agent_stats.unread_count + EXCLUDED.unread_count;
+        END IF;
+        RETURN NEW;
+    ELSE
+        IF OLD.session_id IS NOT NULL THEN
+            UPDATE session_agent_stats
+            SET sent_count = sent_count - 1
+            WHERE session_id = OLD.session_id AND agent_id = OLD.sender_id;
+
+            IF OLD.recipient_id IS NOT NULL AND OLD.read_at IS NULL THEN
+                UPDATE session_agent_stats
+                SET unread_count = unread_count - 1
+                WHERE session_id = OLD.session_id AND agent_id = OLD.recipient_id;
+            END IF;
+        END IF;
+        RETURN OLD;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS maintain_session_agent_stats ON messages;
+
+CREATE TRIGGER maintain_session_agent_stats
+    AFTER INSERT OR DELETE OR UPDATE OF read_at ON messages
+    FOR EACH ROW EXECUTE FUNCTION maintain_session_agent_stats();
+
+COMMENT ON FUNCTION maintain_session_agent_stats () IS 'Keep session_agent_stats in step with session messages';
+
+-- ============================================================================
+-- Performance Notes
+-- ============================================================================
+--
+-- get_session_statistics reads two counter rows per session of the agent
+-- (its own and its partner's) instead of joining every session message.
+-- Each session message insert or read-state change updates one or two
+-- counter rows, and concurrent writers in the same session serialize on them.
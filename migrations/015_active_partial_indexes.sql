@@ -0,0 +1,57 @@
+-- Phase 7: Session Statistics Performance
+-- Migration 015
+-- Created: 2026-10-17
+-- Description: Rebuild the active-session and active-meeting partial indexes on the real status value
+
+-- ============================================================================
+-- Active Entity Partial Indexes
+-- ============================================================================
+
+-- Migration 005 first created idx_sessions_active and idx_meetings_active
+-- with WHERE status = 'in_progress', a value neither status CHECK allows, so
+-- both indexes were always empty. 005 now uses 'active', but CREATE INDEX IF
+-- NOT EXISTS leaves an existing stale definition in place. Drop stale copies
+-- here and recreate them.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'idx_sessions_active' AND indexdef LIKE '%in_progress%'
+    ) THEN
+        DROP INDEX idx_sessions_active;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE indexname = 'idx_meetings_active' AND indexdef LIKE '%in_progress%'
+    ) THEN
+        DROP INDEX idx_meetings_active;
+    END IF;
+END;
+$$;
+
+-- 1. Active session between a pair of agents
+-- Supports: get_active_session (status bound as the literal 'active')
+CREATE INDEX IF NOT EXISTS idx_sessions_active
+ON sessions (agent_a_id, agent_b_id, created_at DESC)
+WHERE status = 'active';
+
+COMMENT ON INDEX idx_sessions_active IS
+'Optimizes queries for active sessions only';
+
+-- 2. Active meetings by host
+CREATE INDEX IF NOT EXISTS idx_meetings_active
+ON meetings (host_id, created_at DESC)
+WHERE status = 'active';
+
+COMMENT ON INDEX idx_meetings_active IS
+'Optimizes queries for active meetings only';
+
+-- ============================================================================
+-- Performance Notes
+-- ============================================================================
+--
+-- No INCLUDE columns are added for an index-only get_active_session.
+-- locked_agent_id and updated_at change on every lock and status update
+-- (updated_at through a trigger), and indexing them would turn those
+-- updates from HOT into full index updates.
@@ -177,6 +177,7 @@ def mock_message_repo() -> MagicMock:
     """Mock message repository."""
     repo = MagicMock(spec=MessageRepository)
     repo.create = AsyncMock(return_value=uuid4())
+    repo.create_many = AsyncMock(side_effect=lambda rows: [uuid4() for _ in rows])
     repo.get_by_id = AsyncMock(
         return_value=Message(
             id=uuid4(),
@@ -189,6 +190,7 @@ def mock_message_repo() -> MagicMock:
     )
     repo.get_unread_messages = AsyncMock(return_value=[])
     repo.mark_as_read = AsyncMock()
+    repo.mark_many_as_read = AsyncMock()
     return repo
 
 
@@ -0,0 +1,52 @@
+"""Unit tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from agent_messaging.database.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_set_and_pop(self):
+        """Test basic storage and removal."""
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert len(cache) == 0
+
+    def test_entries_expire(self):
+        """Test entries are dropped after their TTL."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch("agent_messaging.database.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("agent_messaging.database.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("agent_messaging.database.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the cache stays within maxsize."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a ttl of 0 or None stores nothing."""
+        for ttl in (0, None):
+            cache = TTLCache(maxsize=4, ttl=ttl)
+            cache.set("a", 1)
+
+            assert cache.get("a") is None
+            assert len(cache) == 0
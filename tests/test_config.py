@@ -21,6 +21,9 @@ class TestDatabaseConfig:
         assert config.max_pool_size == 20
         assert config.min_pool_size == 5
         assert config.connect_timeout_sec == 10
+        assert config.conn_recycling_method == "fast"
+        assert config.plan_cache_mode == "auto"
+        assert config.prepared_statements is True
 
     def test_custom_values(self):
         """Test custom configuration values."""
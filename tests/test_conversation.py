@@ -49,6 +49,7 @@ def mock_message_repo():
     repo.create = AsyncMock(return_value=uuid4())
     repo.get_unread_messages_from_sender = AsyncMock(return_value=[])
     repo.mark_as_read = AsyncMock()
+    repo.mark_many_as_read = AsyncMock()
     repo.get_unread_messages = AsyncMock(return_value=[])
     return repo
 
@@ -503,7 +504,7 @@ class TestConversation:
 
         mock_agent_repo.get_by_external_id = AsyncMock(return_value=agent)
         mock_message_repo.get_unread_messages = AsyncMock(return_value=[message1, message2])
-        mock_message_repo.mark_as_read = AsyncMock()
+        mock_message_repo.mark_many_as_read = AsyncMock()
 
         # Get unread messages
         messages = await conversation.get_unread_messages("bob")
@@ -513,8 +514,8 @@ class TestConversation:
         assert messages[0] == {"text": "Hello 1"}
         assert messages[1] == {"text": "Hello 2"}
 
-        # Verify messages were marked as read
-        assert mock_message_repo.mark_as_read.call_count == 2
+        # Verify messages were marked as read in one call
+        mock_message_repo.mark_many_as_read.assert_called_once_with([message1.id, message2.id])
 
     @pytest.mark.asyncio
     async def test_get_or_wait_for_response_success(
@@ -615,3 +616,103 @@ class TestConversation:
 
         # Verify timeout
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_resume_agent_handler_marks_pending_in_one_batch(
+        self, conversation, mock_agent_repo, mock_message_repo, mock_has_handler
+    ):
+        """Test resuming marks all processed pending messages read at once."""
+        agent = Agent(
+            id=uuid4(),
+            external_id="bob",
+            organization_id=uuid4(),
+            name="Bob",
+            created_at=MagicMock(),
+            updated_at=MagicMock(),
+        )
+        sender = Agent(
+            id=uuid4(),
+            external_id="alice",
+            organization_id=agent.organization_id,
+            name="Alice",
+            created_at=MagicMock(),
+            updated_at=MagicMock(),
+        )
+        pending = [
+            Message(
+                id=uuid4(),
+                sender_id=sender.id,
+                recipient_id=agent.id,
+                session_id=uuid4(),
+                meeting_id=None,
+                message_type=MessageType.USER_DEFINED,
+                content={"text": text},
+                read_at=None,
+                created_at=MagicMock(),
+                metadata=None,
+            )
+            for text in ("one", "two")
+        ]
+
+        mock_agent_repo.get_by_external_id = AsyncMock(return_value=agent)
+        mock_agent_repo.get_by_id = AsyncMock(return_value=sender)
+        mock_message_repo.get_unread_messages = AsyncMock(return_value=pending)
+
+        with patch(
+            "agent_messaging.messaging.conversation.invoke_handler_async", new=AsyncMock()
+        ):
+            await conversation.resume_agent_handler("bob")
+            await asyncio.sleep(0)
+
+        mock_message_repo.mark_many_as_read.assert_called_once_with([m.id for m in pending])
+        mock_message_repo.mark_as_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_agent_handler_marks_dispatched_on_failure(
+        self, conversation, mock_agent_repo, mock_message_repo, mock_has_handler
+    ):
+        """Test messages dispatched before a failure are still marked read."""
+        agent = Agent(
+            id=uuid4(),
+            external_id="bob",
+            organization_id=uuid4(),
+            name="Bob",
+            created_at=MagicMock(),
+            updated_at=MagicMock(),
+        )
+        sender = Agent(
+            id=uuid4(),
+            external_id="alice",
+            organization_id=agent.organization_id,
+            name="Alice",
+            created_at=MagicMock(),
+            updated_at=MagicMock(),
+        )
+        pending = [
+            Message(
+                id=uuid4(),
+                sender_id=sender.id,
+                recipient_id=agent.id,
+                session_id=uuid4(),
+                meeting_id=None,
+                message_type=MessageType.USER_DEFINED,
+                content={"text": text},
+                read_at=None,
+                created_at=MagicMock(),
+                metadata=None,
+            )
+            for text in ("one", "two")
+        ]
+
+        mock_agent_repo.get_by_external_id = AsyncMock(return_value=agent)
+        mock_agent_repo.get_by_id = AsyncMock(side_effect=[sender, RuntimeError("lookup failed")])
+        mock_message_repo.get_unread_messages = AsyncMock(return_value=pending)
+
+        with patch(
+            "agent_messaging.messaging.conversation.invoke_handler_async", new=AsyncMock()
+        ):
+            with pytest.raises(RuntimeError):
+                await conversation.resume_agent_handler("bob")
+            await asyncio.sleep(0)
+
+        mock_message_repo.mark_many_as_read.assert_called_once_with([pending[0].id])
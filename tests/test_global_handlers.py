@@ -1,6 +1,7 @@
 """Tests for global handler system."""
 
 import pytest
+import threading
 from uuid import uuid4
 from datetime import datetime
 
@@ -179,6 +180,51 @@ class TestHandlerInvocation:
         result = invoke_handler(HandlerContext.ONE_WAY, "test", ctx)
         assert result == "sync: test"
 
+    @pytest.mark.asyncio
+    async def test_invoke_handler_sync_reuses_bridge_loop(self):
+        """Test sync invocation from a running loop reuses one bridge thread."""
+        threads = []
+
+        async def handler(msg, ctx):
+            threads.append(threading.current_thread())
+            return f"bridged: {msg}"
+
+        register_one_way_handler(handler)
+
+        ctx = MessageContext(
+            sender_id="alice",
+            receiver_id="bob",
+            organization_id="org1",
+            handler_context=HandlerContext.ONE_WAY,
+        )
+
+        assert invoke_handler(HandlerContext.ONE_WAY, "first", ctx) == "bridged: first"
+        assert invoke_handler(HandlerContext.ONE_WAY, "second", ctx) == "bridged: second"
+        assert threads[0] is threads[1]
+        assert threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_invoke_handler_sync_nested_on_bridge_loop(self):
+        """Test a bridged handler can call invoke_handler again without deadlock."""
+
+        async def conversation_handler(msg, ctx):
+            return f"inner: {msg}"
+
+        async def one_way_handler(msg, ctx):
+            return invoke_handler(HandlerContext.CONVERSATION, msg, ctx)
+
+        register_conversation_handler(conversation_handler)
+        register_one_way_handler(one_way_handler)
+
+        ctx = MessageContext(
+            sender_id="alice",
+            receiver_id="bob",
+            organization_id="org1",
+            handler_context=HandlerContext.ONE_WAY,
+        )
+
+        assert invoke_handler(HandlerContext.ONE_WAY, "nested", ctx, timeout=5) == "inner: nested"
+
     @pytest.mark.asyncio
     async def test_handler_exception_propagates(self):
         """Test that exceptions in handlers are propagated."""
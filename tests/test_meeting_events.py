@@ -47,6 +47,36 @@ class TestMeetingEventHandler:
         assert len(events_received) == 1
         assert events_received[0].data["meeting_id"] == "123"
 
+    @pytest.mark.asyncio
+    async def test_emit_event_swallows_single_handler_error(self, event_handler):
+        """Test a failing sole handler is logged, not raised to the emitter."""
+
+        async def failing_handler(event):
+            raise RuntimeError("boom")
+
+        event_handler.register_handler(MeetingEventType.MEETING_ENDED, failing_handler)
+
+        await event_handler.emit_event(uuid4(), MeetingEventType.MEETING_ENDED, {})
+
+    @pytest.mark.asyncio
+    async def test_emit_event_runs_all_handlers(self, event_handler):
+        """Test every handler runs even when another one fails."""
+        calls = []
+
+        async def failing_handler(event):
+            calls.append("failing")
+            raise RuntimeError("boom")
+
+        async def ok_handler(event):
+            calls.append("ok")
+
+        event_handler.register_handler(MeetingEventType.TURN_CHANGED, failing_handler)
+        event_handler.register_handler(MeetingEventType.TURN_CHANGED, ok_handler)
+
+        await event_handler.emit_event(uuid4(), MeetingEventType.TURN_CHANGED, {})
+
+        assert sorted(calls) == ["failing", "ok"]
+
     @pytest.mark.asyncio
     async def test_emit_meeting_started(self, event_handler):
         """Test emitting meeting started event."""
@@ -28,6 +28,7 @@ def mock_meeting_repo():
     repo.get_meeting = AsyncMock()
     repo.get_by_id = AsyncMock()
     repo.add_participant = AsyncMock()
+    repo.add_participants_bulk = AsyncMock(return_value=[])
     repo.update_participant_status = AsyncMock()
     repo.get_participants = AsyncMock(return_value=[])
     repo.get_participant = AsyncMock(return_value=None)
@@ -139,6 +140,9 @@ class TestMeetingManager:
         call_args = mock_meeting_repo.create.call_args
         assert call_args[1]["host_id"] == host.id
         assert call_args[1]["turn_duration"] == 60.0
+        mock_meeting_repo.add_participants_bulk.assert_called_once_with(
+            meeting_id=meeting_id, agent_ids=[host.id, host.id]
+        )
 
     @pytest.mark.asyncio
     async def test_create_meeting_host_not_found(self, meeting_manager, mock_agent_repo):
@@ -0,0 +1,59 @@
+"""Tests for migration SQL parsing."""
+
+from pathlib import Path
+
+from agent_messaging.database.manager import PostgreSQLManager
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+
+class TestParseSqlStatements:
+    """Test PostgreSQLManager._parse_sql_statements."""
+
+    def test_semicolon_in_line_comment_does_not_split(self):
+        """Test that a ; inside a -- comment is not a statement terminator."""
+        sql = "-- first; second\nSELECT 1;\n-- trailing; comment\nSELECT 2;"
+
+        statements = PostgreSQLManager._parse_sql_statements(sql)
+
+        assert statements == ["SELECT 1;", "SELECT 2;"]
+
+    def test_block_comment_is_dropped(self):
+        """Test that /* */ comments, including a ; inside them, are dropped."""
+        sql = "/* setup; */ SELECT 1;"
+
+        assert PostgreSQLManager._parse_sql_statements(sql) == ["SELECT 1;"]
+
+    def test_comment_markers_inside_literals_are_kept(self):
+        """Test that -- and ; inside quoted text stay part of the statement."""
+        sql = "COMMENT ON TABLE t IS 'a -- b; it''s kept';\nSELECT 1;"
+
+        statements = PostgreSQLManager._parse_sql_statements(sql)
+
+        assert statements == ["COMMENT ON TABLE t IS 'a -- b; it''s kept';", "SELECT 1;"]
+
+    def test_dollar_quoted_body_is_one_statement(self):
+        """Test that semicolons inside a $$ body do not split the function."""
+        sql = (
+            "CREATE FUNCTION f() RETURNS void AS $$\n"
+            "BEGIN\n    PERFORM 1;\nEND;\n"
+            "$$ LANGUAGE plpgsql;"
+        )
+
+        statements = PostgreSQLManager._parse_sql_statements(sql)
+
+        assert len(statements) == 1
+        assert statements[0].endswith("$$ LANGUAGE plpgsql;")
+
+    def test_message_notify_migration(self):
+        """Test that 010 parses into the function, trigger and comment statements."""
+        sql = (MIGRATIONS_DIR / "010_message_notify.sql").read_text()
+
+        statements = PostgreSQLManager._parse_sql_statements(sql)
+
+        assert len(statements) == 4
+        assert statements[0].startswith("CREATE OR REPLACE FUNCTION notify_new_message()")
+        assert statements[0].endswith("$$ LANGUAGE plpgsql;")
+        assert statements[1] == "DROP TRIGGER IF EXISTS notify_new_message ON messages;"
+        assert statements[2].startswith("CREATE TRIGGER notify_new_message")
+        assert statements[3].startswith("COMMENT ON FUNCTION notify_new_message ()")
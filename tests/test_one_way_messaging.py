@@ -32,6 +32,7 @@ def mock_message_repo():
     """Mock message repository for testing."""
     repo = MagicMock()
     repo.create = AsyncMock(return_value=uuid4())
+    repo.create_many = AsyncMock(side_effect=lambda rows: [uuid4() for _ in rows])
     repo.get_unread_messages_from_sender = AsyncMock(return_value=[])
     repo.mark_as_read = AsyncMock()
     repo.get_unread_messages = AsyncMock(return_value=[])
@@ -106,20 +107,24 @@ class TestOneWayMessenger:
         )
 
         mock_agent_repo.get_by_external_id = AsyncMock(side_effect=[sender, recipient])
-        mock_message_repo.create = AsyncMock(return_value=uuid4())
+        message_id = uuid4()
+        mock_message_repo.create_many = AsyncMock(return_value=[message_id])
 
         # Send message
         message_ids = await one_way_messenger.send("alice", ["bob"], {"text": "Hello!"})
 
         # Verify message was created
-        assert len(message_ids) == 1
-        assert message_ids[0] is not None
-        mock_message_repo.create.assert_called_once_with(
-            sender_id=sender.id,
-            recipient_id=recipient.id,
-            content={"text": "Hello!"},
-            message_type=MessageType.USER_DEFINED,
-            metadata={},  # Phase 4: metadata parameter added
+        assert message_ids == [str(message_id)]
+        mock_message_repo.create_many.assert_called_once_with(
+            [
+                {
+                    "sender_id": sender.id,
+                    "recipient_id": recipient.id,
+                    "content": {"text": "Hello!"},
+                    "message_type": MessageType.USER_DEFINED,
+                    "metadata": {},  # Phase 4: metadata parameter added
+                }
+            ]
         )
 
         # Verify handler was invoked
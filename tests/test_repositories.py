@@ -1,13 +1,27 @@
 """Unit tests for database repositories."""
 
+import asyncio
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from agent_messaging.database.repositories.agent import AgentRepository
+from agent_messaging.database.repositories.base import BaseRepository
+from agent_messaging.database.repositories.meeting import MeetingRepository
+from agent_messaging.database.repositories.message import MessageRepository
 from agent_messaging.database.repositories.organization import OrganizationRepository
-from agent_messaging.models import Agent, Organization
+from agent_messaging.database.repositories.session import SessionRepository
+from agent_messaging.models import (
+    Agent,
+    MessageType,
+    Organization,
+    ParticipantStatus,
+    Session,
+    SessionStatus,
+)
 
 
 @pytest.fixture
@@ -53,11 +67,11 @@ class TestOrganizationRepository:
     async def test_get_by_external_id_found(self, org_repo, mock_pool):
         """Test getting organization by external ID when found."""
         org_data = {
-            "id": str(uuid4()),
+            "id": uuid4(),
             "external_id": "org_001",
             "name": "Test Organization",
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-01-01T00:00:00Z",
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
         }
         org_repo._fetch_one = AsyncMock(return_value=org_data)
 
@@ -68,6 +82,46 @@ class TestOrganizationRepository:
         assert result.external_id == "org_001"
         assert result.name == "Test Organization"
 
+    @pytest.mark.asyncio
+    async def test_get_by_external_id_not_cached_by_default(self, org_repo):
+        """Test lookups go to the database unless caching is enabled."""
+        org_repo._fetch_one = AsyncMock(
+            return_value={
+                "id": uuid4(),
+                "external_id": "org_001",
+                "name": "Test Organization",
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        )
+
+        await org_repo.get_by_external_id("org_001")
+        await org_repo.get_by_external_id("org_001")
+
+        assert org_repo._fetch_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_by_external_id_cached_until_deleted(self, mock_pool):
+        """Test repeat lookups are served from cache and delete evicts."""
+        org_repo = OrganizationRepository(mock_pool, cache_ttl=60)
+        org_repo._fetch_one = AsyncMock(
+            return_value={
+                "id": uuid4(),
+                "external_id": "org_001",
+                "name": "Test Organization",
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            }
+        )
+
+        first = await org_repo.get_by_external_id("org_001")
+        assert await org_repo.get_by_external_id("org_001") is first
+        assert org_repo._fetch_one.call_count == 1
+
+        await org_repo.delete("org_001")
+        await org_repo.get_by_external_id("org_001")
+        assert org_repo._fetch_one.call_count == 3
+
     @pytest.mark.asyncio
     async def test_get_by_external_id_not_found(self, org_repo, mock_pool):
         """Test getting organization by external ID when not found."""
@@ -82,11 +136,11 @@ class TestOrganizationRepository:
         """Test getting organization by ID when found."""
         org_id = uuid4()
         org_data = {
-            "id": str(org_id),
+            "id": org_id,
             "external_id": "org_001",
             "name": "Test Organization",
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-01-01T00:00:00Z",
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
         }
         org_repo._fetch_one = AsyncMock(return_value=org_data)
 
@@ -95,6 +149,8 @@ class TestOrganizationRepository:
         assert result is not None
         assert isinstance(result, Organization)
         assert result.id == org_id
+        # The UUID is bound as-is (binary), not converted to text
+        assert org_repo._fetch_one.call_args.args[1] == [org_id]
 
 
 class TestAgentRepository:
@@ -167,7 +223,9 @@ class TestAgentRepository:
                 "updated_at": "2025-01-01T00:00:00Z",
             },
         ]
-        agent_repo._fetch_all = AsyncMock(return_value=agent_data)
+        agent_repo._fetch_all = AsyncMock(
+            side_effect=lambda query, params, row_factory: [row_factory(r) for r in agent_data]
+        )
 
         results = await agent_repo.get_by_organization(org_id)
 
@@ -175,3 +233,1215 @@ class TestAgentRepository:
         assert all(isinstance(agent, Agent) for agent in results)
         assert results[0].external_id == "alice"
         assert results[1].external_id == "bob"
+
+
+@pytest.fixture
+def meeting_repo(mock_pool):
+    """Meeting repository instance."""
+    return MeetingRepository(mock_pool)
+
+
+class TestMeetingRepository:
+    """Test cases for MeetingRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_participant_map(self, meeting_repo):
+        """Test batched participant lookup keyed by agent ID."""
+        meeting_id = uuid4()
+        agent_a, agent_b, stranger = uuid4(), uuid4(), uuid4()
+        rows = [
+            {
+                "id": uuid4(),
+                "meeting_id": meeting_id,
+                "agent_id": agent_id,
+                "state": 1 + (8 if i else 0),
+                "join_order": i,
+                "joined_at": None,
+                "left_at": None,
+            }
+            for i, agent_id in enumerate([agent_a, agent_b])
+        ]
+        meeting_repo._fetch_all = AsyncMock(
+            side_effect=lambda query, params, row_factory: [row_factory(r) for r in rows]
+        )
+
+        result = await meeting_repo.get_participant_map(meeting_id, [agent_a, agent_b, stranger])
+
+        assert set(result) == {agent_a, agent_b}
+        assert result[agent_b].join_order == 1
+        assert result[agent_a].status == ParticipantStatus.ATTENDING
+        assert result[agent_a].is_locked is False
+        assert result[agent_b].is_locked is True
+        query, params = meeting_repo._fetch_all.call_args.args[:2]
+        assert "ANY($2::uuid[])" in query
+        assert params == (meeting_id, [agent_a, agent_b, stranger])
+
+    @pytest.mark.asyncio
+    async def test_get_participant_map_empty(self, meeting_repo):
+        """Test no query is issued for an empty agent list."""
+        meeting_repo._fetch_all = AsyncMock()
+
+        assert await meeting_repo.get_participant_map(uuid4(), []) == {}
+        meeting_repo._fetch_all.assert_not_called()
+
+    def test_participant_with_unknown_status_is_rejected(self, meeting_repo):
+        """Test a NULL packed state (unmapped status text) raises instead of decoding."""
+        row = {
+            "id": uuid4(),
+            "meeting_id": uuid4(),
+            "agent_id": uuid4(),
+            "state": None,
+            "join_order": 0,
+            "joined_at": None,
+            "left_at": None,
+        }
+
+        with pytest.raises(ValueError, match="Unknown participant status"):
+            meeting_repo._participant_from_db(row)
+
+    @pytest.mark.asyncio
+    async def test_add_participants_bulk(self, meeting_repo):
+        """Test bulk insert returns participant IDs in agent order."""
+        meeting_id = uuid4()
+        agents = [uuid4(), uuid4(), uuid4()]
+        ids = [uuid4(), uuid4(), uuid4()]
+        # RETURNING order is not guaranteed; results are placed by join_order
+        meeting_repo._fetch_all = AsyncMock(
+            return_value=[{"id": ids[i], "join_order": i} for i in (2, 0, 1)]
+        )
+
+        result = await meeting_repo.add_participants_bulk(meeting_id, agents)
+
+        assert result == ids
+        query, params = meeting_repo._fetch_all.call_args.args
+        assert "UNNEST" in query
+        assert params == (meeting_id, "invited", agents, [0, 1, 2])
+
+    @pytest.mark.asyncio
+    async def test_advance_turn_pipelines_both_updates(self, meeting_repo):
+        """Test participant status and speaker change are sent as one pipeline."""
+        meeting_id, participant_id, next_agent = uuid4(), uuid4(), uuid4()
+        meeting_repo._pipeline = AsyncMock(return_value=[])
+
+        await meeting_repo.advance_turn(
+            meeting_id, participant_id, ParticipantStatus.LEFT, next_agent
+        )
+
+        (queries,) = meeting_repo._pipeline.call_args.args
+        assert [params for _, params in queries] == [
+            ("left", participant_id),
+            (next_agent, True, meeting_id),
+        ]
+        assert "meeting_participants" in queries[0][0]
+        assert "current_speaker_id" in queries[1][0]
+
+    @pytest.mark.asyncio
+    async def test_get_participation_analysis(self, meeting_repo):
+        """Test participation analysis is built from a single joined rowset."""
+        started = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        ended = started + timedelta(minutes=10)
+        rows = [
+            {
+                "external_id": "alice",
+                "status": "attending",
+                "message_count": 3,
+                "first_message_at": started,
+                "last_message_at": ended,
+                "total_content_length": 120,
+                "speaking_time_pct": 100.0,
+                "total_participants": 2,
+                "active_participants": 1,
+                "total_messages": 3,
+                "most_active": "alice",
+                "least_active": None,
+                "started_at": started,
+                "ended_at": ended,
+            },
+            {
+                "external_id": "bob",
+                "status": "attending",
+                "message_count": None,
+                "first_message_at": None,
+                "last_message_at": None,
+                "total_content_length": None,
+                "speaking_time_pct": None,
+                "total_participants": 2,
+                "active_participants": 1,
+                "total_messages": 3,
+                "most_active": "alice",
+                "least_active": None,
+                "started_at": started,
+                "ended_at": ended,
+            },
+        ]
+        meeting_repo._fetch_all = AsyncMock(return_value=rows)
+
+        analysis = await meeting_repo.get_participation_analysis(uuid4())
+
+        meeting_repo._fetch_all.assert_called_once()
+        assert analysis["total_participants"] == 2
+        assert analysis["active_participants"] == 1
+        assert analysis["inactive_participants"] == 1
+        assert analysis["participation_rate"] == 50.0
+        assert analysis["total_messages"] == 3
+        assert analysis["most_active"] == "alice"
+        assert analysis["least_active"] is None
+        assert analysis["by_participant"]["alice"]["speaking_time_percentage"] == 100.0
+        assert analysis["by_participant"]["alice"]["total_content_length"] == 120
+        assert analysis["by_participant"]["alice"]["first_message_at"] == started
+        assert analysis["by_participant"]["bob"]["message_count"] == 0
+        assert analysis["by_participant"]["bob"]["speaking_time_percentage"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_participation_analysis_no_participants(self, meeting_repo):
+        """Test analysis of a meeting without participants."""
+        meeting_repo._fetch_all = AsyncMock(return_value=[])
+
+        analysis = await meeting_repo.get_participation_analysis(uuid4())
+
+        assert analysis["total_participants"] == 0
+        assert analysis["by_participant"] == {}
+
+    @pytest.mark.asyncio
+    async def test_get_meeting_timeline(self, meeting_repo):
+        """Test timeline rows come back pre-ordered from one UNION ALL query."""
+        meeting_id = uuid4()
+        started = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        meeting_repo._fetch_one = AsyncMock(
+            return_value={
+                "id": meeting_id,
+                "started_at": started,
+                "ended_at": started + timedelta(seconds=90),
+                "status": "ended",
+            }
+        )
+        message_id = uuid4()
+        meeting_repo._fetch_all = AsyncMock(
+            return_value=[
+                {
+                    "type": "event",
+                    "created_at": started,
+                    "actor": "host",
+                    "subtype": "meeting_started",
+                    "ref_id": str(uuid4()),
+                    "data": {"k": "v"},
+                    "type_order": 1,
+                },
+                {
+                    "type": "message",
+                    "created_at": started + timedelta(seconds=5),
+                    "actor": "alice",
+                    "subtype": "user_defined",
+                    "ref_id": str(message_id),
+                    "data": None,
+                    "type_order": 0,
+                },
+            ]
+        )
+
+        timeline = await meeting_repo.get_meeting_timeline(meeting_id)
+
+        assert "UNION ALL" in meeting_repo._fetch_all.call_args.args[0]
+        assert timeline["duration_seconds"] == 90.0
+        assert timeline["started_at"] == started
+        assert timeline["timeline"][0]["timestamp"] == started
+        assert [item["type"] for item in timeline["timeline"]] == ["event", "message"]
+        assert timeline["timeline"][0]["event_type"] == "meeting_started"
+        assert timeline["timeline"][0]["data"] == {"k": "v"}
+        assert timeline["timeline"][1]["sender_id"] == "alice"
+        assert timeline["timeline"][1]["message_id"] == str(message_id)
+
+    @pytest.mark.asyncio
+    async def test_get_turn_statistics(self, meeting_repo):
+        """Test turn statistics are assembled from per-speaker aggregates."""
+        meeting_repo._fetch_all = AsyncMock(
+            return_value=[
+                {"external_id": "alice", "messages_sent": 3, "turns_taken": 2},
+                {"external_id": "bob", "messages_sent": 1, "turns_taken": 1},
+            ]
+        )
+
+        stats = await meeting_repo.get_turn_statistics(uuid4())
+
+        assert stats["total_turns"] == 3
+        assert stats["total_messages"] == 4
+        assert stats["turn_changes"] == 2
+        assert stats["avg_messages_per_turn"] == 1.33
+        assert stats["unique_speakers"] == 2
+        assert stats["participants_turn_stats"]["alice"]["avg_messages_per_turn"] == 1.5
+
+    @pytest.mark.asyncio
+    async def test_get_turn_statistics_no_messages(self, meeting_repo):
+        """Test turn statistics for a meeting without messages."""
+        meeting_repo._fetch_all = AsyncMock(return_value=[])
+
+        stats = await meeting_repo.get_turn_statistics(uuid4())
+
+        assert stats["total_turns"] == 0
+        assert stats["participants_turn_stats"] == {}
+
+    @pytest.mark.asyncio
+    async def test_get_meeting_details_not_cached_by_default(self, meeting_repo):
+        """Test meeting details are re-read unless caching is enabled."""
+        meeting_id = uuid4()
+        meeting_repo._fetch_one = AsyncMock(return_value={"id": meeting_id})
+
+        await meeting_repo.get_meeting_details(meeting_id)
+        await meeting_repo.get_meeting_details(meeting_id)
+
+        assert meeting_repo._fetch_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_meeting_details_is_cached_until_write(self, mock_pool):
+        """Test meeting details are served from cache and invalidated on writes."""
+        meeting_repo = MeetingRepository(mock_pool, cache_ttl=30)
+        meeting_id = uuid4()
+        meeting_repo._fetch_one = AsyncMock(return_value={"id": meeting_id})
+        meeting_repo._execute = AsyncMock()
+
+        await meeting_repo.get_meeting_details(meeting_id)
+        await meeting_repo.get_meeting_details(meeting_id)
+        assert meeting_repo._fetch_one.call_count == 1
+
+        await meeting_repo.end_meeting(meeting_id)
+        await meeting_repo.get_meeting_details(meeting_id)
+        assert meeting_repo._fetch_one.call_count == 2
+
+        meeting_repo.invalidate_meeting_message(meeting_id, uuid4())
+        await meeting_repo.get_meeting_details(meeting_id)
+        assert meeting_repo._fetch_one.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_meeting_details_are_copies(self, mock_pool):
+        """Test mutating a returned result does not change the cached entry."""
+        meeting_repo = MeetingRepository(mock_pool, cache_ttl=30)
+        meeting_id = uuid4()
+        meeting_repo._fetch_one = AsyncMock(return_value={"id": meeting_id, "message_count": 1})
+
+        first = await meeting_repo.get_meeting_details(meeting_id)
+        first["message_count"] = 99
+
+        assert (await meeting_repo.get_meeting_details(meeting_id))["message_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_meeting_statistics_combines_both_sides(self, meeting_repo):
+        """Test hosted and participated aggregates are merged."""
+        meeting_repo._fetch_one = AsyncMock(
+            side_effect=[
+                {
+                    "hosted_meetings": 2,
+                    "active_hosted": 1,
+                    "duration_sum": 300.0,
+                    "duration_count": 1,
+                },
+                {
+                    "participated_meetings": 3,
+                    "duration_sum": 100.0,
+                    "duration_count": 1,
+                    "total_messages_sent": 7,
+                    "meetings_spoke_in": 2,
+                },
+            ]
+        )
+
+        stats = await meeting_repo.get_meeting_statistics(uuid4())
+
+        assert stats == {
+            "hosted_meetings": 2,
+            "participated_meetings": 3,
+            "active_hosted": 1,
+            "total_messages_sent": 7,
+            "meetings_spoke_in": 2,
+            "avg_meeting_duration_seconds": 200.0,
+        }
+        assert meeting_repo._fetch_one.call_count == 2
+
+
+@pytest.fixture
+def message_repo(mock_pool):
+    """Message repository instance."""
+    return MessageRepository(mock_pool)
+
+
+class TestMessageRepository:
+    """Test cases for MessageRepository."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_pages_rows_into_pipelined_inserts(self, message_repo, monkeypatch):
+        """Test create_many splits rows into pages and returns ids in order."""
+        monkeypatch.setattr(
+            "agent_messaging.database.repositories.message._CREATE_MANY_PAGE_SIZE", 2
+        )
+        sender_id = uuid4()
+        ids = [uuid4() for _ in range(3)]
+
+        def page_result(page_ids):
+            result = MagicMock()
+            result.result.return_value = [{"id": i} for i in page_ids]
+            return result
+
+        message_repo._pipeline = AsyncMock(
+            return_value=[page_result(ids[:2]), page_result(ids[2:])]
+        )
+
+        created = await message_repo.create_many(
+            [
+                {"sender_id": sender_id, "content": {"n": 1}},
+                {"sender_id": sender_id, "message_type": MessageType.SYSTEM},
+                {"sender_id": sender_id, "metadata": {"k": "v"}},
+            ]
+        )
+
+        assert created == ids
+        queries = message_repo._pipeline.call_args.args[0]
+        assert len(queries) == 2
+        first_sql, first_params = queries[0]
+        assert "($8, $9, $10, $11, $12, $13, $14)" in first_sql
+        assert first_params[:7] == [sender_id, None, None, None, "user_defined", {"n": 1}, None]
+        assert first_params[11] == MessageType.SYSTEM.value
+        assert queries[1][1][6] == {"k": "v"}
+
+    @pytest.mark.asyncio
+    async def test_get_messages_for_recipient_keyset_cursor(self, message_repo):
+        """Test a before cursor switches to keyset pagination."""
+        recipient_id, last_id = uuid4(), uuid4()
+        last_created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_messages_for_recipient(
+            recipient_id, limit=20, before=(last_created, last_id)
+        )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "(created_at, id) < ($2, $3)" in query
+        assert "OFFSET" not in query
+        assert params == [recipient_id, last_created, last_id, 20]
+
+    @pytest.mark.asyncio
+    async def test_get_messages_for_session_after_cursor(self, message_repo):
+        """Test an after cursor is appended after the other filters."""
+        session_id, last_id = uuid4(), uuid4()
+        date_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        last_created = date_from + timedelta(minutes=5)
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_messages_for_session(
+            session_id, limit=10, date_from=date_from, after=(last_created, last_id)
+        )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "(created_at, id) > ($3, $4)" in query
+        assert "LIMIT $5" in query
+        assert params == [session_id, date_from, last_created, last_id, 10]
+
+    @pytest.mark.asyncio
+    async def test_fetch_and_mark_read_returns_messages_in_order(self, message_repo):
+        """Test fetch_and_mark_read orders the RETURNING rows by creation time."""
+        recipient_id, sender_id = uuid4(), uuid4()
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        def row(created_at):
+            return {
+                "id": uuid4(),
+                "sender_id": sender_id,
+                "recipient_id": recipient_id,
+                "session_id": None,
+                "meeting_id": None,
+                "message_type": "user_defined",
+                "content": {},
+                "read_at": now,
+                "created_at": created_at,
+                "metadata": None,
+            }
+
+        rows = [row(now), row(now - timedelta(minutes=1))]
+        message_repo._fetch_all = AsyncMock(
+            side_effect=lambda query, params, row_factory: [row_factory(r) for r in rows]
+        )
+
+        messages = await message_repo.fetch_and_mark_read(recipient_id)
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "RETURNING" in query
+        assert params == [recipient_id]
+        assert [m.created_at for m in messages] == [now - timedelta(minutes=1), now]
+
+    @pytest.mark.asyncio
+    async def test_mark_many_as_read_binds_id_array(self, message_repo):
+        """Test mark_many_as_read sends all ids in one statement."""
+        message_ids = (uuid4(), uuid4())
+        message_repo._execute = AsyncMock()
+
+        await message_repo.mark_many_as_read(message_ids)
+        await message_repo.mark_many_as_read([])
+
+        message_repo._execute.assert_called_once()
+        query, params = message_repo._execute.call_args.args
+        assert "ANY($1::uuid[])" in query
+        assert params[0] == list(message_ids)
+        assert params[1].tzinfo is timezone.utc
+
+    @pytest.mark.asyncio
+    async def test_mark_messages_read_counts_returned_rows(self, message_repo):
+        """Test mark_messages_read returns the rows updated in one statement."""
+        recipient_id, sender_id = uuid4(), uuid4()
+        updated = [{"id": uuid4()}, {"id": uuid4()}]
+        message_repo._fetch_all = AsyncMock(return_value=updated)
+        message_repo._fetch_one = AsyncMock()
+
+        count = await message_repo.mark_messages_read(recipient_id, sender_id)
+
+        assert count == 2
+        query, params = message_repo._fetch_all.call_args.args
+        assert "RETURNING id" in query
+        assert params == [recipient_id, sender_id]
+        message_repo._fetch_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_received_messages_with_total_uses_window_count(self, message_repo):
+        """Test the page and total come back from one windowed query."""
+        recipient_id = uuid4()
+        row = {
+            "id": uuid4(),
+            "sender_id": uuid4(),
+            "recipient_id": recipient_id,
+            "session_id": None,
+            "meeting_id": None,
+            "message_type": "user_defined",
+            "content": {"text": "hi"},
+            "read_at": None,
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "metadata": None,
+            "total_count": 42,
+        }
+        message_repo._fetch_all = AsyncMock(return_value=[row])
+        message_repo._fetch_one = AsyncMock()
+
+        messages, total = await message_repo.get_received_messages_with_total(
+            recipient_id, limit=1, offset=5, include_read=False
+        )
+
+        assert total == 42
+        assert [m.id for m in messages] == [row["id"]]
+        query, params = message_repo._fetch_all.call_args.args
+        assert "COUNT(*) OVER ()" in query
+        assert "read_at IS NULL" in query
+        assert params == [recipient_id, 1, 5]
+        message_repo._fetch_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_received_messages_with_total_past_last_page(self, message_repo):
+        """Test an empty page past the end still reports the total."""
+        message_repo._fetch_all = AsyncMock(return_value=[])
+        message_repo._fetch_one = AsyncMock(return_value={"count": 3})
+
+        messages, total = await message_repo.get_received_messages_with_total(
+            uuid4(), limit=10, offset=100
+        )
+
+        assert (messages, total) == ([], 3)
+
+    @pytest.mark.asyncio
+    async def test_inbox_snapshot_runs_reads_concurrently(self, message_repo):
+        """Test the snapshot's reads overlap instead of running one after another."""
+        started = []
+        both_started = asyncio.Event()
+        unread_message, recent_message = MagicMock(), MagicMock()
+
+        async def wait_for_other_read(name):
+            # Each read blocks until the other has started, so running them
+            # sequentially would time out
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+
+        async def get_unread_messages(recipient):
+            await wait_for_other_read("unread")
+            return [unread_message]
+
+        async def get_received_messages_with_total(recipient, limit):
+            await wait_for_other_read("recent")
+            return [recent_message], 7
+
+        message_repo.get_unread_messages = get_unread_messages
+        message_repo.get_received_messages_with_total = get_received_messages_with_total
+
+        snapshot = await asyncio.wait_for(message_repo.get_inbox_snapshot(uuid4(), limit=5), 1)
+
+        assert snapshot == {
+            "unread": [unread_message],
+            "recent": [recent_message],
+            "unread_count": 1,
+            "total_count": 7,
+        }
+
+    @pytest.mark.asyncio
+    async def test_iter_messages_for_meeting_yields_messages(self, message_repo):
+        """Test iter_messages_for_meeting converts streamed rows to Messages."""
+        meeting_id, sender_id = uuid4(), uuid4()
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        row = {
+            "id": uuid4(),
+            "sender_id": sender_id,
+            "recipient_id": None,
+            "session_id": None,
+            "meeting_id": meeting_id,
+            "message_type": "user_defined",
+            "content": {"text": "hi"},
+            "read_at": None,
+            "created_at": now,
+            "metadata": None,
+        }
+        calls = []
+
+        async def iter_rows(query, params, fetch_number):
+            calls.append((params, fetch_number))
+            yield row
+
+        message_repo._iter_rows = iter_rows
+
+        messages = [m async for m in message_repo.iter_messages_for_meeting(meeting_id, chunk=50)]
+
+        assert [m.content for m in messages] == [{"text": "hi"}]
+        assert calls == [((meeting_id,), 50)]
+
+    @pytest.mark.asyncio
+    async def test_iter_received_messages_streams_filtered_rows(self, message_repo):
+        """Test iter_received_messages streams through _iter_rows with filters."""
+        recipient_id = uuid4()
+        row = {
+            "id": uuid4(),
+            "sender_id": uuid4(),
+            "recipient_id": recipient_id,
+            "session_id": None,
+            "meeting_id": None,
+            "message_type": "system",
+            "content": {"text": "hi"},
+            "read_at": None,
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "metadata": None,
+        }
+        calls = []
+
+        async def iter_rows(query, params, fetch_number):
+            calls.append((query, params, fetch_number))
+            yield row
+
+        message_repo._iter_rows = iter_rows
+
+        messages = [
+            m
+            async for m in message_repo.iter_received_messages(
+                recipient_id, include_read=False, message_types=[MessageType.SYSTEM], chunk=25
+            )
+        ]
+
+        assert [m.id for m in messages] == [row["id"]]
+        query, params, fetch_number = calls[0]
+        assert "read_at IS NULL" in query
+        assert "ORDER BY created_at DESC, id DESC" in query
+        assert params == [recipient_id, ["system"]]
+        assert fetch_number == 25
+
+    @pytest.mark.asyncio
+    async def test_listen_unread_queries_again_only_after_notify(self, message_repo):
+        """Test listen_unread fetches on start and on each notification."""
+        recipient_id = uuid4()
+        callbacks = {}
+        listener = MagicMock()
+
+        async def add_callback(channel, callback):
+            callbacks[channel] = callback
+
+        listener.add_callback = add_callback
+        listener.startup = AsyncMock()
+        listener.shutdown = AsyncMock()
+        message_repo.db_manager.listener = MagicMock(return_value=listener)
+        first, second = MagicMock(), MagicMock()
+        message_repo.get_unread_messages = AsyncMock(side_effect=[[first], [second]])
+
+        stream = message_repo.listen_unread(recipient_id)
+        assert await stream.__anext__() == [first]
+        assert message_repo.get_unread_messages.call_count == 1
+
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        assert not pending.done()
+        await callbacks[f"msgs_{recipient_id.hex}"](None, "payload", "channel", 1)
+
+        assert await pending == [second]
+        await stream.aclose()
+        listener.shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_not_cached_by_default(self, message_repo):
+        """Test get_by_id re-reads the row, including read_at, by default."""
+        message_id = uuid4()
+        message_repo._fetch_one = AsyncMock(
+            return_value={
+                "id": message_id,
+                "sender_id": uuid4(),
+                "recipient_id": None,
+                "session_id": None,
+                "meeting_id": None,
+                "message_type": "user_defined",
+                "content": {},
+                "read_at": None,
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "metadata": None,
+            }
+        )
+
+        await message_repo.get_by_id(message_id)
+        await message_repo.get_by_id(message_id)
+
+        assert message_repo._fetch_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_cached_until_marked_read(self, mock_pool):
+        """Test get_by_id serves repeats from cache and mark_as_read evicts."""
+        message_repo = MessageRepository(mock_pool, cache_ttl=60)
+        message_id = uuid4()
+        message_repo._fetch_one = AsyncMock(
+            return_value={
+                "id": message_id,
+                "sender_id": uuid4(),
+                "recipient_id": None,
+                "session_id": None,
+                "meeting_id": None,
+                "message_type": "user_defined",
+                "content": {},
+                "read_at": None,
+                "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "metadata": None,
+            }
+        )
+        message_repo._execute = AsyncMock()
+
+        first = await message_repo.get_by_id(message_id)
+        assert await message_repo.get_by_id(message_id) is first
+        assert message_repo._fetch_one.call_count == 1
+
+        await message_repo.mark_as_read(message_id)
+        await message_repo.get_by_id(message_id)
+        assert message_repo._fetch_one.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_message_type_filter_is_bound_parameter(self, message_repo):
+        """Test message type filters bind values instead of inlining literals."""
+        sender_id = uuid4()
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_sent_messages(
+            sender_id, limit=5, offset=10, message_types=[MessageType.SYSTEM]
+        )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "message_type = ANY($2::text[])" in query
+        assert "LIMIT $3 OFFSET $4" in query
+        assert ") AS page USING (id)" in query
+        assert params == [sender_id, ["system"], 5, 10]
+
+    @pytest.mark.asyncio
+    async def test_message_type_filter_sql_independent_of_values(self, message_repo):
+        """Test different message type sets reuse the same SQL text."""
+        session_id = uuid4()
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_messages_for_session(session_id, message_types=[MessageType.SYSTEM])
+        await message_repo.get_messages_for_session(
+            session_id, message_types=[MessageType.SYSTEM, MessageType.USER_DEFINED]
+        )
+
+        (first_query, first_params), (second_query, second_params) = [
+            call.args for call in message_repo._fetch_all.call_args_list
+        ]
+        assert first_query == second_query
+        assert first_params[1] == ["system"]
+        assert second_params[1] == ["system", "user_defined"]
+
+    @pytest.mark.asyncio
+    async def test_sent_messages_before_cursor_replaces_offset(self, message_repo):
+        """Test a keyset cursor seeks past the previous page instead of OFFSET."""
+        sender_id, last_id = uuid4(), uuid4()
+        last_created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_sent_messages(
+            sender_id, limit=5, offset=10, before=(last_created, last_id)
+        )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "(created_at, id) < ($2, $3)" in query
+        assert "ORDER BY created_at DESC, id DESC" in query
+        assert "OFFSET" not in query
+        assert params == [sender_id, last_created, last_id, 5]
+
+    @pytest.mark.asyncio
+    async def test_metadata_filters_bind_keys_and_values(self, message_repo):
+        """Test metadata keys are bound parameters aligned with their values."""
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_messages_by_metadata(
+            {"request_id__exists": True, "priority": "high"}, limit=3, offset=0
+        )
+        await message_repo.get_messages_by_metadata(
+            {"trace_id__exists": True, "category": "billing"}, limit=3, offset=0
+        )
+
+        (first_query, first_params), (second_query, second_params) = [
+            call.args for call in message_repo._fetch_all.call_args_list
+        ]
+        assert "metadata ? $1::text" in first_query
+        assert "metadata @> $2" in first_query
+        assert "LIMIT $3 OFFSET $4" in first_query
+        assert first_params[0] == "request_id"
+        assert first_params[2:] == [3, 0]
+        assert second_query == first_query
+        assert second_params[0] == "trace_id"
+
+    @pytest.mark.asyncio
+    async def test_metadata_exact_and_contains_share_one_containment(self, message_repo):
+        """Test exact and array-contains filters become one @> predicate."""
+        sender_id = uuid4()
+        message_repo._fetch_all = AsyncMock(return_value=[])
+        jsonb_docs = []
+
+        with patch(
+            "agent_messaging.database.repositories.message.JSONB",
+            side_effect=lambda doc: jsonb_docs.append(doc) or doc,
+        ):
+            await message_repo.get_messages_by_metadata(
+                {"priority": "high", "tags__contains": "urgent"}, sender_id=sender_id
+            )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "metadata->" not in query
+        assert "metadata @> $1 AND sender_id = $2" in query
+        assert jsonb_docs == [{"priority": "high", "tags": ["urgent"]}]
+        assert params[1] == sender_id
+
+    @pytest.mark.asyncio
+    async def test_metadata_list_and_dict_values_match_exactly(self, message_repo):
+        """Test list and dict filter values use equality, not containment."""
+        message_repo._fetch_all = AsyncMock(return_value=[])
+        jsonb_docs = []
+
+        with patch(
+            "agent_messaging.database.repositories.message.JSONB",
+            side_effect=lambda doc: jsonb_docs.append(doc) or doc,
+        ):
+            await message_repo.get_messages_by_metadata(
+                {"tags": ["a"], "owner": {"team": "core"}, "priority": "high"}
+            )
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "metadata->$1::text = $2 AND metadata->$3::text = $4" in query
+        assert "metadata @> $5" in query
+        assert params[:5] == ["tags", ["a"], "owner", {"team": "core"}, {"priority": "high"}]
+        assert jsonb_docs == [["a"], {"team": "core"}, {"priority": "high"}]
+
+    @pytest.mark.asyncio
+    async def test_search_uses_stored_tsvector(self, message_repo):
+        """Test search matches and ranks on content_tsv with one parsed query."""
+        sender_id = uuid4()
+        message_repo._fetch_all = AsyncMock(return_value=[])
+
+        await message_repo.get_messages_by_search("postgres", sender_id=sender_id, limit=5)
+
+        query, params = message_repo._fetch_all.call_args.args
+        assert "to_tsvector" not in query
+        assert query.count("websearch_to_tsquery") == 1
+        assert "content_tsv @@ q.tsq AND sender_id = $2" in query
+        assert params == ["postgres", sender_id, 5, 0]
+
+    @pytest.mark.asyncio
+    async def test_has_messages_uses_exists(self, message_repo):
+        """Test has_messages asks for existence rather than a count."""
+        recipient_id = uuid4()
+        message_repo._fetch_one = AsyncMock(return_value={"found": True})
+
+        assert await message_repo.has_messages(recipient_id=recipient_id, read_status=False)
+
+        query, params = message_repo._fetch_one.call_args.args
+        assert "SELECT EXISTS (SELECT 1 FROM messages" in query
+        assert "COUNT" not in query
+        assert params == [recipient_id, None, None, None, False]
+
+    @pytest.mark.asyncio
+    async def test_get_message_count_uses_one_statement_for_all_filters(self, message_repo):
+        """Test absent count filters are bound as NULL instead of changing the SQL."""
+        session_id = uuid4()
+        message_repo._fetch_one = AsyncMock(return_value={"count": 4})
+
+        assert await message_repo.get_message_count(session_id=session_id) == 4
+        await message_repo.get_message_count(recipient_id=uuid4(), read_status=True)
+
+        (first_query, first_params), (second_query, _) = [
+            call.args for call in message_repo._fetch_one.call_args_list
+        ]
+        assert first_query == second_query
+        assert "($3::uuid IS NULL OR session_id = $3)" in first_query
+        assert first_params == [None, None, session_id, None, None]
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, message_repo):
+        """Test create_many with no rows skips the database."""
+        message_repo._pipeline = AsyncMock()
+
+        assert await message_repo.create_many([]) == []
+        message_repo._pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_meeting_message_writes_call_hook(self, mock_pool):
+        """Test create and create_many report meeting messages to the hook."""
+        hook = MagicMock()
+        message_repo = MessageRepository(mock_pool, on_meeting_message=hook)
+        meeting_id, sender_id = uuid4(), uuid4()
+        message_repo._fetch_one = AsyncMock(return_value={"id": uuid4()})
+        page = MagicMock()
+        page.result.return_value = [{"id": uuid4()}, {"id": uuid4()}]
+        message_repo._pipeline = AsyncMock(return_value=[page])
+
+        await message_repo.create(sender_id, meeting_id=meeting_id)
+        await message_repo.create(sender_id, recipient_id=uuid4())
+        await message_repo.create_many(
+            [{"sender_id": sender_id, "meeting_id": meeting_id}, {"sender_id": sender_id}]
+        )
+
+        assert hook.call_args_list == [((meeting_id, sender_id),), ((meeting_id, sender_id),)]
+
+
+@pytest.fixture
+def session_repo(mock_pool):
+    """Session repository instance."""
+    return SessionRepository(mock_pool)
+
+
+def _session_history_row(session_id, **message):
+    """Build a joined session/message row as returned by get_session_with_history."""
+    now = datetime.now(timezone.utc)
+    row = {
+        "id": session_id,
+        "agent_a_id": uuid4(),
+        "agent_b_id": uuid4(),
+        "status": "active",
+        "locked_agent_id": None,
+        "created_at": now,
+        "updated_at": now,
+        "ended_at": None,
+        "message_id": None,
+        "sender_id": None,
+        "sender_name": None,
+        "message_type": None,
+        "content": None,
+        "read_at": None,
+        "message_created_at": None,
+    }
+    row.update(message)
+    return row
+
+
+class TestSessionRepository:
+    """Test cases for SessionRepository."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_orders_pairs_and_keeps_input_order(self, session_repo):
+        """Test bulk session creation sends one UNNEST insert and maps ids back."""
+        low, mid, high = sorted([uuid4(), uuid4(), uuid4()])
+        ids = {(low, high): uuid4(), (mid, high): uuid4()}
+        rows = [
+            {"id": session_id, "agent_a_id": a, "agent_b_id": b}
+            for (a, b), session_id in reversed(list(ids.items()))
+        ]
+        session_repo._fetch_all = AsyncMock(return_value=rows)
+
+        result = await session_repo.create_many([(high, low), (mid, high)])
+
+        assert result == [ids[(low, high)], ids[(mid, high)]]
+        query, params = session_repo._fetch_all.call_args[0]
+        assert "UNNEST($1::uuid[], $2::uuid[])" in query
+        assert params == ([low, mid], [high, high], SessionStatus.ACTIVE.value)
+
+    @pytest.mark.asyncio
+    async def test_get_active_session_orders_pair_in_sql(self, session_repo):
+        """Test the agent pair is canonicalized by LEAST/GREATEST, not in Python."""
+        low, high = sorted([uuid4(), uuid4()])
+        session_repo._fetch_one = AsyncMock(return_value=None)
+
+        assert await session_repo.get_active_session(high, low) is None
+        query, params = session_repo._fetch_one.call_args[0]
+        assert "agent_a_id = LEAST($1::uuid, $2::uuid)" in query
+        assert params == [high, low]
+
+    @pytest.mark.asyncio
+    async def test_update_status_and_lock_single_statement(self, session_repo):
+        """Test status and lock change together in one UPDATE."""
+        session_id, agent_id = uuid4(), uuid4()
+        session_repo._execute = AsyncMock()
+
+        await session_repo.update_status_and_lock(session_id, SessionStatus.WAITING, agent_id)
+
+        session_repo._execute.assert_called_once()
+        query, params = session_repo._execute.call_args[0]
+        assert "SET status = $1, locked_agent_id = $2" in query
+        assert params == ["waiting", agent_id, session_id]
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, session_repo):
+        """Test no query is sent for an empty batch."""
+        session_repo._fetch_all = AsyncMock()
+
+        assert await session_repo.create_many([]) == []
+        session_repo._fetch_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_agent_sessions_builds_sessions_from_tuples(self, session_repo):
+        """Test sessions are built positionally from tuple rows."""
+        agent_id = uuid4()
+        now = datetime.now(timezone.utc)
+        rows = [
+            (uuid4(), agent_id, uuid4(), "active", None, now, now, None),
+            (uuid4(), uuid4(), agent_id, "ended", agent_id, now, now, now),
+        ]
+        session_repo._fetch_tuples = AsyncMock(return_value=rows)
+
+        sessions = await session_repo.get_agent_sessions(agent_id)
+
+        assert [s.id for s in sessions] == [r[0] for r in rows]
+        assert all(isinstance(s, Session) for s in sessions)
+        assert sessions[1].status == SessionStatus.ENDED
+        assert sessions[1].locked_agent_id == agent_id
+        assert sessions[1].ended_at == now
+
+    @pytest.mark.asyncio
+    async def test_get_agent_sessions_status_filter_shares_statement(self, session_repo):
+        """Test filtered and unfiltered listings bind into the same SQL."""
+        agent_id = uuid4()
+        session_repo._fetch_tuples = AsyncMock(return_value=[])
+
+        await session_repo.get_agent_sessions(agent_id)
+        await session_repo.get_agent_sessions(agent_id, status=SessionStatus.ACTIVE)
+
+        (all_query, all_params), (active_query, active_params) = [
+            c.args for c in session_repo._fetch_tuples.call_args_list
+        ]
+        assert all_query == active_query
+        assert all_params == [agent_id, None]
+        assert active_params == [agent_id, "active"]
+
+    @pytest.mark.asyncio
+    async def test_get_session_with_history(self, session_repo):
+        """Test session and messages come back from one query."""
+        session_id = uuid4()
+        now = datetime.now(timezone.utc)
+        rows = [
+            _session_history_row(
+                session_id,
+                message_id=uuid4(),
+                sender_id=uuid4(),
+                sender_name="alice",
+                message_type="user_defined",
+                content={"text": "hi"},
+                message_created_at=now,
+            ),
+            _session_history_row(
+                session_id,
+                message_id=uuid4(),
+                sender_id=uuid4(),
+                sender_name="bob",
+                message_type="user_defined",
+                content={"text": "hello"},
+                message_created_at=now + timedelta(seconds=1),
+            ),
+        ]
+        session_repo._fetch_all = AsyncMock(return_value=rows)
+
+        result = await session_repo.get_session_with_history(session_id)
+
+        session_repo._fetch_all.assert_called_once()
+        assert isinstance(result["session"], Session)
+        assert result["session"].id == session_id
+        assert result["session"].status == SessionStatus.ACTIVE
+        assert [m["sender_name"] for m in result["messages"]] == ["alice", "bob"]
+        assert result["messages"][0]["id"] == rows[0]["message_id"]
+        assert result["messages"][1]["created_at"] == rows[1]["message_created_at"]
+
+    @pytest.mark.asyncio
+    async def test_get_session_with_history_without_messages(self, session_repo):
+        """Test a session with no messages yields an empty history."""
+        session_id = uuid4()
+        session_repo._fetch_all = AsyncMock(return_value=[_session_history_row(session_id)])
+
+        result = await session_repo.get_session_with_history(session_id)
+
+        assert result["session"].id == session_id
+        assert result["messages"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_conversation_history_keyset_page(self, session_repo):
+        """Test the after cursor and limit are bound into the keyset query."""
+        session_id = uuid4()
+        cursor = (datetime.now(timezone.utc), uuid4())
+        session_repo._fetch_all = AsyncMock(return_value=[])
+
+        assert await session_repo.get_conversation_history(session_id) == []
+        query, params = session_repo._fetch_all.call_args[0]
+        assert "LIMIT $2" in query
+        assert params == [session_id, None]
+
+        await session_repo.get_conversation_history(session_id, after=cursor, limit=50)
+        query, params = session_repo._fetch_all.call_args[0]
+        assert "(m.created_at, m.id) > ($2, $3)" in query
+        assert params == [session_id, cursor[0], cursor[1], 50]
+
+    @pytest.mark.asyncio
+    async def test_iter_conversation_history_streams_rows(self, session_repo):
+        """Test history rows are streamed from a cursor in chunks."""
+        rows = [{"id": uuid4()}, {"id": uuid4()}]
+
+        async def fake_iter_rows(query, params, fetch_number):
+            assert fetch_number == 10
+            for row in rows:
+                yield row
+
+        session_repo._iter_rows = fake_iter_rows
+
+        streamed = [row async for row in session_repo.iter_conversation_history(uuid4(), chunk=10)]
+
+        assert streamed == rows
+
+    @pytest.mark.asyncio
+    async def test_get_session_with_history_not_found(self, session_repo):
+        """Test a missing session returns None."""
+        session_repo._fetch_all = AsyncMock(return_value=[])
+
+        assert await session_repo.get_session_with_history(uuid4()) is None
+
+
+def _db_manager_with_connection(conn):
+    """Build a mock db manager whose connection() yields conn."""
+
+    @asynccontextmanager
+    async def connection():
+        yield conn
+
+    db_manager = MagicMock()
+    db_manager.connection = connection
+    return db_manager
+
+
+class TestBaseRepository:
+    """Test cases for BaseRepository helpers."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_without_params_uses_empty_sequence(self):
+        """Test queries without params pass an empty sequence to the driver."""
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=MagicMock(result=lambda: []))
+        repo = BaseRepository(_db_manager_with_connection(conn))
+
+        assert await repo._fetch_all("SELECT 1") == []
+        conn.execute.assert_called_once_with("SELECT 1", (), prepared=True)
+
+    @pytest.mark.asyncio
+    async def test_prepared_statements_can_be_disabled(self):
+        """Test queries run unprepared when the manager disables prepared statements."""
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=MagicMock(result=lambda: []))
+        db_manager = _db_manager_with_connection(conn)
+        db_manager.prepared_statements = False
+        repo = BaseRepository(db_manager)
+
+        await repo._fetch_all("SELECT 1")
+        conn.execute.assert_called_once_with("SELECT 1", (), prepared=False)
+
+    @pytest.mark.asyncio
+    async def test_fetch_tuples_requests_tuple_rows(self):
+        """Test _fetch_tuples asks the driver for tuple rows."""
+        query_result = MagicMock()
+        query_result.result = MagicMock(return_value=[(1, "a")])
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=query_result)
+        repo = BaseRepository(_db_manager_with_connection(conn))
+
+        assert await repo._fetch_tuples("SELECT n, s", [1]) == [(1, "a")]
+        query_result.result.assert_called_once_with(as_tuple=True)
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_applies_row_factory(self):
+        """Test row_factory is handed to the query result."""
+        rows = [{"n": 1}, {"n": 2}]
+        query_result = MagicMock()
+        query_result.row_factory = lambda factory: [factory(r) for r in rows]
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=query_result)
+        repo = BaseRepository(_db_manager_with_connection(conn))
+
+        results = await repo._fetch_all("SELECT n", [], row_factory=lambda r: r["n"])
+
+        assert results == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_runs_in_transaction(self):
+        """Test _pipeline sends all statements through one transaction."""
+        transaction = MagicMock()
+        transaction.pipeline = AsyncMock(return_value=["r1", "r2"])
+
+        @asynccontextmanager
+        async def begin():
+            yield transaction
+
+        conn = MagicMock()
+        conn.transaction = begin
+        repo = BaseRepository(_db_manager_with_connection(conn))
+
+        results = await repo._pipeline([("UPDATE a", (1,)), ("UPDATE b", (2, 3))])
+
+        assert results == ["r1", "r2"]
+        transaction.pipeline.assert_called_once_with(
+            [("UPDATE a", [1]), ("UPDATE b", [2, 3])], prepared=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_rows_streams_cursor_batches(self):
+        """Test _iter_rows yields rows batch by batch from a cursor."""
+
+        class FakeCursor:
+            def __init__(self, batches):
+                self._batches = iter(batches)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return None
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    rows = next(self._batches)
+                except StopIteration:
+                    raise StopAsyncIteration
+                batch = MagicMock()
+                batch.result.return_value = rows
+                return batch
+
+        transaction = MagicMock()
+        transaction.cursor = MagicMock(return_value=FakeCursor([[{"n": 1}, {"n": 2}], [{"n": 3}]]))
+
+        @asynccontextmanager
+        async def begin():
+            yield transaction
+
+        conn = MagicMock()
+        conn.transaction = begin
+        repo = BaseRepository(_db_manager_with_connection(conn))
+
+        rows = [row async for row in repo._iter_rows("SELECT n", (7,), fetch_number=2)]
+
+        assert rows == [{"n": 1}, {"n": 2}, {"n": 3}]
+        transaction.cursor.assert_called_once_with("SELECT n", (7,), fetch_number=2)